@@ -38,6 +38,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'apps.core.middleware.FullPageCacheMiddleware',  # ПІСЛЯ Csrf/Auth: кеш сторінок для анонімних
 ]
 
 ROOT_URLCONF = 'SpeakUp.urls'
@@ -96,6 +97,15 @@ STATICFILES_DIRS = [
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+# default генерує WebP/AVIF похідні для завантажених зображень (apps.core.image_derivatives)
+STORAGES = {
+    'default': {
+        'BACKEND': 'apps.core.storage.DerivativeMediaStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -147,6 +157,114 @@ GTM_SERVER_CONTAINER_URL = os.getenv('GTM_SERVER_CONTAINER_URL', '')
 GTM_MEASUREMENT_ID = os.getenv('GTM_MEASUREMENT_ID', '')
 GTM_API_SECRET = os.getenv('GTM_API_SECRET', '')
 
+# ========== PERFORMANCE ==========
+
+# Кеш: за замовчуванням local-memory (окремий на кожен процес).
+# Для спільного кешу між воркерами задати CACHE_BACKEND / CACHE_LOCATION,
+# наприклад django.core.cache.backends.redis.RedisCache + redis://...
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'speakup'),
+        'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', ''),
+    }
+}
+
+# Час життя закешованих текстів бігучої стрічки (сек);
+# кеш також скидається сигналами при зміні RunningLineText
+RUNNING_LINE_CACHE_TIMEOUT = int(os.getenv('RUNNING_LINE_CACHE_TIMEOUT', '86400'))
+
+# Максимальний вік in-memory індексу редиректів (сек) для воркерів,
+# які не отримали сигнал про зміну NewsArticle
+REDIRECT_INDEX_TTL = int(os.getenv('REDIRECT_INDEX_TTL', '300'))
+
+# Час життя закешованих секцій головної сторінки (сек); сигнали при зміні
+# контенту в адмінці збільшують версію секції в CACHES. Інвалідація доходить
+# до всіх воркерів лише зі спільним кешем (CACHE_BACKEND=Redis тощо) - тоді
+# можна збільшити до доби; з local-memory кешем інші воркери бачать зміни
+# через цей timeout
+HOMEPAGE_CACHE_TIMEOUT = int(os.getenv('HOMEPAGE_CACHE_TIMEOUT', '300'))
+
+# Redirect logger: розмір черги, батчу та інтервал запису (сек)
+REDIRECT_LOG_QUEUE_SIZE = int(os.getenv('REDIRECT_LOG_QUEUE_SIZE', '10000'))
+REDIRECT_LOG_BATCH_SIZE = int(os.getenv('REDIRECT_LOG_BATCH_SIZE', '500'))
+REDIRECT_LOG_FLUSH_INTERVAL = float(os.getenv('REDIRECT_LOG_FLUSH_INTERVAL', '0.2'))
+
+# SEO URL кеш (canonical/hreflang): розмір LRU для шляхів поза sitemap
+# та максимальний вік precomputed таблиці (сек)
+SEO_URL_CACHE_SIZE = int(os.getenv('SEO_URL_CACHE_SIZE', '2048'))
+SEO_URL_CACHE_TTL = int(os.getenv('SEO_URL_CACHE_TTL', '300'))
+
+# Час життя згенерованого sitemap XML (сек); версія секцій перевіряється
+# на кожен запит, тому зміни статей видно одразу
+SITEMAP_CACHE_TIMEOUT = int(os.getenv('SITEMAP_CACHE_TIMEOUT', '3600'))
+
+# Full-page кеш маркетингових сторінок для анонімних відвідувачів
+# (apps.core.page_cache). FULL_PAGE_CACHE_VERSION відокремлює кеш різних
+# деплоїв при спільному CACHE_BACKEND (на Render - RENDER_GIT_COMMIT)
+FULL_PAGE_CACHE_ENABLED = os.getenv('FULL_PAGE_CACHE_ENABLED', 'True') == 'True'
+FULL_PAGE_CACHE_TIMEOUT = int(os.getenv('FULL_PAGE_CACHE_TIMEOUT', '600'))
+FULL_PAGE_CACHE_VERSION = os.getenv('FULL_PAGE_CACHE_VERSION', os.getenv('RENDER_GIT_COMMIT', ''))
+FULL_PAGE_CACHE_VIEWS = (
+    'core:about',
+    'core:programs_list',
+    'core:program_detail',
+    'core:school_location',
+    'core:city_page',
+    'core:job',
+    'core:shares',
+    # SEO stubs
+    'core:golovna_3_stub',
+    'core:glavnaya_stranicza_stub',
+    'core:summer_camp_2021_stub',
+    'core:sertyfikat_stub',
+    'core:shares_detail_stub',
+    'core:shares_page_stub',
+    'core:programma_loyalnosty_stub',
+    'core:buy_stub',
+    'core:dogovir_stub',
+)
+
+# Похідні зображення для <picture>/srcset (build_image_derivatives):
+# ширини (px) та формати; AVIF генерується лише з AVIF плагіном Pillow
+IMAGE_DERIVATIVE_WIDTHS = tuple(
+    int(width) for width in os.getenv('IMAGE_DERIVATIVE_WIDTHS', '480,960,1440').split(',')
+)
+IMAGE_DERIVATIVE_FORMATS = tuple(os.getenv('IMAGE_DERIVATIVE_FORMATS', 'avif,webp').split(','))
+
+# Правила шляхів до views (apps.core.path_rules, WordPressBlockMiddleware):
+# власні правила перевіряються першими, далі - 410 для WordPress шляхів.
+# Приклад: {'prefix': '/old-blog/', 'action': 'redirect', 'target': '/news/'}
+PATH_RULES = []
+PATH_RULES_BLOCK_WORDPRESS = os.getenv('PATH_RULES_BLOCK_WORDPRESS', 'True') == 'True'
+# Затримка tarpit правил (сек) за замовчуванням
+PATH_RULES_TARPIT_DELAY = float(os.getenv('PATH_RULES_TARPIT_DELAY', '2'))
+
+# Політика хостів (apps.core.host_policy, AllowedHostsMiddleware):
+# HOST_POLICY_ALLOWED_HOSTS (за замовчуванням - ALLOWED_HOSTS) підтримує
+# '.domain' та шаблони з '*'; розмір LRU перевірених за шаблонами хостів
+HOST_POLICY_CACHE_SIZE = int(os.getenv('HOST_POLICY_CACHE_SIZE', '1024'))
+
+# Нотифікації про нові заявки (apps.leads.notifications, send_lead_notifications):
+# email адміністраторам (порожньо - лише лог), Telegram - якщо задані бот і чат
+LEAD_NOTIFICATION_EMAILS = [email.strip() for email in os.getenv('LEAD_NOTIFICATION_EMAILS', '').split(',') if email.strip()]
+TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '')
+TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID', '')
+LEAD_NOTIFICATION_BATCH_SIZE = int(os.getenv('LEAD_NOTIFICATION_BATCH_SIZE', '50'))
+LEAD_NOTIFICATION_MAX_ATTEMPTS = int(os.getenv('LEAD_NOTIFICATION_MAX_ATTEMPTS', '5'))
+# Скільки секунд забрана воркером пачка недоступна іншим воркерам
+LEAD_NOTIFICATION_LEASE = int(os.getenv('LEAD_NOTIFICATION_LEASE', '120'))
+
+# Повторні заявки з того ж номера протягом N хвилин об'єднуються в одну
+# (submission_count + 1); 0 - вимкнути
+LEAD_DEDUP_WINDOW_MINUTES = int(os.getenv('LEAD_DEDUP_WINDOW_MINUTES', '10'))
+
+# Аналітика заявок (LeadDailyStat): період за замовчуванням (днів),
+# кеш звітів (сек) та кількість кампаній у звіті
+LEAD_ANALYTICS_DEFAULT_DAYS = int(os.getenv('LEAD_ANALYTICS_DEFAULT_DAYS', '30'))
+LEAD_ANALYTICS_CACHE_TIMEOUT = int(os.getenv('LEAD_ANALYTICS_CACHE_TIMEOUT', '3600'))
+LEAD_ANALYTICS_TOP_CAMPAIGNS = int(os.getenv('LEAD_ANALYTICS_TOP_CAMPAIGNS', '20'))
+
 # Logging configuration
 # Створити директорію logs якщо вона не існує (для локальної розробки)
 logs_dir = BASE_DIR / 'logs'
@@ -15,6 +15,9 @@ DATABASES = {
     }
 }
 
+# Full-page кеш заважає правкам templates у розробці
+FULL_PAGE_CACHE_ENABLED = os.getenv('FULL_PAGE_CACHE_ENABLED', 'False') == 'True'
+
 # Email backend for development
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
@@ -8,13 +8,15 @@ DEBUG = False
 
 # Allowed hosts - filter out empty strings
 # Fallback to ['*'] if not set (for Render healthcheck and initial deployment)
-# '*' не працює як wildcard в Django, тому middleware обробляє це автоматично
+# Підтримуються '.domain' та шаблони з '*' (наприклад, *.onrender.com):
+# перевіряє AllowedHostsMiddleware (HostPolicy) першим у MIDDLEWARE,
+# тому Django ALLOWED_HOSTS = ['*'] і validate_host не дублює перевірку
 allowed_hosts_env = os.getenv('ALLOWED_HOSTS', '').strip()
 if allowed_hosts_env:
-    ALLOWED_HOSTS = [host.strip() for host in allowed_hosts_env.split(',') if host.strip()]
+    HOST_POLICY_ALLOWED_HOSTS = [host.strip() for host in allowed_hosts_env.split(',') if host.strip()]
 else:
-    # Якщо не встановлено, дозволяємо всі хости через middleware
-    ALLOWED_HOSTS = ['*']  # Middleware обробляє '*' як "дозволити всі"
+    HOST_POLICY_ALLOWED_HOSTS = ['*']
+ALLOWED_HOSTS = ['*']
 
 # CSRF trusted origins - filter out empty strings
 CSRF_TRUSTED_ORIGINS = [
@@ -66,13 +68,22 @@ EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
 # SEO: Canonical domain для robots.txt та інших цілей
 # Повинна бути встановлена в .env або використовується перший ALLOWED_HOST
 CANONICAL_DOMAIN = os.getenv('CANONICAL_DOMAIN', '')
-if not CANONICAL_DOMAIN and ALLOWED_HOSTS and ALLOWED_HOSTS[0] != '*':
-    CANONICAL_DOMAIN = f"https://{ALLOWED_HOSTS[0]}"
+if not CANONICAL_DOMAIN and HOST_POLICY_ALLOWED_HOSTS and HOST_POLICY_ALLOWED_HOSTS[0] != '*':
+    CANONICAL_DOMAIN = f"https://{HOST_POLICY_ALLOWED_HOSTS[0].lstrip('.')}"
 
-# WhiteNoise configuration for static files (БЕЗ кешування)
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedStaticFilesStorage'
+# WhiteNoise configuration for static files
+# Імена з хешем вмісту + manifest + .gz/.br копії (apps.core.storage).
+# Файли з хешем віддаються з max-age=315360000, immutable - новий вміст
+# після деплою отримує нове ім'я, тому кешування не заважає оновленням.
+STORAGES = {
+    **STORAGES,
+    'staticfiles': {
+        'BACKEND': 'apps.core.storage.SpeakUpStaticFilesStorage',
+    },
+}
 WHITENOISE_BROTLI_ENABLED = True
-WHITENOISE_MAX_AGE = 0  # Без кешування
+# Для файлів без хешу (прямі посилання /static/... поза {% static %})
+WHITENOISE_MAX_AGE = int(os.getenv('WHITENOISE_MAX_AGE', '3600'))
 WHITENOISE_MIMETYPES = {
     '.js': 'application/javascript; charset=utf-8',
     '.css': 'text/css; charset=utf-8',
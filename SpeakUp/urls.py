@@ -5,8 +5,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf.urls.i18n import i18n_patterns
 from django.views.generic import TemplateView
-from django.contrib.sitemaps.views import sitemap
-from apps.core.sitemaps import SpeakUpSitemap, NewsSitemap
+from apps.core.sitemaps import SpeakUpSitemap, NewsSitemap, cached_sitemap
 from django.conf import settings
 from django.conf.urls.static import static
 from django.http import HttpResponse
@@ -35,7 +34,8 @@ urlpatterns = [
         template_name='googleeb817bc37494f0e8.html',
         content_type='text/html'
     ), name='google_verification'),
-    path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='sitemap'),
+    path('sitemap.xml', cached_sitemap, {'sitemaps': sitemaps}, name='sitemap'),
+    path('sitemap-<section>.xml', cached_sitemap, {'sitemaps': sitemaps}, name='sitemap_section'),
 ]
 
 # i18n URLs (UK без префіксу, RU з /ru/)
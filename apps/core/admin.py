@@ -1,6 +1,9 @@
 from django.contrib import admin
 from django.utils import timezone
 from django.contrib import messages
+from django.db import transaction
+from .fragment_cache import invalidate_section
+from .testimonial_stats import apply_rating_counts, rating_counts
 from .models import (
     NewsArticle, Achievement, CourseCategory, Course,
     Testimonial, FAQ, ContactInfo, RunningLineText
@@ -114,20 +117,32 @@ class TestimonialAdmin(admin.ModelAdmin):
     text_preview.short_description = 'Текст'
 
     def publish_testimonials(self, request, queryset):
-        updated = queryset.update(
-            is_published=True,
-            moderated_at=timezone.now(),
-            moderated_by=request.user
-        )
+        with transaction.atomic():
+            # Нові опубліковані відгуки - до статистики (update() не надсилає сигнали)
+            newly_published = rating_counts(queryset.filter(is_published=False))
+            updated = queryset.update(
+                is_published=True,
+                moderated_at=timezone.now(),
+                moderated_by=request.user
+            )
+            apply_rating_counts(newly_published, +1)
+        # queryset.update() не надсилає post_save - скидаємо кеш секції вручну
+        invalidate_section('testimonials')
         self.message_user(request, f'{updated} відгуків опубліковано.', messages.SUCCESS)
     publish_testimonials.short_description = 'Опублікувати вибрані відгуки'
 
     def reject_testimonials(self, request, queryset):
-        updated = queryset.update(
-            is_published=False,
-            moderated_at=timezone.now(),
-            moderated_by=request.user
-        )
+        with transaction.atomic():
+            # Зняті з публікації відгуки - зі статистики (update() не надсилає сигнали)
+            unpublished = rating_counts(queryset.filter(is_published=True))
+            updated = queryset.update(
+                is_published=False,
+                moderated_at=timezone.now(),
+                moderated_by=request.user
+            )
+            apply_rating_counts(unpublished, -1)
+        # queryset.update() не надсилає post_save - скидаємо кеш секції вручну
+        invalidate_section('testimonials')
         self.message_user(request, f'{updated} відгуків відхилено.', messages.SUCCESS)
     reject_testimonials.short_description = 'Відхилити вибрані відгуки'
 
@@ -6,7 +6,6 @@ class CoreConfig(AppConfig):
     name = 'apps.core'
     verbose_name = 'Core'
 
-
-
-
-
+    def ready(self):
+        # Реєстрація сигналів інвалідації кешів
+        from . import signals  # noqa: F401
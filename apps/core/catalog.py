@@ -0,0 +1,229 @@
+"""
+Локалізований каталог програм, локацій та міст з seo_config.
+
+Всі дані локалізуються та "заморожуються" один раз на мову при імпорті
+модуля: views лише роблять lookup по slug, без обходу PROGRAMS на кожен запит.
+Словники - MappingProxyType, списки - tuple (незмінні, безпечні для спільного
+використання між запитами і потоками).
+"""
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
+
+from django.conf import settings
+
+from .seo_config import PROGRAMS, LOCATIONS, CITIES
+
+CORPORATE_SLUG = 'corporate'
+
+# Категорії програм (порядок = порядок вкладок на сторінці)
+PROGRAM_CATEGORIES = {
+    'kids': {
+        'title': 'Діти та підлітки',
+        'title_ru': 'Дети и подростки',
+    },
+    'group': {
+        'title': 'Дорослі - Групові та онлайн програми',
+        'title_ru': 'Взрослые - Групповые и онлайн программы',
+    },
+    'individual': {
+        'title': 'Дорослі - Індивідуальні програми',
+        'title_ru': 'Взрослые - Индивидуальные программы',
+    },
+    'professional': {
+        'title': 'Профільні курси',
+        'title_ru': 'Профильные курсы',
+    },
+    'exams': {
+        'title': 'Підготовка до іспитів',
+        'title_ru': 'Подготовка к экзаменам',
+    },
+    'beginners': {
+        'title': 'Для початківців',
+        'title_ru': 'Для начинающих',
+    },
+}
+
+
+class LanguageCatalog(NamedTuple):
+    """Готові до рендеру дані для однієї мови."""
+    programs: Mapping[str, Any]
+    categories: Mapping[str, Any]
+    locations: Mapping[str, Any]
+    cities: Mapping[str, Any]
+
+
+def freeze(value: Any) -> Any:
+    """Рекурсивно робить dict -> MappingProxyType, list -> tuple."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _by_lang(data: dict, lang: str) -> Any:
+    """Вибирає значення {'uk': ..., 'ru': ...} для мови з fallback на uk."""
+    return data.get(lang, data.get('uk', []))
+
+
+def _localize_program(slug: str, program: dict, lang: str) -> dict:
+    return {
+        'slug': slug,
+        'title': program.get(f'title_{lang}', program['title']),
+        'description': program.get(f'description_{lang}', program['description']),
+        'full_content': program.get(f'full_content_{lang}', program.get('full_content', '')),
+        'includes': program.get(f'includes_{lang}', program.get('includes', [])),
+        'benefits': program.get(f'benefits_{lang}', program.get('benefits', [])),
+        'price': program.get('price', {}),
+        'duration': program.get('duration', ''),
+        'badge': program.get('badge'),
+    }
+
+
+def _localize_corporate(program: dict, lang: str) -> dict:
+    """Додаткові блоки сторінки корпоративної програми."""
+    data: dict = {}
+
+    for key in ('schedule', 'course_types', 'pricing_details', 'stages', 'skills'):
+        if program.get(key):
+            data[key] = _by_lang(program[key], lang)
+
+    if program.get('programs'):
+        data['programs'] = {
+            key: {
+                'title': prog.get(f'title_{lang}', prog.get('title_uk', '')),
+                'description': prog.get(f'description_{lang}', prog.get('description_uk', '')),
+                'features': prog.get(f'features_{lang}', prog.get('features_uk', [])),
+                'target': prog.get(f'target_{lang}', prog.get('target_uk', [])),
+                'components': prog.get(f'components_{lang}', prog.get('components_uk', [])),
+                'benefits': prog.get(f'benefits_{lang}', prog.get('benefits_uk', [])),
+            }
+            for key, prog in program['programs'].items()
+        }
+
+    if program.get('why_speak_up'):
+        data['why_speak_up'] = {
+            key: {
+                'title': item.get(f'title_{lang}', item.get('title_uk', '')),
+                'content': item.get(f'content_{lang}', item.get('content_uk', [])),
+            }
+            for key, item in program['why_speak_up'].items()
+        }
+
+    guarantee = program.get('guarantee')
+    if guarantee:
+        data['guarantee'] = {
+            'title': guarantee.get(f'title_{lang}', guarantee.get('title_uk', '')),
+            'content': guarantee.get(f'content_{lang}', guarantee.get('content_uk', [])),
+        }
+
+    if program.get('components'):
+        data['components'] = {
+            key: {
+                'title': comp.get(f'title_{lang}', comp.get('title_uk', '')),
+                'subtitle': comp.get(f'subtitle_{lang}', comp.get('subtitle_uk', '')),
+                'features': comp.get(f'features_{lang}', comp.get('features_uk', [])),
+            }
+            for key, comp in program['components'].items()
+        }
+
+    experience = program.get('experience')
+    if experience:
+        data['experience'] = experience.get(lang, experience.get('uk', ''))
+
+    return data
+
+
+def _build_categories(lang: str) -> dict:
+    categories = {
+        key: {
+            'title': category.get(f'title_{lang}', category['title']),
+            'programs': [],
+        }
+        for key, category in PROGRAM_CATEGORIES.items()
+    }
+
+    for slug, program in PROGRAMS.items():
+        category_key = program.get('category', 'group')
+        if category_key not in categories:
+            category_key = 'group'  # fallback
+
+        categories[category_key]['programs'].append({
+            'slug': slug,
+            'title': program.get(f'title_{lang}', program['title']),
+            'description': program.get(f'description_{lang}', program['description']),
+            'price': program.get('price', {}),
+            'duration': program.get('duration', ''),
+            'badge': program.get('badge'),
+            'includes': program.get(f'includes_{lang}', program.get('includes', [])),
+            'benefits': program.get(f'benefits_{lang}', program.get('benefits', [])),
+            'url': f'/programs/{slug}',
+        })
+
+    return categories
+
+
+def _localize_location(slug: str, location: dict, lang: str) -> dict:
+    return {
+        'slug': slug,
+        'name': location.get(f'name_{lang}', location['name']),
+        'district': location.get(f'district_{lang}', location['district']),
+        'city': location.get(f'city_{lang}', location.get('city', '')),
+        'seo_content': location.get(f'seo_content_{lang}', location.get('seo_content', '')),
+        'why_online': location.get(f'why_online_{lang}', location.get('why_online', [])),
+    }
+
+
+def _localize_city(slug: str, city: dict, lang: str) -> dict:
+    city_name = city.get(f'name_{lang}', city['name'])
+    city_name_ru = city.get('name_ru', city['name'])
+
+    # Локації в цьому місті
+    city_locations = [
+        {
+            'slug': loc_slug,
+            'district': loc_data.get(f'district_{lang}', loc_data.get('district', '')),
+        }
+        for loc_slug, loc_data in LOCATIONS.items()
+        if loc_data.get('city') == city_name or loc_data.get('city_ru') == city_name_ru
+    ]
+
+    return {
+        'slug': slug,
+        'name': city_name,
+        'name_ru': city_name_ru,
+        'seo_content': city.get(f'seo_content_{lang}', city.get('seo_content', '')),
+        'achievements': city.get(f'achievements_{lang}', city.get('achievements', [])),
+        'locations': city_locations,
+    }
+
+
+def build_catalog(lang: str) -> LanguageCatalog:
+    """Будує незмінний каталог для однієї мови."""
+    programs = {}
+    for slug, program in PROGRAMS.items():
+        data = _localize_program(slug, program, lang)
+        if slug == CORPORATE_SLUG:
+            data.update(_localize_corporate(program, lang))
+        programs[slug] = data
+
+    return LanguageCatalog(
+        programs=freeze(programs),
+        categories=freeze(_build_categories(lang)),
+        locations=freeze({
+            slug: _localize_location(slug, location, lang) for slug, location in LOCATIONS.items()
+        }),
+        cities=freeze({
+            slug: _localize_city(slug, city, lang) for slug, city in CITIES.items()
+        }),
+    )
+
+
+CATALOGS = MappingProxyType({
+    lang_code: build_catalog(lang_code) for lang_code, _ in settings.LANGUAGES
+})
+
+
+def get_catalog(lang: str) -> LanguageCatalog:
+    """Каталог для мови (fallback на LANGUAGE_CODE)."""
+    return CATALOGS.get(lang) or CATALOGS[settings.LANGUAGE_CODE]
@@ -1,39 +1,40 @@
+from django.utils.encoding import iri_to_uri
+from django.utils.functional import SimpleLazyObject
 from django.utils.translation import get_language
-from django.urls import translate_url
 from django.conf import settings
 from apps.leads.forms import TrialLessonForm
+from .seo_urls import compute_seo_urls, normalize_path, seo_url_cache
 
 def seo_context(request):
     """
     Додає SEO мета-дані у всі templates.
+
+    canonical/hreflang шляхи беруться з seo_url_cache (translate_url не
+    викликається на кожен запит), тут лише додається scheme://host.
     """
     current_lang = get_language()
 
     # Генерувати canonical URL (нормалізувати trailing slash)
-    path = request.path.rstrip('/') if request.path != '/' else '/'
-    canonical_url = request.build_absolute_uri(path)
+    path = normalize_path(request.path)
+    scheme_host = iri_to_uri(f"{request.scheme}://{request.get_host()}")
+
+    if path.startswith('//'):
+        # Network-path: без кешу, як і раніше через build_absolute_uri
+        seo_urls = compute_seo_urls(path)
+        canonical_url = request.build_absolute_uri(path)
+    else:
+        seo_urls = seo_url_cache.get(current_lang, path)
+        canonical_url = scheme_host + seo_urls.canonical
 
-    # Генерувати hreflang URLs (нормалізувати trailing slash)
-    hreflang_urls = []
-    for lang_code in ['uk', 'ru']:
-        try:
-            translated_path = translate_url(path, lang_code)
-            # Нормалізувати trailing slash
-            translated_path = translated_path.rstrip('/') if translated_path != '/' else '/'
-            hreflang_urls.append({
-                'lang': lang_code,
-                'url': request.build_absolute_uri(translated_path)
-            })
-        except Exception:
-            # Fallback якщо URL не перекладається
-            hreflang_urls.append({
-                'lang': lang_code,
-                'url': canonical_url
-            })
+    # hreflang URLs (вже нормалізовані, fallback на canonical всередині кешу)
+    hreflang_urls = [
+        {'lang': lang_code, 'url': _absolute_url(request, scheme_host, translated_path)}
+        for lang_code, translated_path in seo_urls.alternates
+    ]
 
     # Генерувати абсолютний URL для OG image
     default_og_image_path = getattr(settings, 'DEFAULT_OG_IMAGE', '/static/img/logoBase.png')
-    default_og_image = request.build_absolute_uri(default_og_image_path)
+    default_og_image = _absolute_url(request, scheme_host, iri_to_uri(default_og_image_path))
 
     # Отримати основний домен для robots.txt (заповнено з env або settings)
     canonical_domain = getattr(settings, 'CANONICAL_DOMAIN', '')
@@ -54,6 +55,13 @@ def seo_context(request):
     return result
 
 
+def _absolute_url(request, scheme_host, path):
+    """Абсолютний URL для вже закодованого шляху (як build_absolute_uri)."""
+    if path.startswith('/') and not path.startswith('//'):
+        return scheme_host + path
+    return request.build_absolute_uri(path)
+
+
 def feature_flags(request):
     """Feature flags для A/B тестування."""
     return {
@@ -63,7 +71,10 @@ def feature_flags(request):
 
 
 def forms_context(request):
-    """Додає форми у всі templates (для header та інших компонентів)."""
+    """
+    Додає форми у всі templates (для header та інших компонентів).
+    Форма лінива: створюється лише якщо template її рендерить.
+    """
     return {
-        'trial_form': TrialLessonForm(),
+        'trial_form': SimpleLazyObject(TrialLessonForm),
     }
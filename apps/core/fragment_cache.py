@@ -0,0 +1,70 @@
+"""
+Кешування секцій головної сторінки (template fragment cache).
+
+Кожна секція index.html обгорнута в {% cache %} з ключем по мові та номеру
+версії секції (section_versions). При збереженні/видаленні моделі секції
+сигнал збільшує версію (див. signals.py) - старі фрагменти більше не
+читаються і просто вичерпують HOMEPAGE_CACHE_TIMEOUT.
+
+Версії зберігаються в CACHES, тому інвалідація бачна всім процесам лише зі
+спільним кешем (Redis тощо). З local-memory кешем за замовчуванням кожен
+gunicorn воркер має власні версії й фрагменти: зміна скидає секцію лише в
+процесі, що її зберіг, інші покажуть нові дані після HOMEPAGE_CACHE_TIMEOUT
+(тому за замовчуванням він короткий).
+"""
+import time
+from typing import Dict
+
+from django.core.cache import cache
+
+# Модель (app_label.ModelName) -> секція головної сторінки
+SECTION_MODELS = {
+    'core.Achievement': 'achievements',
+    'core.Advantage': 'advantages',
+    'core.AdvantageItem': 'advantages',
+    'core.Course': 'courses',
+    'core.CourseCategory': 'courses',
+    'core.Testimonial': 'testimonials',
+    'core.FAQ': 'faq',
+}
+
+SECTIONS = tuple(dict.fromkeys(SECTION_MODELS.values()))
+
+VERSION_KEY = 'home_fragments:version:{section}'
+
+
+def fragment_name(section: str) -> str:
+    """Ім'я фрагмента в {% cache %} (наприклад, home_achievements)."""
+    return f'home_{section}'
+
+
+def section_versions() -> Dict[str, int]:
+    """Поточні версії всіх секцій (один cache.get_many на теплий запит)."""
+    keys = {section: VERSION_KEY.format(section=section) for section in SECTIONS}
+    found = cache.get_many(list(keys.values()))
+    versions = {}
+    for section, key in keys.items():
+        version = found.get(key)
+        if version is None:
+            # Не починаємо з 1: після витіснення ключа не підхопимо старий фрагмент
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        versions[section] = version
+    return versions
+
+
+def invalidate_section(section: str) -> None:
+    """Нова версія секції: фрагменти всіх мов перерендеряться."""
+    key = VERSION_KEY.format(section=section)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Ключа версії ще немає (або витіснений)
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def invalidate_model(model) -> None:
+    """Скидає секцію, яка залежить від моделі (якщо така є)."""
+    section = SECTION_MODELS.get(model._meta.label)
+    if section:
+        invalidate_section(section)
@@ -0,0 +1,108 @@
+"""
+Політика дозволених хостів (Host заголовок) для AllowedHostsMiddleware.
+
+Замість додавання кожного нового хоста в settings.ALLOWED_HOSTS (список
+ріс без обмежень під спамом Host заголовками, а validate_host Django
+перебирає його лінійно) - фіксований набір, скомпільований при старті:
+
+- точні хости - set, O(1)
+- '.example.com' - домен і всі піддомени (як у Django)
+- шаблони з '*' ('*.onrender.com', 'speakup-*.example.com') - один regex
+- '*' або порожній список - дозволити всі хости
+
+Результат перевірки шаблонів кешується в обмеженому LRU
+(HOST_POLICY_CACHE_SIZE): пам'ять не росте під скануванням випадковими хостами.
+
+Хости беруться з HOST_POLICY_ALLOWED_HOSTS або, якщо не задано, з ALLOWED_HOSTS.
+Політика будується один раз на процес (get_policy) і скидається лише при
+зміні цих налаштувань (override_settings у тестах).
+"""
+import fnmatch
+import re
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+class HostPolicy:
+    """
+    Перевірка домену (без порту) за фіксованим allowlist.
+
+    Використання:
+        policy = HostPolicy.from_settings()
+        policy.is_allowed('speak-up.com.ua')
+    """
+
+    def __init__(self, allowed_hosts: Iterable[str], cache_size: int = 1024):
+        hosts = [host.strip().lower() for host in allowed_hosts if host and host.strip()]
+        self.allow_all = not hosts or '*' in hosts
+        self.exact = frozenset(host for host in hosts if not host.startswith('.') and '*' not in host)
+
+        patterns = []
+        for host in hosts:
+            if host.startswith('.'):
+                # '.example.com' -> example.com та *.example.com
+                patterns.append(r'(?:' + re.escape(host[1:]) + r'|.+' + re.escape(host) + r')\Z')
+            elif '*' in host and host != '*':
+                patterns.append(fnmatch.translate(host))
+        self._regex = re.compile('|'.join(patterns)) if patterns else None
+        self._match = lru_cache(maxsize=cache_size)(self._match_patterns)
+
+    @classmethod
+    def from_settings(cls) -> 'HostPolicy':
+        hosts = getattr(settings, 'HOST_POLICY_ALLOWED_HOSTS', None)
+        if hosts is None:
+            hosts = settings.ALLOWED_HOSTS
+        return cls(hosts, getattr(settings, 'HOST_POLICY_CACHE_SIZE', 1024))
+
+    def is_allowed(self, domain: str) -> bool:
+        """Чи дозволений домен (у нижньому регістрі, без порту)."""
+        if self.allow_all or domain in self.exact:
+            return True
+        if not domain or self._regex is None:
+            return False
+        return self._match(domain)
+
+    def cache_info(self):
+        return self._match.cache_info()
+
+    def _match_patterns(self, domain: str) -> bool:
+        return self._regex.match(domain) is not None
+
+    def __repr__(self) -> str:
+        mode = 'all' if self.allow_all else f'{len(self.exact)} hosts'
+        return f'<HostPolicy {mode}, patterns={self._regex.pattern if self._regex else None!r}>'
+
+
+POLICY_SETTINGS = ('ALLOWED_HOSTS', 'HOST_POLICY_ALLOWED_HOSTS', 'HOST_POLICY_CACHE_SIZE')
+
+_policy: Optional[HostPolicy] = None
+
+
+def get_policy() -> HostPolicy:
+    """Політика поточного процесу (будується при першому виклику)."""
+    global _policy
+    policy = _policy
+    if policy is None:
+        policy = _policy = HostPolicy.from_settings()
+    return policy
+
+
+@receiver(setting_changed)
+def reset_policy(setting, **kwargs):
+    global _policy
+    if setting in POLICY_SETTINGS:
+        _policy = None
+
+
+def default_host(policy_hosts: Optional[Iterable[str]] = None) -> str:
+    """Перший конкретний хост з allowlist (для команд без запиту), інакше 'localhost'."""
+    if policy_hosts is None:
+        policy_hosts = getattr(settings, 'HOST_POLICY_ALLOWED_HOSTS', None) or settings.ALLOWED_HOSTS
+    for host in policy_hosts:
+        if host and not host.startswith('.') and '*' not in host:
+            return host
+    return 'localhost'
@@ -0,0 +1,252 @@
+"""
+Похідні зображення (WebP/AVIF у кількох ширинах) для <picture>/srcset.
+
+Джерела:
+- static: растрові файли з static/img (генеруються командою
+  build_image_derivatives перед collectstatic)
+- media: NewsArticle.featured_image, Advantage.icon (генеруються
+  DerivativeMediaStorage при завантаженні + тією ж командою)
+
+Похідні лежать у content-addressed директорії derivatives/<hh>/<hash>/
+(hash - sha256 вмісту джерела), тому повторний запуск пропускає вже
+оброблені файли, а зміна зображення дає нові URL без інвалідації кешу.
+
+manifest.json у кожному сховищі:
+    {"static:img/speak_man.png": {"hash": "...", "width": 1080, "height": 1350,
+                                  "variants": {"webp": [[480, "derivatives/.../480.webp"], ...]}}}
+Template tag {% picture %} читає лише manifest і не відкриває зображення.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from io import BytesIO
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, Storage, default_storage
+from django.templatetags.static import static
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVES_DIR = 'derivatives'
+MANIFEST_NAME = f'{DERIVATIVES_DIR}/manifest.json'
+STATIC_PREFIX = 'static:'
+MEDIA_PREFIX = 'media:'
+SOURCE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+
+MIME_TYPES = {
+    'avif': 'image/avif',
+    'webp': 'image/webp',
+}
+
+# Параметри кодування для кожного формату
+SAVE_OPTIONS = {
+    'avif': {'quality': 55},
+    'webp': {'quality': 80, 'method': 6},
+}
+
+_lock = threading.Lock()
+# {сховище: (mtime manifest, дані)}
+_manifests: Dict[str, Tuple[float, dict]] = {}
+
+
+def widths() -> Tuple[int, ...]:
+    return tuple(sorted(getattr(settings, 'IMAGE_DERIVATIVE_WIDTHS', (480, 960, 1440))))
+
+
+def available_formats() -> Tuple[str, ...]:
+    """Формати з IMAGE_DERIVATIVE_FORMATS, для яких у Pillow є encoder (AVIF - плагін)."""
+    Image.init()
+    return tuple(
+        fmt for fmt in getattr(settings, 'IMAGE_DERIVATIVE_FORMATS', ('avif', 'webp'))
+        if fmt.upper() in Image.SAVE
+    )
+
+
+def static_storage() -> FileSystemStorage:
+    """Сховище похідних static зображень (перша директорія STATICFILES_DIRS)."""
+    return FileSystemStorage(location=str(settings.STATICFILES_DIRS[0]))
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:20]
+
+
+def target_widths(original_width: int) -> List[int]:
+    """Ширини похідних: з налаштувань менші за оригінал + сам оригінал (не більше максимуму)."""
+    configured = widths()
+    result = [width for width in configured if width < original_width]
+    largest = min(original_width, configured[-1]) if configured else original_width
+    if largest not in result:
+        result.append(largest)
+    return result
+
+
+def _encode(image: Image.Image, fmt: str, width: int) -> bytes:
+    if width < image.width:
+        height = round(image.height * width / image.width)
+        image = image.resize((width, height), Image.LANCZOS)
+    buffer = BytesIO()
+    image.save(buffer, fmt.upper(), **SAVE_OPTIONS.get(fmt, {}))
+    return buffer.getvalue()
+
+
+def build_entry(data: bytes, storage: Storage, force: bool = False) -> dict:
+    """
+    Генерує похідні для вмісту data у storage (пропускає існуючі файли,
+    якщо не force) та повертає запис manifest.
+    """
+    digest = content_hash(data)
+    directory = f'{DERIVATIVES_DIR}/{digest[:2]}/{digest}'
+    with Image.open(BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+        entry = {'hash': digest, 'width': image.width, 'height': image.height, 'variants': {}}
+        for fmt in available_formats():
+            variants = []
+            for width in target_widths(image.width):
+                name = f'{directory}/{width}.{fmt}'
+                if force or not storage.exists(name):
+                    if storage.exists(name):
+                        storage.delete(name)
+                    storage.save(name, ContentFile(_encode(image, fmt, width)))
+                variants.append([width, name])
+            entry['variants'][fmt] = variants
+    return entry
+
+
+def _manifest_key(storage: Storage) -> str:
+    return getattr(storage, 'location', '') or repr(storage)
+
+
+def load_manifest(storage: Storage) -> dict:
+    """manifest.json сховища (process-local, перечитується при зміні файлу)."""
+    key = _manifest_key(storage)
+    try:
+        mtime = storage.get_modified_time(MANIFEST_NAME).timestamp()
+    except (FileNotFoundError, OSError, NotImplementedError):
+        return {}
+    cached = _manifests.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    try:
+        with storage.open(MANIFEST_NAME) as f:
+            data = json.loads(f.read())
+    except (OSError, ValueError):
+        logger.exception('Cannot read image derivatives manifest')
+        data = {}
+    _manifests[key] = (mtime, data)
+    return data
+
+
+def update_manifest(storage: Storage, entries: Dict[str, Optional[dict]]) -> None:
+    """Додає/замінює записи manifest (None - видалити запис)."""
+    with _lock:
+        manifest = dict(load_manifest(storage))
+        for source_key, entry in entries.items():
+            if entry is None:
+                manifest.pop(source_key, None)
+            else:
+                manifest[source_key] = entry
+        content = json.dumps(manifest, ensure_ascii=False, sort_keys=True, indent=1)
+        if storage.exists(MANIFEST_NAME):
+            storage.delete(MANIFEST_NAME)
+        storage.save(MANIFEST_NAME, ContentFile(content.encode()))
+        _manifests[_manifest_key(storage)] = (
+            storage.get_modified_time(MANIFEST_NAME).timestamp(), manifest,
+        )
+
+
+def is_source(name: str) -> bool:
+    return name.lower().endswith(SOURCE_EXTENSIONS) and not name.startswith(f'{DERIVATIVES_DIR}/')
+
+
+def static_sources(directory: str = 'img') -> Iterable[str]:
+    """Растрові файли static/<directory> (шляхи відносно static/)."""
+    root = os.path.join(str(settings.STATICFILES_DIRS[0]), directory)
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in sorted(filenames):
+            name = os.path.relpath(os.path.join(dirpath, filename), str(settings.STATICFILES_DIRS[0]))
+            name = name.replace(os.sep, '/')
+            if is_source(name):
+                yield name
+
+
+def media_sources() -> Iterable[str]:
+    """Завантажені зображення моделей (імена у default_storage)."""
+    from .models import Advantage, NewsArticle
+
+    for model, field in ((NewsArticle, 'featured_image'), (Advantage, 'icon')):
+        names = model.objects.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True})
+        yield from names.values_list(field, flat=True).distinct()
+
+
+def source_key(source) -> Tuple[str, Storage, str]:
+    """(ключ manifest, сховище похідних, ім'я) для static шляху або FieldFile."""
+    name = getattr(source, 'name', None)
+    if name is not None and hasattr(source, 'storage'):
+        return MEDIA_PREFIX + name, source.storage, name
+    return STATIC_PREFIX + str(source), static_storage(), str(source)
+
+
+def lookup(source) -> Optional[dict]:
+    """Запис manifest для джерела (None - похідних немає)."""
+    if not source:
+        return None
+    key, storage, _name = source_key(source)
+    return load_manifest(storage).get(key)
+
+
+def variant_url(source, name: str) -> str:
+    """URL похідної: static через {% static %} (manifest з хешем), media - storage.url()."""
+    key, storage, _name = source_key(source)
+    if key.startswith(STATIC_PREFIX):
+        return static(name)
+    return storage.url(name)
+
+
+def original_url(source) -> str:
+    key, storage, name = source_key(source)
+    if key.startswith(STATIC_PREFIX):
+        return static(name)
+    return storage.url(name)
+
+
+def srcsets(source) -> List[Tuple[str, str]]:
+    """[(mime type, srcset), ...] у порядку пріоритету форматів."""
+    entry = lookup(source)
+    if not entry:
+        return []
+    result = []
+    for fmt, variants in entry['variants'].items():
+        if fmt in MIME_TYPES and variants:
+            srcset = ', '.join(f'{variant_url(source, name)} {width}w' for width, name in variants)
+            result.append((MIME_TYPES[fmt], srcset))
+    result.sort(key=lambda item: list(MIME_TYPES.values()).index(item[0]))
+    return result
+
+
+def best_url(source, width: int, fmt: str = 'webp') -> str:
+    """URL найменшої похідної формату fmt не вужчої за width (або оригінал)."""
+    entry = lookup(source)
+    variants = entry['variants'].get(fmt) if entry else None
+    if not variants:
+        return original_url(source)
+    for variant_width, name in variants:
+        if variant_width >= width:
+            return variant_url(source, name)
+    return variant_url(source, variants[-1][1])
+
+
+def process_media(name: str, storage: Storage = None, force: bool = False) -> Optional[dict]:
+    """Генерує похідні для завантаженого файлу та оновлює media manifest."""
+    storage = storage or default_storage
+    with storage.open(name) as f:
+        entry = build_entry(f.read(), storage, force=force)
+    update_manifest(storage, {MEDIA_PREFIX + name: entry})
+    return entry
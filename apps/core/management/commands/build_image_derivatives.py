@@ -0,0 +1,71 @@
+"""
+Django management команда для генерації WebP/AVIF похідних зображень.
+Запускається при збірці перед collectstatic (build.sh) та після масового
+імпорту media. Вже згенеровані похідні (той самий вміст) пропускаються.
+Використання:
+    python manage.py build_image_derivatives
+    python manage.py build_image_derivatives --static-only
+    python manage.py build_image_derivatives --media-only --force
+"""
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+
+from apps.core import image_derivatives
+
+
+class Command(BaseCommand):
+    help = 'Генерує WebP/AVIF похідні зображень static/img та media для <picture>/srcset'
+
+    def add_arguments(self, parser):
+        group = parser.add_mutually_exclusive_group()
+        group.add_argument('--static-only', action='store_true', help='Лише static/img')
+        group.add_argument('--media-only', action='store_true', help='Лише завантажені media')
+        parser.add_argument('--force', action='store_true', help='Перегенерувати існуючі похідні')
+
+    def handle(self, *args, **options):
+        formats = image_derivatives.available_formats()
+        if not formats:
+            self.stdout.write(self.style.WARNING('Немає доступних форматів (IMAGE_DERIVATIVE_FORMATS)'))
+            return
+        self.stdout.write(f'Формати: {", ".join(formats)}; ширини: {image_derivatives.widths()}')
+
+        if not options['media_only']:
+            storage = image_derivatives.static_storage()
+            self._build(
+                storage,
+                image_derivatives.static_sources(),
+                image_derivatives.STATIC_PREFIX,
+                lambda name: open(storage.path(name), 'rb'),
+                options['force'],
+            )
+        if not options['static_only']:
+            self._build(
+                default_storage,
+                image_derivatives.media_sources(),
+                image_derivatives.MEDIA_PREFIX,
+                default_storage.open,
+                options['force'],
+            )
+
+    def _build(self, storage, names, prefix, opener, force):
+        entries = {}
+        seen = set()
+        errors = 0
+        for name in names:
+            seen.add(prefix + name)
+            try:
+                with opener(name) as f:
+                    entries[prefix + name] = image_derivatives.build_entry(f.read(), storage, force=force)
+            except Exception as e:
+                errors += 1
+                self.stdout.write(self.style.ERROR(f'  {name}: {e}'))
+                continue
+            self.stdout.write(f'  {name}')
+
+        # Записи джерел, яких більше немає, видаляються з manifest
+        stale = {key: None for key in image_derivatives.load_manifest(storage) if key not in seen}
+        image_derivatives.update_manifest(storage, {**stale, **entries})
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Готово ({prefix[:-1]})! Оброблено: {len(entries)}, помилок: {errors}')
+        )
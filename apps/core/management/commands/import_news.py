@@ -0,0 +1,78 @@
+"""
+Django management команда для імпорту news статей зі старого сайту.
+Паралельне завантаження сторінок та зображень, запис пачками, checkpoint
+для продовження перерваного імпорту (apps.core.news_import).
+Використання:
+    python manage.py import_news
+    python manage.py import_news --urls-file scripts/all_news_urls.txt --workers 8
+    python manage.py import_news --on-conflict suffix --reset
+"""
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.core.models import NewsArticle
+from apps.core.news_import import (
+    CONFLICT_POLICIES,
+    CONFLICT_SKIP,
+    DEFAULT_BASE_URL,
+    Checkpoint,
+    NewsImporter,
+    load_url_list,
+)
+
+DEFAULT_URLS_FILE = Path(settings.BASE_DIR) / 'scripts' / 'all_news_urls.txt'
+DEFAULT_CHECKPOINT = Path(settings.BASE_DIR) / 'scripts' / 'import_news_checkpoint.json'
+
+
+class Command(BaseCommand):
+    help = 'Імпортує news статті зі старого WordPress сайту (паралельно, з checkpoint)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--urls-file',
+            type=Path,
+            default=DEFAULT_URLS_FILE,
+            help='Файл зі шляхами статей /news/<slug>/ (без файлу - вбудований список)',
+        )
+        parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help='Адреса старого сайту')
+        parser.add_argument('--workers', type=int, default=4, help='Кількість паралельних запитів')
+        parser.add_argument('--batch-size', type=int, default=20, help='Статей в одній транзакції')
+        parser.add_argument(
+            '--on-conflict',
+            choices=CONFLICT_POLICIES,
+            default=CONFLICT_SKIP,
+            help='Slug збігається з містом/програмою/локацією: пропустити, додати -news або імпортувати',
+        )
+        parser.add_argument('--checkpoint', type=Path, default=DEFAULT_CHECKPOINT, help='Файл стану імпорту')
+        parser.add_argument('--reset', action='store_true', help='Почати з початку (видалити checkpoint)')
+
+    def handle(self, *args, **options):
+        checkpoint_path = options['checkpoint']
+        if options['reset'] and checkpoint_path.exists():
+            checkpoint_path.unlink()
+
+        urls = load_url_list(options['urls_file'])
+        self.stdout.write(f'🚀 Імпорт {len(urls)} статей з {options["base_url"]}')
+
+        importer = NewsImporter(
+            base_url=options['base_url'],
+            checkpoint=Checkpoint(checkpoint_path),
+            conflict_policy=options['on_conflict'],
+            workers=options['workers'],
+            batch_size=options['batch_size'],
+            log=self.stdout.write,
+        )
+        stats = importer.run(urls)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ Імпорт завершено! Імпортовано: {stats.imported}, пропущено: {stats.skipped}, '
+                f'конфліктів: {stats.conflicts}, помилок: {stats.failed}'
+            )
+        )
+        self.stdout.write(
+            f'   Сторінок: {stats.pages_fetched}, зображень завантажено: {stats.images_downloaded}, '
+            f'з checkpoint: {stats.images_reused}, всього статей в базі: {NewsArticle.objects.count()}'
+        )
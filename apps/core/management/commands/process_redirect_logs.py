@@ -1,113 +1,132 @@
 """
 Management command для обробки redirect logs і відправки в GTM.
+
+Лог спочатку атомарно переноситься в logs/processed/ (воркери одразу
+починають новий redirects.log), потім читається потоково і відправляється
+батчами паралельно через GTMBatchSender. Невдалі події потрапляють у
+logs/redirects_dead_letter.log і можуть бути повторно відправлені через
+--replay-dead-letter.
 """
 import json
-import requests
+import os
 import time
 from pathlib import Path
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from apps.core.utils.gtm_sender import GTMBatchSender, MAX_EVENTS_PER_REQUEST
 
 
 class Command(BaseCommand):
     help = 'Обробляє redirect logs і відправляє в GTM'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='Кількість паралельних відправників (default: 8)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=MAX_EVENTS_PER_REQUEST,
+            help=f'Подій в одному запиті, максимум {MAX_EVENTS_PER_REQUEST}',
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=20.0,
+            help='Максимум запитів на секунду (token bucket), 0 - без обмеження',
+        )
+        parser.add_argument(
+            '--max-retries',
+            type=int,
+            default=3,
+            help='Кількість повторів для 429/5xx/timeout (default: 3)',
+        )
+        parser.add_argument(
+            '--replay-dead-letter',
+            action='store_true',
+            help='Повторно відправити події з redirects_dead_letter.log',
+        )
+
     def handle(self, *args, **options):
-        log_file = Path(settings.BASE_DIR) / 'logs' / 'redirects.log'
-        processed_dir = Path(settings.BASE_DIR) / 'logs' / 'processed'
+        logs_dir = Path(settings.BASE_DIR) / 'logs'
+        log_file = logs_dir / 'redirects.log'
+        processed_dir = logs_dir / 'processed'
+        dead_letter_file = logs_dir / 'redirects_dead_letter.log'
 
         # Створюємо папку для оброблених логів
-        processed_dir.mkdir(exist_ok=True)
+        processed_dir.mkdir(parents=True, exist_ok=True)
 
-        if not log_file.exists():
+        source = dead_letter_file if options['replay_dead_letter'] else log_file
+        if not source.exists():
             self.stdout.write('No redirects to process')
             return
 
-        # Читаємо лог
+        # Атомарно забираємо лог: нові записи підуть у новий файл
         try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            processed_file = self._archive_path(processed_dir, source.stem)
+            os.replace(source, processed_file)
         except Exception as e:
             self.stderr.write(f'Error reading log file: {e}')
             return
 
-        if not lines:
+        if processed_file.stat().st_size == 0:
+            processed_file.unlink()
             self.stdout.write('Log file is empty')
             return
 
-        # Відправляємо в GTM (можна батчами)
-        success_count = 0
-        error_count = 0
-
-        for line in lines:
-            try:
-                data = json.loads(line.strip())
-                if self._send_to_gtm(data):
-                    success_count += 1
-                else:
-                    error_count += 1
-                time.sleep(0.05)  # Rate limiting
-            except json.JSONDecodeError as e:
-                self.stderr.write(f'Invalid JSON in log: {e}')
-                error_count += 1
-            except Exception as e:
-                self.stderr.write(f'Error processing redirect: {e}')
-                error_count += 1
-
-        # Архівуємо оброблені логи
-        try:
-            timestamp = time.strftime('%Y%m%d_%H%M%S')
-            processed_file = processed_dir / f'redirects_{timestamp}.log'
-
-            with open(processed_file, 'w', encoding='utf-8') as f:
-                f.writelines(lines)
-
-            # Очищаємо основний лог
-            log_file.unlink()
-
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f'Processed {len(lines)} redirects '
-                    f'(Success: {success_count}, Errors: {error_count})'
-                )
-            )
-        except Exception as e:
-            self.stderr.write(f'Error archiving logs: {e}')
+        counters = {'lines': 0, 'invalid': 0}
+        records = self._read_records(processed_file, counters)
 
-    def _send_to_gtm(self, data: dict) -> bool:
-        """
-        Відправляє event в GTM.
-        Returns: True if successful, False otherwise
-        """
         if not getattr(settings, 'GTM_SERVER_CONTAINER_URL', ''):
-            return False
-
-        try:
-            # GA4 Measurement Protocol
-            payload = {
-                'client_id': 'server_side',
-                'events': [{
-                    'name': 'page_view',
-                    'params': {
-                        'page_location': data.get('old_url', ''),
-                        'redirect_to': data.get('new_url', ''),
-                        'redirect_type': data.get('redirect_type', 'unknown'),
-                    }
-                }]
-            }
-
-            response = requests.post(
-                f'{settings.GTM_SERVER_CONTAINER_URL}/g/collect',
-                params={
-                    'measurement_id': getattr(settings, 'GTM_MEASUREMENT_ID', ''),
-                    'api_secret': getattr(settings, 'GTM_API_SECRET', ''),
-                },
-                json=payload,
-                timeout=5
+            # Нема куди відправляти - лише рахуємо записи (лог залишається в архіві)
+            skipped = sum(1 for _ in records)
+            success_count, error_count = 0, skipped + counters['invalid']
+        else:
+            sender = GTMBatchSender(
+                container_url=settings.GTM_SERVER_CONTAINER_URL,
+                measurement_id=getattr(settings, 'GTM_MEASUREMENT_ID', ''),
+                api_secret=getattr(settings, 'GTM_API_SECRET', ''),
+                dead_letter_file=dead_letter_file,
+                workers=options['workers'],
+                batch_size=options['batch_size'],
+                rate=options['rate'],
+                max_retries=options['max_retries'],
             )
-
-            return response.status_code in [200, 204]
-        except requests.Timeout:
-            return False
-        except Exception as e:
-            return False
+            stats = sender.send(records)
+            success_count, error_count = stats.sent, stats.failed + counters['invalid']
+            if stats.failed:
+                self.stderr.write(f'{stats.failed} events written to {dead_letter_file}')
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Processed {counters["lines"]} redirects '
+                f'(Success: {success_count}, Errors: {error_count})'
+            )
+        )
+
+    def _read_records(self, path: Path, counters: dict):
+        """Потоково читає JSON записи з лог файлу."""
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                counters['lines'] += 1
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    self.stderr.write(f'Invalid JSON in log: {e}')
+                    counters['invalid'] += 1
+
+    def _archive_path(self, processed_dir: Path, stem: str) -> Path:
+        """Унікальне ім'я архіву (кілька запусків в одну секунду не перезаписують одне одного)."""
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        processed_file = processed_dir / f'{stem}_{timestamp}.log'
+        suffix = 1
+        while processed_file.exists():
+            processed_file = processed_dir / f'{stem}_{timestamp}_{suffix}.log'
+            suffix += 1
+        return processed_file
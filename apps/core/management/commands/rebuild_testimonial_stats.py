@@ -0,0 +1,28 @@
+"""
+Django management команда для повного перерахунку статистики відгуків.
+Потрібна після масових змін в обхід сигналів (queryset.update(), SQL, імпорт).
+Після commit скидає закешовану секцію відгуків головної сторінки.
+Використання: python manage.py rebuild_testimonial_stats
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.core.fragment_cache import invalidate_section
+from apps.core.testimonial_stats import rebuild
+
+
+class Command(BaseCommand):
+    help = 'Перераховує статистику опублікованих відгуків (TestimonialStats) з нуля'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            stats = rebuild()
+            # Фрагмент з розподілом оцінок - лише після commit нових значень
+            transaction.on_commit(lambda: invalidate_section('testimonials'))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Готово! Відгуків: {stats.count}, середній рейтинг: {stats.avg_rating}/5'
+            )
+        )
+        for star, count, percent in stats.distribution:
+            self.stdout.write(f'  {star}★: {count} ({percent}%)')
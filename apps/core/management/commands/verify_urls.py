@@ -0,0 +1,95 @@
+"""
+Django management команда для перевірки старих URL (200 або правильний 301).
+Паралельні HEAD запити до сервера або --in-process через django.test.Client
+(без сервера, для CI). Детальніше: apps.core.url_verifier.
+Використання:
+    python manage.py verify_urls --url-file scripts/all_news_urls.txt --base-url https://speak-up.com.ua
+    python manage.py verify_urls --in-process --include-redirects --include-news --json results.json
+"""
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.host_policy import default_host
+from apps.core.url_verifier import (
+    ClientTransport,
+    HttpTransport,
+    REDIRECT_WRONG,
+    MISSING_REDIRECT,
+    URLVerifier,
+    load_paths,
+)
+
+
+class Command(BaseCommand):
+    help = 'Перевіряє, що старі URL відповідають 200 або редиректять на правильні нові адреси'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url-file', action='append', default=[], help='Файл з URL (один на рядок)')
+        parser.add_argument('--include-redirects', action='store_true', help='Перевірити всі ключі REDIRECTS')
+        parser.add_argument('--include-news', action='store_true', help='Перевірити old_url_uk/old_url_ru статей')
+        parser.add_argument('--base-url', default=os.environ.get('VERIFY_BASE_URL', 'http://localhost:8000'), help='Сервер для перевірки')
+        parser.add_argument('--in-process', action='store_true', help='Без сервера: django.test.Client')
+        parser.add_argument('--host', default=None, help='Host для --in-process (за замовчуванням з ALLOWED_HOSTS)')
+        parser.add_argument('--concurrency', type=int, default=8, help='Паралельних запитів до сервера')
+        parser.add_argument('--timeout', type=float, default=10.0, help='Таймаут запиту (сек)')
+        parser.add_argument('--max-redirects', type=int, default=10, help='Максимальна довжина ланцюжка')
+        parser.add_argument('--json', dest='json_file', help='Зберегти результати в JSON')
+        parser.add_argument('--csv', dest='csv_file', help='Зберегти результати в CSV')
+        parser.add_argument('--quiet', action='store_true', help='Виводити лише проблемні URL')
+
+    def handle(self, *args, **options):
+        paths = load_paths(options['url_file'], options['include_redirects'], options['include_news'])
+        if not paths:
+            raise CommandError('Немає URL: вкажіть --url-file, --include-redirects або --include-news')
+
+        if options['in_process']:
+            transport = ClientTransport(options['host'] or default_host())
+            target = f'in-process ({transport.base_url})'
+        else:
+            transport = HttpTransport(options['base_url'], options['concurrency'], options['timeout'])
+            target = f'{transport.base_url}, {transport.concurrency} потоків'
+        self.stdout.write(f'Перевірка {len(paths)} URL: {target}\n')
+
+        report = URLVerifier(transport, options['max_redirects']).verify(paths)
+
+        for i, result in enumerate(report.results, 1):
+            if result.ok and options['quiet']:
+                continue
+            mark = '✓' if result.ok else '✗'
+            self.stdout.write(f'[{i}/{len(paths)}] {mark} {result.path:50} {result.message}')
+
+        self.print_summary(report)
+
+        if options['json_file']:
+            report.write_json(options['json_file'])
+            self.stdout.write(f'Результати збережено в {options["json_file"]}')
+        if options['csv_file']:
+            report.write_csv(options['csv_file'])
+            self.stdout.write(f'Результати збережено в {options["csv_file"]}')
+
+        if not report.ok:
+            raise CommandError('ЗНАЙДЕНО ПРОБЛЕМИ! Потрібно виправити перед міграцією.')
+        self.stdout.write(self.style.SUCCESS('✅ ВСІ URL ПРАЦЮЮТЬ КОРЕКТНО!'))
+
+    def print_summary(self, report):
+        counts = report.counts()
+        self.stdout.write('\n' + '=' * 80)
+        self.stdout.write('ПІДСУМОК ПЕРЕВІРКИ')
+        self.stdout.write('=' * 80)
+        self.stdout.write(f'\nВсього перевірено: {len(report.results)}')
+        self.stdout.write(f'✓ Успішних (200): {counts["success"]}')
+        self.stdout.write(f'✓ Редиректів OK (301): {counts["redirect_ok"]}')
+        self.stdout.write(f'✗ Редиректів невірних: {counts["redirect_wrong"]}')
+        self.stdout.write(f'✗ Відсутніх редиректів: {counts["missing_redirect"]}')
+        self.stdout.write(f'✗ Помилок: {counts["errors"]}')
+        self.stdout.write(f'\nУспішність: {report.success_rate():.1f}%')
+
+        problems = report.problems()
+        if problems:
+            self.stdout.write('\nПРОБЛЕМИ:')
+            for result in problems:
+                self.stdout.write(f'  {result.path}: {result.message}')
+                if result.chain and result.category not in (REDIRECT_WRONG, MISSING_REDIRECT):
+                    self.stdout.write(f'    Ланцюжок: {" -> ".join(result.chain)}')
+        self.stdout.write('\n' + '=' * 80)
@@ -3,43 +3,47 @@ Middleware для обробки 301 редиректів зі старих URL.
 """
 from django.shortcuts import redirect
 from django.http import Http404, HttpResponse, HttpResponseBadRequest
-from django.conf import settings
-from .models import NewsArticle
-from .redirects import REDIRECTS
+from django.core.exceptions import DisallowedHost
+from django.http.request import split_domain_port
+from django.utils.translation import get_language
+from . import page_cache, path_rules
+from .host_policy import get_policy
+from .redirect_index import redirect_index
 from .utils.redirect_logger import redirect_logger
 
 
+def is_render_healthcheck(request) -> bool:
+    """Чи це healthcheck запит від Render (до / або /healthz)."""
+    user_agent = request.META.get('HTTP_USER_AGENT', '')
+    from_render = (
+        user_agent.startswith('Render/') or
+        user_agent.startswith('Go-http-client/') or
+        request.META.get('REMOTE_ADDR', '').startswith('10.228.')
+    )
+    return from_render and request.path in ('/', '/healthz')
+
+
 class AllowedHostsMiddleware:
     """
-    Middleware для обробки ALLOWED_HOSTS.
-    Автоматично дозволяє всі хости, якщо ALLOWED_HOSTS не налаштований або містить '*'.
+    Middleware для перевірки Host заголовка ДО SecurityMiddleware.
+
+    Allowlist (точні хости, '.domain', шаблони з '*', '*' - всі) компілюється
+    один раз на процес у HostPolicy (apps.core.host_policy.get_policy); settings.ALLOWED_HOSTS
+    більше не змінюється під час запитів. Недозволений хост -> DisallowedHost (400).
+    Healthcheck від Render пропускається до HealthCheckMiddleware.
     """
     def __init__(self, get_response):
         self.get_response = get_response
-
-    def process_request(self, request):
-        """
-        process_request викликається ДО SecurityMiddleware.process_request,
-        що дозволяє нам модифікувати ALLOWED_HOSTS перед перевіркою.
-        """
-        allowed_hosts = getattr(settings, 'ALLOWED_HOSTS', [])
-
-        # Якщо ALLOWED_HOSTS порожній або містить '*', дозволяємо всі хости
-        allow_all = not allowed_hosts or '*' in allowed_hosts
-
-        if allow_all:
-            try:
-                host = request.get_host().split(':')[0]  # Без порту
-                # Додаємо хост до ALLOWED_HOSTS динамічно
-                if host not in settings.ALLOWED_HOSTS:
-                    settings.ALLOWED_HOSTS.append(host)
-            except Exception:
-                # Якщо не можемо отримати хост, не блокуємо запит
-                pass
-
-        return None  # None означає "продовжити обробку"
+        get_policy()
 
     def __call__(self, request):
+        policy = get_policy()
+        if not policy.allow_all:
+            host = request._get_raw_host()
+            domain, _port = split_domain_port(host)
+            if not policy.is_allowed(domain) and not is_render_healthcheck(request):
+                raise DisallowedHost(f'Invalid HTTP_HOST header: {host!r}.')
+
         response = self.get_response(request)
         return response
 
@@ -53,18 +57,8 @@ class HealthCheckMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
-        path = request.path
-        user_agent = request.META.get('HTTP_USER_AGENT', '')
-
-        # Перевірка чи це healthcheck від Render
-        is_render_healthcheck = (
-            user_agent.startswith('Render/') or
-            user_agent.startswith('Go-http-client/') or
-            request.META.get('REMOTE_ADDR', '').startswith('10.228.')
-        )
-
         # Обробка healthcheck запитів
-        if is_render_healthcheck and (path == '/' or path == '/healthz'):
+        if is_render_healthcheck(request):
             return HttpResponse('OK', content_type='text/plain', status=200)
 
         response = self.get_response(request)
@@ -113,72 +107,31 @@ class NewsRedirectMiddleware:
     """
     Middleware для автоматичних 301 редиректів зі старих news URL та інших старих URL.
     Обробляє trailing slashes автоматично.
+
+    Використовує in-memory redirect_index: один dict lookup, без SQL на запит.
     """
     def __init__(self, get_response):
         self.get_response = get_response
+        # Будуємо індекс при старті воркера
+        redirect_index.warm()
 
     def __call__(self, request):
         path = request.path
-        # Нормалізуємо шлях для перевірки (без trailing slash, крім кореня)
-        path_normalized = path.rstrip('/') if path != '/' else '/'
-
-        # Перевірка статичних редиректів (спочатку точне співпадіння)
-        if path in REDIRECTS:
-            new_url = REDIRECTS[path]
-
-            # ✅ Логування НЕ блокує (< 1ms)
-            redirect_logger.log_redirect(
-                request=request,
-                old_url=path,
-                new_url=new_url,
-                redirect_type='static'
-            )
-
-            return redirect(new_url, permanent=True)
-
-        # Перевірка нормалізованого шляху (для обробки trailing slash)
-        if path_normalized in REDIRECTS and path_normalized != path:
-            new_url = REDIRECTS[path_normalized]
-
-            # ✅ Логування НЕ блокує (< 1ms)
-            redirect_logger.log_redirect(
-                request=request,
-                old_url=path,
-                new_url=new_url,
-                redirect_type='static'
-            )
-
-            return redirect(new_url, permanent=True)
-
-        # Перевірка чи це старий news URL
-        # Перевіряємо обидва варіанти (з trailing slash та без)
-        news_paths_to_check = [path, path_normalized] if path != path_normalized else [path]
-
-        for check_path in news_paths_to_check:
-            if check_path.startswith('/news/') and check_path != '/news/':
-                # Шукаємо статтю за old_url_uk або old_url_ru
-                article = NewsArticle.objects.filter(
-                    old_url_uk=check_path
-                ).first()
-
-                if not article:
-                    article = NewsArticle.objects.filter(
-                        old_url_ru=check_path
-                    ).first()
-
-                if article:
-                    # 301 редирект на новий URL ТІЛЬКИ якщо URL відрізняється
-                    new_url = article.get_absolute_url()
-                    if new_url != path:
-                        # ✅ Логування НЕ блокує
-                        redirect_logger.log_redirect(
-                            request=request,
-                            old_url=path,
-                            new_url=new_url,
-                            redirect_type='news'
-                        )
-
-                        return redirect(new_url, permanent=True)
+        target = redirect_index.lookup(path)
+
+        if target is not None:
+            new_url = target.url_for(get_language())
+            # 301 редирект ТІЛЬКИ якщо URL відрізняється (захист від петель)
+            if new_url != path:
+                # ✅ Логування НЕ блокує (< 1ms)
+                redirect_logger.log_redirect(
+                    request=request,
+                    old_url=path,
+                    new_url=new_url,
+                    redirect_type=target.redirect_type
+                )
+
+                return redirect(new_url, permanent=True)
 
         response = self.get_response(request)
         return response
@@ -190,54 +143,60 @@ class WordPressBlockMiddleware:
     410 Gone каже пошуковим системам, що ресурси назавжди видалені.
     Це прискорює видалення старих WordPress URL з індексів.
 
-    Порядок обробки:
-    1. Якщо URL починається з WordPress префіксу → 410 Gone
-    2. Якщо URL містить *.php після /wp- → 410 Gone
-    3. Інакше → дозволити подальшу обробку
+    Правила (WordPress префікси, /wp-*.php та власні PATH_RULES з 410/301/404/tarpit)
+    компілюються при старті в один regex (apps.core.path_rules):
+    один re.match на запит замість перебору префіксів.
     """
-    # WordPress шляхи для блокування
-    WORDPRESS_PATHS = [
-        '/wp-content/',
-        '/wp-admin/',
-        '/wp-includes/',
-        '/wp-json/',
-        '/wp-login.php',
-        '/wp-cron.php',
-        '/xmlrpc.php',
-        '/readme.html',
-        '/license.txt',
-        '/wp-config.php',
-        '/wp-trackback.php',
-        '/wp-signup.php',
-        '/wp-activate.php',
-        '/wp-mail.php',
-        '/wp-links-opml.php',
-        '/wp-comments-post.php',
-        '/wp-settings.php',
-    ]
+    WORDPRESS_PATHS = path_rules.WORDPRESS_PATHS
 
     def __init__(self, get_response):
         self.get_response = get_response
+        self.rules = path_rules.PathRules.from_settings()
 
     def __call__(self, request):
-        path = request.path
+        rule = self.rules.match(request.path)
+        if rule is not None:
+            return rule.response()
+
+        response = self.get_response(request)
+        return response
 
-        # Перевірка чи шлях починається з будь-якого WordPress префіксу
-        if any(path.startswith(wp_path) for wp_path in self.WORDPRESS_PATHS):
-            # 410 Gone - ресурс назавжди видалено
-            return HttpResponse(
-                'This WordPress resource has been permanently removed. The site now runs on Django.',
-                status=410,
-                content_type='text/plain'
-            )
-
-        # Також блокуємо загальний паттерн /wp-*.php
-        if path.startswith('/wp-') and path.endswith('.php'):
-            return HttpResponse(
-                'This WordPress resource has been permanently removed.',
-                status=410,
-                content_type='text/plain'
-            )
 
+class FullPageCacheMiddleware:
+    """
+    Кеш повних відповідей маркетингових сторінок для анонімних відвідувачів.
+
+    Стоїть ПІСЛЯ CsrfViewMiddleware та AuthenticationMiddleware: process_view
+    вже знає view (resolver_match) і користувача, а CSRF cookie для токена,
+    підставленого в закешований HTML, встановлює CsrfViewMiddleware.
+    HealthCheck / GoogleAdsBot / редиректи спрацьовують раніше, як і без кешу.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not page_cache.is_enabled():
+            return None
+        if not page_cache.is_cacheable_view(request.resolver_match.view_name):
+            return None
+        if page_cache.bypass_reason(request):
+            return None
+
+        key = page_cache.cache_key(request)
+        cached = page_cache.get(key)
+        if cached is not None:
+            response = page_cache.build_response(request, cached)
+            response['X-Page-Cache'] = 'HIT'
+            return response
+
+        # Зберігаємо в __call__ після рендеру
+        request._page_cache_key = key
+        return None
+
+    def __call__(self, request):
         response = self.get_response(request)
+
+        key = getattr(request, '_page_cache_key', None)
+        if key is not None and page_cache.store(key, response):
+            response['X-Page-Cache'] = 'MISS'
         return response
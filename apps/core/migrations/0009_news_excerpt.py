@@ -0,0 +1,45 @@
+# Generated by Django 4.2.8 on 2026-10-18 19:25
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+# Копія apps.core.models.make_excerpt на момент міграції
+EXCERPT_WORDS = 30
+
+
+def make_excerpt(meta_description, content=''):
+    source = meta_description or strip_tags(content or '')
+    return Truncator(source).words(EXCERPT_WORDS, truncate=' …')
+
+
+def fill_excerpts(apps, schema_editor):
+    """Заповнює анонси для вже існуючих статей"""
+    NewsArticle = apps.get_model('core', 'NewsArticle')
+    articles = NewsArticle.objects.only(
+        'id', 'meta_description_uk', 'meta_description_ru', 'content_uk', 'content_ru'
+    )
+    for article in articles.iterator(chunk_size=200):
+        article.excerpt_uk = make_excerpt(article.meta_description_uk, article.content_uk)
+        article.excerpt_ru = make_excerpt(article.meta_description_ru, article.content_ru)
+        article.save(update_fields=['excerpt_uk', 'excerpt_ru'])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0008_add_name_email_to_consultation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newsarticle",
+            name="excerpt_ru",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="newsarticle",
+            name="excerpt_uk",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
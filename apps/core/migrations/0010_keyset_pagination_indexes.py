@@ -0,0 +1,24 @@
+# Generated by Django 4.2.8 on 2026-10-18 19:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0009_news_excerpt"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="newsarticle",
+            index=models.Index(
+                fields=["is_published", "-published_at", "-id"], name="news_published_keyset_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="testimonial",
+            index=models.Index(
+                fields=["is_published", "-created_at", "-id"], name="testimonial_keyset_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.8 on 2026-10-18 19:28
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_stats(apps, schema_editor):
+    """Початкова статистика з уже опублікованих відгуків"""
+    Testimonial = apps.get_model('core', 'Testimonial')
+    TestimonialStats = apps.get_model('core', 'TestimonialStats')
+
+    values = {'count': 0, 'rating_sum': 0}
+    values.update({f'stars_{star}': 0 for star in range(1, 6)})
+    published = Testimonial.objects.filter(is_published=True).order_by()
+    for rating, count in published.values_list('rating').annotate(n=Count('id')):
+        values['count'] += count
+        values['rating_sum'] += rating * count
+        if 1 <= rating <= 5:
+            values[f'stars_{rating}'] = count
+    TestimonialStats.objects.update_or_create(pk=1, defaults=values)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0010_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TestimonialStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0, verbose_name="Кількість")),
+                ("rating_sum", models.PositiveIntegerField(default=0, verbose_name="Сума оцінок")),
+                ("stars_1", models.PositiveIntegerField(default=0, verbose_name="1 зірка")),
+                ("stars_2", models.PositiveIntegerField(default=0, verbose_name="2 зірки")),
+                ("stars_3", models.PositiveIntegerField(default=0, verbose_name="3 зірки")),
+                ("stars_4", models.PositiveIntegerField(default=0, verbose_name="4 зірки")),
+                ("stars_5", models.PositiveIntegerField(default=0, verbose_name="5 зірок")),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Статистика відгуків",
+                "verbose_name_plural": "Статистика відгуків",
+            },
+        ),
+        migrations.RunPython(fill_stats, migrations.RunPython.noop),
+    ]
@@ -4,6 +4,9 @@ from django.urls import reverse
 from django.utils.translation import get_language
 from django.core.validators import RegexValidator, MaxValueValidator
 from django.contrib.auth import get_user_model
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+from apps.leads.utils import phone_key
 
 User = get_user_model()
 
@@ -17,6 +20,36 @@ class BaseModel(models.Model):
         abstract = True
 
 
+# Кількість слів у збереженому анонсі статті (як truncatewords:30 у списку)
+NEWS_EXCERPT_WORDS = 30
+
+# Поля, потрібні сторінці списку новин (без content_uk / content_ru)
+NEWS_LIST_FIELDS = (
+    'id', 'slug_uk', 'slug_ru', 'title_uk', 'title_ru',
+    'excerpt_uk', 'excerpt_ru', 'featured_image', 'published_at',
+)
+
+
+def make_excerpt(meta_description: str, content: str = '') -> str:
+    """Анонс: meta description (або текст контенту без HTML), обрізаний до 30 слів."""
+    source = meta_description or strip_tags(content or '')
+    return Truncator(source).words(NEWS_EXCERPT_WORDS, truncate=' …')
+
+
+class NewsArticleQuerySet(models.QuerySet):
+    """QuerySet для NewsArticle."""
+
+    def published(self):
+        return self.filter(is_published=True)
+
+    def for_list(self):
+        """
+        Проекція для списку новин: заголовок, slug, анонс, зображення та дата
+        для обох мов. Важкий HTML (content_*) не читається з БД.
+        """
+        return self.only(*NEWS_LIST_FIELDS)
+
+
 class NewsArticle(BaseModel):
     """
     Модель для статей блогу новин.
@@ -38,6 +71,10 @@ class NewsArticle(BaseModel):
     meta_description_uk = models.TextField(max_length=500)
     meta_description_ru = models.TextField(max_length=500, blank=True)
 
+    # Анонс для списку новин (генерується при збереженні)
+    excerpt_uk = models.TextField(blank=True, editable=False)
+    excerpt_ru = models.TextField(blank=True, editable=False)
+
     # Зображення
     featured_image = models.ImageField(upload_to='news/images/', null=True, blank=True)
 
@@ -51,17 +88,39 @@ class NewsArticle(BaseModel):
     # Статус
     is_published = models.BooleanField(default=True, db_index=True)
 
+    objects = NewsArticleQuerySet.as_manager()
+
     class Meta:
         ordering = ['-published_at']
         indexes = [
             models.Index(fields=['slug_uk', 'is_published']),
             models.Index(fields=['slug_ru', 'is_published']),
             models.Index(fields=['published_at', 'is_published']),
+            # Keyset пагінація списку новин: WHERE is_published ORDER BY published_at, id
+            models.Index(fields=['is_published', '-published_at', '-id'], name='news_published_keyset_idx'),
         ]
 
     def __str__(self):
         return self.title_uk
 
+    def save(self, *args, **kwargs):
+        """Оновлює збережені анонси, якщо доступні вихідні поля"""
+        deferred = self.get_deferred_fields()
+        for lang in ('uk', 'ru'):
+            if not {f'meta_description_{lang}', f'content_{lang}'} & deferred:
+                setattr(self, f'excerpt_{lang}', make_excerpt(
+                    getattr(self, f'meta_description_{lang}'),
+                    getattr(self, f'content_{lang}'),
+                ))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            for lang in ('uk', 'ru'):
+                if {f'meta_description_{lang}', f'content_{lang}'} & update_fields:
+                    update_fields.add(f'excerpt_{lang}')
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+
     def get_absolute_url(self):
         """
         Генерує URL залежно від поточної мови.
@@ -214,11 +273,52 @@ class Testimonial(BaseModel):
         ordering = ['-created_at']
         verbose_name = "Відгук"
         verbose_name_plural = "Відгуки"
+        indexes = [
+            # Keyset пагінація сторінки відгуків: WHERE is_published ORDER BY created_at, id
+            models.Index(fields=['is_published', '-created_at', '-id'], name='testimonial_keyset_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.created_at.strftime('%d.%m.%Y')}"
 
 
+class TestimonialStats(models.Model):
+    """
+    Матеріалізована статистика опублікованих відгуків (один рядок).
+    Оновлюється інкрементально (apps.core.testimonial_stats), повний
+    перерахунок - python manage.py rebuild_testimonial_stats.
+    """
+    count = models.PositiveIntegerField(default=0, verbose_name="Кількість")
+    rating_sum = models.PositiveIntegerField(default=0, verbose_name="Сума оцінок")
+    stars_1 = models.PositiveIntegerField(default=0, verbose_name="1 зірка")
+    stars_2 = models.PositiveIntegerField(default=0, verbose_name="2 зірки")
+    stars_3 = models.PositiveIntegerField(default=0, verbose_name="3 зірки")
+    stars_4 = models.PositiveIntegerField(default=0, verbose_name="4 зірки")
+    stars_5 = models.PositiveIntegerField(default=0, verbose_name="5 зірок")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Статистика відгуків"
+        verbose_name_plural = "Статистика відгуків"
+
+    def __str__(self):
+        return f"{self.count} відгуків, {self.avg_rating}/5"
+
+    @property
+    def avg_rating(self):
+        """Середній рейтинг, округлений до 0.1 (0 якщо відгуків немає)"""
+        return round(self.rating_sum / self.count, 1) if self.count else 0
+
+    @property
+    def distribution(self):
+        """[(зірки, кількість, відсоток), ...] від 5 до 1"""
+        return [
+            (star, getattr(self, f'stars_{star}'),
+             round(getattr(self, f'stars_{star}') * 100 / self.count) if self.count else 0)
+            for star in range(5, 0, -1)
+        ]
+
+
 class FAQ(BaseModel):
     """Часті питання"""
     question_uk = models.CharField(max_length=200, verbose_name="Питання (UK)")
@@ -280,15 +380,26 @@ class ConsultationRequest(BaseModel):
     gclid = models.CharField(max_length=200, blank=True, verbose_name="Google Click ID")
     referrer = models.URLField(max_length=500, blank=True, verbose_name="Referrer", help_text="Сторінка, з якої прийшов користувач")
     ip_address = models.GenericIPAddressField(null=True, blank=True, verbose_name="IP адреса")
+    # Дедуплікація повторних заявок (apps.leads.ingestion):
+    phone_normalized = models.CharField(max_length=13, blank=True, default='', editable=False, verbose_name="Телефон (нормалізований)")
+    submission_count = models.PositiveIntegerField(default=1, verbose_name="Кількість заявок", help_text="Повторні відправки з того ж номера у вікні LEAD_DEDUP_WINDOW_MINUTES")
+    last_submitted_at = models.DateTimeField(null=True, blank=True, verbose_name="Остання повторна заявка")
 
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Заявка на консультацію"
         verbose_name_plural = "Заявки на консультацію"
+        indexes = [
+            models.Index(fields=['phone_normalized', 'created_at'], name='core_consult_phone_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.phone} - {self.created_at.strftime('%d.%m.%Y')}"
 
+    def save(self, *args, **kwargs):
+        self.phone_normalized = phone_key(self.phone)
+        super().save(*args, **kwargs)
+
 
 class ContactInfo(BaseModel):
     """Контактна інформація школи (синглтон)"""
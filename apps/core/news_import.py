@@ -0,0 +1,473 @@
+"""
+Імпорт news статей зі старого WordPress сайту (speak-up.com.ua).
+
+Статті обробляються пачками по три етапи:
+1. fetch - UK та RU сторінки всіх статей пачки паралельно (один
+   requests.Session з пулом з'єднань та retry на 429/5xx)
+2. images - featured та контентні зображення пачки завантажуються
+   паралельно; однаковий URL (ключ - sha1 URL) завантажується один раз
+   навіть якщо він є в кількох статтях
+3. write - NewsArticle.objects.bulk_create однією транзакцією на пачку
+
+Після кожної пачки стан (оброблені URL та вже завантажені зображення)
+записується у checkpoint файл, тому перерваний імпорт продовжується з
+місця зупинки. Конфлікт slug з містом / програмою / локацією вирішується
+політикою (skip / suffix / import) без input().
+
+Використання: python manage.py import_news (див. команду import_news).
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage, default_storage
+from django.db import transaction
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .models import NewsArticle, make_excerpt
+from .seo_config import CITIES, LOCATIONS, PROGRAMS
+from .utils.wordpress import ImageUrlIndex, extract_images_from_html, sanitize_wordpress_html
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = 'https://speak-up.com.ua'
+IMAGE_UPLOAD_PATH = 'news/images'
+USER_AGENT = (
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+# Політики для slug, що збігається з містом / програмою / локацією
+CONFLICT_SKIP = 'skip'
+CONFLICT_SUFFIX = 'suffix'
+CONFLICT_IMPORT = 'import'
+CONFLICT_POLICIES = (CONFLICT_SKIP, CONFLICT_SUFFIX, CONFLICT_IMPORT)
+CONFLICT_SLUG_SUFFIX = '-news'
+
+# Статуси URL у checkpoint; FAILED не вважається обробленим (повтор при наступному запуску)
+STATUS_IMPORTED = 'imported'
+STATUS_EXISTS = 'exists'
+STATUS_CONFLICT = 'conflict'
+STATUS_FAILED = 'failed'
+DONE_STATUSES = {STATUS_IMPORTED, STATUS_EXISTS, STATUS_CONFLICT}
+
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Вбудований список, якщо немає scripts/all_news_urls.txt
+DEFAULT_NEWS_URLS = [
+    '/news/anglijska-v-it-porady-yak-prokachaty-anglijsku-programistu/',
+    '/news/czifri-ta-chisla-na-anglijskij-movi-navchitisya-rahuvati-legko-z-speak-up/',
+    '/news/degrees-of-comparison-of-adjectives/',
+    '/news/fraz-na-anglyjskom-dlya-obshhenyya-v-otele/',
+    '/news/kolory-v-anglijskij-movi-osnovni-nazvy-prykmetnyky-idiomy-ta-vidtinky/',
+    '/news/kuhonne-pryladdya-ta-stolovi-prybory-anglijskoyu/',
+    '/news/mnozhyna-imennykiv-v-anglijskij-movi-yak-utvoryuyetsya-ta-yaki-ye-vynyatky/',
+    '/news/nepravylni-diyeslova-v-anglijskij-movi-irregular-verbs/',
+    '/news/pisni-na-zanyattyah-anglijskoyi-movy/',
+    '/news/vse-pro-past-simple-yak-utvoryuyetsya-pravyla-vzhyvannya-pryklady/',
+    '/news/yak-vyvchyty-anglijskyj-alfavit/',
+    '/news/zapalyuyemo-bazhannya-vyvchaty-anglijsku/',
+]
+
+
+def load_url_list(path: Optional[Path]) -> List[str]:
+    """URL статей з файлу (по одному на рядок) або вбудований список."""
+    if path and path.exists():
+        with open(path) as f:
+            return [line.strip() for line in f if line.strip()]
+    return list(DEFAULT_NEWS_URLS)
+
+
+def slug_from_path(url_path: str) -> str:
+    return url_path.split('/news/')[1].strip('/') if '/news/' in url_path else ''
+
+
+def slug_conflicts(slug: str) -> List[str]:
+    """Описи конфліктів slug з містами / програмами / локаціями."""
+    conflicts = []
+    if slug in CITIES:
+        conflicts.append(f'місто {slug}')
+    if slug in PROGRAMS:
+        conflicts.append(f'програма {slug}')
+    if slug in LOCATIONS:
+        conflicts.append(f'локація {slug}')
+    return conflicts
+
+
+def url_hash(url: str) -> str:
+    return hashlib.sha1(url.encode()).hexdigest()
+
+
+def parse_date(text: str) -> Optional[datetime]:
+    try:
+        return timezone.make_aware(datetime.strptime(text, '%d.%m.%Y'))
+    except ValueError:
+        return None
+
+
+def parse_article(html: str, url_path: str, page_url: str) -> dict:
+    """Дані статті зі сторінки WordPress."""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    title = soup.find('h1')
+    meta_desc = soup.find('meta', {'name': 'description'})
+    canonical = soup.find('link', {'rel': 'canonical'})
+
+    content_div = (
+        soup.find('div', class_='entry-content')
+        or soup.find('div', class_='post-content')
+        or soup.find('article')
+    )
+    if not content_div:
+        content_div = soup.find('div', class_=lambda x: x and 'content' in x.lower())
+
+    date_elem = soup.find('div', class_='entry-date') or soup.find('time') or soup.find('div', class_='date')
+    published_date = parse_date(date_elem.get_text(strip=True)) if date_elem else None
+
+    featured_img = soup.find('img', class_='wp-post-image')
+    if not featured_img:
+        thumbnail = soup.find('div', class_='post-thumbnail')
+        featured_img = thumbnail.find('img') if thumbnail else None
+    if not featured_img:
+        article = soup.find('article')
+        featured_img = article.find('img') if article else None
+
+    return {
+        'title': title.get_text(strip=True) if title else '',
+        'slug': slug_from_path(url_path),
+        'content_html': str(content_div) if content_div else '',
+        'meta_description': meta_desc.get('content', '') if meta_desc else '',
+        'canonical_url': canonical.get('href', '') if canonical else page_url,
+        'published_date': published_date or timezone.now(),
+        'featured_image_url': featured_img.get('src', '') if featured_img else '',
+        'old_url': url_path,
+    }
+
+
+@dataclass
+class ImportStats:
+    """Підсумок імпорту."""
+    imported: int = 0
+    skipped: int = 0
+    conflicts: int = 0
+    failed: int = 0
+    pages_fetched: int = 0
+    images_downloaded: int = 0
+    images_reused: int = 0
+
+
+class Checkpoint:
+    """
+    Стан імпорту на диску: {"urls": {url_path: статус}, "images": {sha1 URL: ім'я файлу}}.
+    Запис атомарний (тимчасовий файл + os.replace). path=None - лише в пам'яті.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.urls: Dict[str, str] = {}
+        self.images: Dict[str, str] = {}
+        if path and path.exists():
+            with open(path) as f:
+                data = json.load(f)
+            self.urls = data.get('urls', {})
+            self.images = data.get('images', {})
+
+    def is_done(self, url_path: str) -> bool:
+        return self.urls.get(url_path) in DONE_STATUSES
+
+    def mark(self, url_path: str, status: str) -> None:
+        self.urls[url_path] = status
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'urls': self.urls, 'images': self.images}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+class NewsImporter:
+    """
+    Паралельний імпорт статей з checkpoint.
+
+    Використання:
+        importer = NewsImporter(base_url, checkpoint=Checkpoint(path), conflict_policy='suffix')
+        stats = importer.run(load_url_list(path))
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        checkpoint: Optional[Checkpoint] = None,
+        conflict_policy: str = CONFLICT_SKIP,
+        workers: int = 4,
+        batch_size: int = 20,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        storage: Optional[Storage] = None,
+        session: Optional[requests.Session] = None,
+        log: Callable[[str], None] = logger.info,
+    ):
+        if conflict_policy not in CONFLICT_POLICIES:
+            raise ValueError(f'Unknown conflict policy: {conflict_policy}')
+        self.base_url = base_url.rstrip('/')
+        self.checkpoint = checkpoint or Checkpoint()
+        self.conflict_policy = conflict_policy
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.storage = storage or default_storage
+        self.session = session or self._build_session()
+        self.log = log
+        self.stats = ImportStats()
+        self._stats_lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers['User-Agent'] = USER_AGENT
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=0.5,
+            status_forcelist=RETRYABLE_STATUS_CODES,
+            allowed_methods=('GET',),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.workers, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _count(self, field: str, value: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self.stats, field, getattr(self.stats, field) + value)
+
+    def run(self, url_paths: Iterable[str]) -> ImportStats:
+        """Імпортує статті, яких ще немає в базі та в checkpoint."""
+        pending = [path for path in dict.fromkeys(url_paths) if not self.checkpoint.is_done(path)]
+        existing = set(NewsArticle.objects.values_list('slug_uk', flat=True))
+        existing.update(slug for slug in NewsArticle.objects.values_list('slug_ru', flat=True) if slug)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='news-import') as executor:
+                for start in range(0, len(pending), self.batch_size):
+                    self._import_batch(pending[start:start + self.batch_size], executor, existing)
+                    self.checkpoint.save()
+                    self.log(
+                        f'[{min(start + self.batch_size, len(pending))}/{len(pending)}] '
+                        f'імпортовано {self.stats.imported}, пропущено {self.stats.skipped}, '
+                        f'конфліктів {self.stats.conflicts}, помилок {self.stats.failed}'
+                    )
+        finally:
+            self.session.close()
+
+        if self.stats.imported:
+            # bulk_create не надсилає post_save: скидаємо кеші, як це роблять сигнали
+            from .redirect_index import redirect_index
+            from .seo_urls import seo_url_cache
+
+            redirect_index.invalidate()
+            seo_url_cache.invalidate()
+        return self.stats
+
+    # ---- fetch ----
+
+    def _fetch_article(self, url_path: str, lang: str) -> Optional[dict]:
+        page_url = f'{self.base_url}/ru{url_path}' if lang == 'ru' else f'{self.base_url}{url_path}'
+        try:
+            response = self.session.get(page_url, timeout=self.timeout)
+            self._count('pages_fetched')
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.log(f'Помилка завантаження {page_url}: {e}')
+            return None
+        data = parse_article(response.text, url_path, page_url)
+        if data['featured_image_url']:
+            data['featured_image_url'] = urljoin(page_url, data['featured_image_url'])
+        return data
+
+    # ---- images ----
+
+    def _download_image(self, url: str) -> Optional[str]:
+        """Ім'я збереженого файлу (або None). Файл з checkpoint перевикористовується."""
+        key = url_hash(url)
+        saved = self.checkpoint.images.get(key)
+        if saved and self.storage.exists(saved):
+            self._count('images_reused')
+            return saved
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.log(f'Помилка завантаження зображення {url}: {e}')
+            return None
+
+        filename = urlparse(url).path.split('/')[-1]
+        if not filename or '.' not in filename:
+            filename = 'image.jpg'
+        name = self.storage.save(f'{IMAGE_UPLOAD_PATH}/{key[:12]}-{filename}', ContentFile(response.content))
+        self._count('images_downloaded')
+        return name
+
+    def _download_images(self, urls: Iterable[str], executor: ThreadPoolExecutor) -> Dict[str, str]:
+        """{URL: ім'я файлу} для унікальних URL (паралельно)."""
+        unique = [url for url in dict.fromkeys(urls) if url]
+        names = dict(zip(unique, executor.map(self._download_image, unique)))
+        for url, name in names.items():
+            if name:
+                self.checkpoint.images[url_hash(url)] = name
+        return {url: name for url, name in names.items() if name}
+
+    # ---- batch ----
+
+    def _resolve_slug(self, url_path: str, slug: str, existing: set) -> Optional[str]:
+        """Slug для запису з урахуванням політики конфліктів (None - пропустити)."""
+        conflicts = slug_conflicts(slug)
+        if not conflicts or self.conflict_policy == CONFLICT_IMPORT:
+            if conflicts:
+                self.log(f'⚠️  {url_path}: конфлікт slug ({", ".join(conflicts)}), імпортуємо як є')
+            return slug
+        if self.conflict_policy == CONFLICT_SUFFIX:
+            new_slug = slug + CONFLICT_SLUG_SUFFIX
+            if new_slug not in existing and not slug_conflicts(new_slug):
+                self.log(f'⚠️  {url_path}: конфлікт slug ({", ".join(conflicts)}), slug {new_slug}')
+                return new_slug
+        self.log(f'⚠️  {url_path}: конфлікт slug ({", ".join(conflicts)}), пропущено')
+        return None
+
+    def _accept_slug(self, url_path: str, uk_data: Optional[dict], existing: set) -> Optional[str]:
+        """
+        Slug завантаженої статті або None (помилка завантаження, конфлікт,
+        вже імпортована) - тоді стан записується в checkpoint.
+        """
+        if not uk_data:
+            self.checkpoint.mark(url_path, STATUS_FAILED)
+            self._count('failed')
+            return None
+        slug = self._resolve_slug(url_path, uk_data['slug'], existing)
+        if slug is None:
+            self.checkpoint.mark(url_path, STATUS_CONFLICT)
+            self._count('conflicts')
+            return None
+        if slug in existing:
+            self.checkpoint.mark(url_path, STATUS_EXISTS)
+            self._count('skipped')
+            return None
+        existing.add(slug)
+        return slug
+
+    def _select_candidates(self, batch: List[str], existing: set) -> List[str]:
+        """Шляхи пачки, які треба завантажити (без slug / вже імпортовані - пропускаються)."""
+        candidates = []
+        for url_path in batch:
+            slug = slug_from_path(url_path)
+            if not slug:
+                self.log(f'❌ {url_path}: не вдалося визначити slug')
+                self.checkpoint.mark(url_path, STATUS_FAILED)
+                self._count('failed')
+            elif slug in existing:
+                self.checkpoint.mark(url_path, STATUS_EXISTS)
+                self._count('skipped')
+            else:
+                candidates.append(url_path)
+        return candidates
+
+    def _import_batch(self, batch: List[str], executor: ThreadPoolExecutor, existing: set) -> None:
+        candidates = self._select_candidates(batch, existing)
+
+        # 1. fetch: UK та RU сторінки всіх статей пачки паралельно
+        futures = {
+            (url_path, lang): executor.submit(self._fetch_article, url_path, lang)
+            for url_path in candidates for lang in ('uk', 'ru')
+        }
+        articles: List[Tuple[str, str, dict, Optional[dict]]] = []
+        for url_path in candidates:
+            uk_data = futures[(url_path, 'uk')].result()
+            ru_data = futures[(url_path, 'ru')].result()
+            slug = self._accept_slug(url_path, uk_data, existing)
+            if slug is not None:
+                articles.append((url_path, slug, uk_data, ru_data))
+
+        # 2. images: унікальні URL усіх статей пачки
+        content_images = {}
+        image_urls = []
+        for url_path, _slug, uk_data, ru_data in articles:
+            images = []
+            for data in filter(None, (uk_data, ru_data)):
+                images.extend(extract_images_from_html(data['content_html'], self.base_url))
+            content_images[url_path] = images
+            image_urls.append(uk_data['featured_image_url'])
+            image_urls.extend(image['original_src'] for image in images)
+        downloaded = self._download_images(image_urls, executor)
+
+        # 3. write: одна транзакція на пачку
+        objects = [
+            self._build_article(slug, uk_data, ru_data, content_images[url_path], downloaded)
+            for url_path, slug, uk_data, ru_data in articles
+        ]
+        with transaction.atomic():
+            NewsArticle.objects.bulk_create(objects)
+        for url_path, *_rest in articles:
+            self.checkpoint.mark(url_path, STATUS_IMPORTED)
+        self._count('imported', len(objects))
+
+    def _build_article(
+        self,
+        slug: str,
+        uk_data: dict,
+        ru_data: Optional[dict],
+        images: List[Dict[str, str]],
+        downloaded: Dict[str, str],
+    ) -> NewsArticle:
+        # Один індекс для UK та RU: src, webp, мініатюри та відносні шляхи - O(1) пошук
+        image_index = ImageUrlIndex()
+        for image in images:
+            name = downloaded.get(image['original_src'])
+            if name:
+                image_index.add(image['original_src'], self.storage.url(name))
+
+        def content(data: Optional[dict]) -> str:
+            if not data:
+                return ''
+            return sanitize_wordpress_html(data['content_html'], image_index)
+
+        ru_data = ru_data or {}
+        article = NewsArticle(
+            slug_uk=slug,
+            slug_ru=slug if ru_data else None,
+            title_uk=uk_data['title'],
+            title_ru=ru_data.get('title', ''),
+            content_uk=content(uk_data),
+            content_ru=content(ru_data),
+            meta_description_uk=uk_data['meta_description'],
+            meta_description_ru=ru_data.get('meta_description', ''),
+            published_at=uk_data['published_date'],
+            old_url_uk=uk_data['old_url'],
+            old_url_ru=ru_data.get('old_url', ''),
+            is_published=True,
+        )
+        featured = downloaded.get(uk_data['featured_image_url'])
+        if featured:
+            article.featured_image = featured
+        # bulk_create не викликає save(), тому анонси заповнюються тут
+        for lang in ('uk', 'ru'):
+            setattr(article, f'excerpt_{lang}', make_excerpt(
+                getattr(article, f'meta_description_{lang}'),
+                getattr(article, f'content_{lang}'),
+            ))
+        return article
@@ -0,0 +1,116 @@
+"""
+Кеш повних HTML відповідей маркетингових сторінок для анонімного трафіку.
+
+Використовується FullPageCacheMiddleware:
+- кешуються лише view з FULL_PAGE_CACHE_VIEWS (about, програми, локації,
+  міста, вакансії, акції, SEO stubs)
+- ключ: мова + scheme/host + шлях з query string + версія бігучої стрічки
+  (єдиний динамічний блок у header) + FULL_PAGE_CACHE_VERSION (деплой)
+- bypass: не GET/HEAD, авторизований користувач, utm_* / gclid / fbclid,
+  HTMX запити, flash messages
+
+CSRF токени (meta csrf-token у base.html та hidden input у формах)
+зберігаються як placeholder і при видачі замінюються на токен поточного
+запиту, тому CSRF cookie та перевірка форм працюють як і без кешу.
+"""
+import hashlib
+import re
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.translation import get_language
+
+from . import running_line
+
+CSRF_PLACEHOLDER = b'__page_cache_csrf_token__'
+
+# Місця, де templates виводять CSRF токен
+CSRF_TOKEN_RE = re.compile(
+    rb'(<meta name="csrf-token" content="|name="csrfmiddlewaretoken" value=")[A-Za-z0-9]{32,64}(")'
+)
+
+CACHEABLE_METHODS = ('GET', 'HEAD')
+TRACKING_PARAMS = ('gclid', 'fbclid')
+TRACKING_PREFIXES = ('utm_',)
+
+# Заголовки, які не зберігаються в кеші (встановлюються для кожного запиту)
+SKIPPED_HEADERS = {'set-cookie', 'content-length'}
+
+
+def is_enabled() -> bool:
+    return getattr(settings, 'FULL_PAGE_CACHE_ENABLED', True)
+
+
+def is_cacheable_view(view_name: Optional[str]) -> bool:
+    return view_name in getattr(settings, 'FULL_PAGE_CACHE_VIEWS', ())
+
+
+def bypass_reason(request) -> Optional[str]:
+    """Причина не використовувати кеш (None - можна кешувати)."""
+    if request.method not in CACHEABLE_METHODS:
+        return 'method'
+    if request.headers.get('HX-Request'):
+        return 'htmx'
+    for param in request.GET:
+        if param in TRACKING_PARAMS or param.startswith(TRACKING_PREFIXES):
+            return 'tracking'
+    if CookieStorage.cookie_name in request.COOKIES:
+        return 'messages'
+    # Сесію (і користувача) читаємо лише якщо є session cookie
+    if settings.SESSION_COOKIE_NAME in request.COOKIES:
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            return 'authenticated'
+        if request.session.get('_messages'):
+            return 'messages'
+    return None
+
+
+def cache_key(request) -> str:
+    raw = '|'.join([
+        str(getattr(settings, 'FULL_PAGE_CACHE_VERSION', '')),
+        str(running_line.get_version()),
+        get_language() or '',
+        request.scheme,
+        request.get_host(),
+        request.get_full_path(),
+    ])
+    return 'page:' + hashlib.md5(raw.encode()).hexdigest()
+
+
+def get(key: str) -> Optional[Tuple[int, bytes, Dict[str, str]]]:
+    return cache.get(key)
+
+
+def store(key: str, response: HttpResponse) -> bool:
+    """Зберігає відповідь, якщо вона придатна для спільного кешу."""
+    if response.status_code != 200 or response.streaming:
+        return False
+    if response.cookies or response.has_header('Set-Cookie'):
+        return False
+    cache_control = response.get('Cache-Control', '')
+    if 'private' in cache_control or 'no-store' in cache_control or 'no-cache' in cache_control:
+        return False
+
+    content = CSRF_TOKEN_RE.sub(rb'\1' + CSRF_PLACEHOLDER + rb'\2', response.content)
+    headers = {
+        name: value for name, value in response.items()
+        if name.lower() not in SKIPPED_HEADERS
+    }
+    cache.set(key, (response.status_code, content, headers), getattr(settings, 'FULL_PAGE_CACHE_TIMEOUT', 600))
+    return True
+
+
+def build_response(request, cached: Tuple[int, bytes, Dict[str, str]]) -> HttpResponse:
+    """Відповідь з кешу з CSRF токеном поточного запиту."""
+    status, content, headers = cached
+    if CSRF_PLACEHOLDER in content:
+        content = content.replace(CSRF_PLACEHOLDER, get_token(request).encode())
+    response = HttpResponse(content, status=status)
+    for name, value in headers.items():
+        response[name] = value
+    return response
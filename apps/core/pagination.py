@@ -0,0 +1,206 @@
+"""
+Keyset (cursor) пагінація для стрічок новин та відгуків.
+
+Замість Paginator (COUNT(*) + OFFSET) сторінка вибирається по ключу
+(поле дати, id) від останнього/першого запису сусідньої сторінки:
+WHERE (date, id) < (...) ORDER BY date DESC, id DESC LIMIT per_page + 1.
+Вартість не залежить від номера сторінки (композитні індекси
+(is_published, date, id)).
+
+Посилання мають вигляд ?page=N&cursor=... : page - номер для відображення
+та сумісності, cursor - позиція. Старі URL лише з ?page=N (індексовані
+пошуковиками) працюють через OFFSET без COUNT(*).
+"""
+import base64
+import binascii
+from datetime import datetime, timezone as dt_timezone
+from math import ceil
+from typing import Callable, List, Optional, Tuple, Union
+
+from django.db.models import Q, QuerySet
+from django.http import Http404
+from django.utils.http import urlencode
+
+# Напрямок курсора: записи після ключа (наступна сторінка) або перед ним (попередня)
+AFTER = 'a'
+BEFORE = 'b'
+
+# Межі значень курсора: далі - переповнення при конвертації зони / в БД
+MIN_YEAR, MAX_YEAR = 1, 9999
+MAX_PK = 2 ** 63
+
+
+def encode_cursor(direction: str, value: datetime, pk: int) -> str:
+    raw = f'{direction}|{value.isoformat()}|{pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token: str) -> Optional[Tuple[str, datetime, int]]:
+    """
+    Розбирає курсор; None якщо він пошкоджений або значення не можуть бути
+    ключем запису (дата без часової зони / поза діапазоном, pk поза BigAutoField).
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        direction, value, pk = base64.urlsafe_b64decode(padded.encode()).decode().split('|')
+        if direction not in (AFTER, BEFORE):
+            return None
+        value, pk = datetime.fromisoformat(value), int(pk)
+        if value.utcoffset() is None or not MIN_YEAR < value.astimezone(dt_timezone.utc).year < MAX_YEAR:
+            return None
+        if not 0 < pk < MAX_PK:
+            return None
+        return direction, value, pk
+    except (ValueError, OverflowError, binascii.Error, UnicodeDecodeError):
+        return None
+
+
+class KeysetPage:
+    """Сторінка з інтерфейсом, сумісним з django Page для templates."""
+
+    def __init__(
+        self,
+        object_list: List,
+        number: int,
+        has_next: bool,
+        has_previous: bool,
+        field: str,
+        num_pages: Optional[int] = None,
+    ):
+        self.object_list = object_list
+        self.number = number
+        self._has_next = has_next
+        self._has_previous = has_previous
+        self.field = field
+        self.num_pages = num_pages
+
+    def __repr__(self):
+        return f'<KeysetPage {self.number}>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        return self._has_next or self._has_previous
+
+    def next_page_number(self) -> int:
+        return self.number + 1
+
+    def previous_page_number(self) -> int:
+        return self.number - 1
+
+    @property
+    def next_querystring(self) -> str:
+        """Query string наступної сторінки (без '?')."""
+        last = self.object_list[-1]
+        return urlencode({
+            'page': self.number + 1,
+            'cursor': encode_cursor(AFTER, getattr(last, self.field), last.pk),
+        })
+
+    @property
+    def previous_querystring(self) -> str:
+        """Query string попередньої сторінки; для першої - лише page=1."""
+        if self.number - 1 <= 1:
+            return 'page=1'
+        first = self.object_list[0]
+        return urlencode({
+            'page': self.number - 1,
+            'cursor': encode_cursor(BEFORE, getattr(first, self.field), first.pk),
+        })
+
+
+class KeysetPaginator:
+    """
+    Keyset пагінація по (field DESC, id DESC).
+
+    count - необов'язкова загальна кількість (int або callable) для
+    "Сторінка N з M"; без неї COUNT(*) не виконується.
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        field: str,
+        per_page: int = 10,
+        count: Union[int, Callable[[], int], None] = None,
+    ):
+        self.queryset = queryset
+        self.field = field
+        self.per_page = per_page
+        self._count = count
+
+    @property
+    def num_pages(self) -> Optional[int]:
+        count = self._count() if callable(self._count) else self._count
+        if count is None:
+            return None
+        return max(1, ceil(count / self.per_page))
+
+    def get_page(self, params) -> KeysetPage:
+        """Сторінка за GET параметрами page / cursor."""
+        number = self._page_number(params.get('page'))
+        cursor = decode_cursor(params.get('cursor', '')) if params.get('cursor') else None
+
+        if cursor is None:
+            return self._offset_page(number)
+
+        direction, value, pk = cursor
+        if direction == AFTER:
+            return self._after_page(value, pk, max(number, 2))
+        return self._before_page(value, pk, number)
+
+    @staticmethod
+    def _page_number(value) -> int:
+        try:
+            return max(1, int(value))
+        except (TypeError, ValueError):
+            return 1
+
+    def _ordered(self, descending: bool = True) -> QuerySet:
+        prefix = '-' if descending else ''
+        return self.queryset.order_by(f'{prefix}{self.field}', f'{prefix}id')
+
+    def _page(self, rows: List, number: int, has_next: bool, has_previous: bool) -> KeysetPage:
+        return KeysetPage(
+            rows, number, has_next, has_previous, self.field,
+            num_pages=self.num_pages if (has_next or has_previous) else 1,
+        )
+
+    def _offset_page(self, number: int) -> KeysetPage:
+        """Сумісність зі старими ?page=N: OFFSET, але без COUNT(*)."""
+        offset = (number - 1) * self.per_page
+        rows = list(self._ordered()[offset:offset + self.per_page + 1])
+        if not rows and number > 1:
+            raise Http404('Сторінка не існує')
+        return self._page(rows[:self.per_page], number, len(rows) > self.per_page, number > 1)
+
+    def _after_page(self, value: datetime, pk: int, number: int) -> KeysetPage:
+        after = Q(**{f'{self.field}__lt': value}) | Q(**{self.field: value, 'id__lt': pk})
+        rows = list(self._ordered().filter(after)[:self.per_page + 1])
+        if not rows:
+            raise Http404('Сторінка не існує')
+        return self._page(rows[:self.per_page], number, len(rows) > self.per_page, True)
+
+    def _before_page(self, value: datetime, pk: int, number: int) -> KeysetPage:
+        before = Q(**{f'{self.field}__gt': value}) | Q(**{self.field: value, 'id__gt': pk})
+        rows = list(self._ordered(descending=False).filter(before)[:self.per_page + 1])
+        has_previous = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        rows.reverse()
+        if not rows:
+            return self._offset_page(1)
+        # Дійшли до початку стрічки - це перша сторінка незалежно від ?page
+        return self._page(rows, max(number, 2) if has_previous else 1, True, has_previous)
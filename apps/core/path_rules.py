@@ -0,0 +1,166 @@
+"""
+Правила для шляхів, які обробляються ДО views: 410 Gone для старих
+WordPress URL, 301 редиректи, 404 та tarpit для сканерів.
+
+Усі правила компілюються в один регулярний вираз з іменованими групами:
+перевірка шляху = один re.match у C замість any(path.startswith(...))
+по кожному префіксу на кожен запит. Перше правило в списку має пріоритет
+(як порядок альтернатив у виразі).
+
+Правило - dict з settings.PATH_RULES:
+    {'prefix': '/old-blog/', 'action': 'redirect', 'target': '/news/'}
+    {'exact': '/xmlrpc.php', 'action': 'gone'}
+    {'regex': r'/.*\\.env\\Z', 'action': 'tarpit', 'delay': 3, 'status': 404}
+
+Дії: gone (410), not_found (404), redirect (301, або 302 з 'permanent': False),
+tarpit (затримка 'delay' сек, далі 'status', за замовчуванням 410).
+WordPress правила (WORDPRESS_RULES) додаються після PATH_RULES, якщо
+PATH_RULES_BLOCK_WORDPRESS увімкнено.
+"""
+import re
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse, HttpResponsePermanentRedirect, HttpResponseRedirect
+
+GONE = 'gone'
+NOT_FOUND = 'not_found'
+REDIRECT = 'redirect'
+TARPIT = 'tarpit'
+ACTIONS = (GONE, NOT_FOUND, REDIRECT, TARPIT)
+
+MATCH_TYPES = ('prefix', 'exact', 'regex')
+
+GONE_MESSAGE = 'This WordPress resource has been permanently removed. The site now runs on Django.'
+
+# WordPress шляхи для блокування (раніше WordPressBlockMiddleware.WORDPRESS_PATHS)
+WORDPRESS_PATHS = [
+    '/wp-content/',
+    '/wp-admin/',
+    '/wp-includes/',
+    '/wp-json/',
+    '/wp-login.php',
+    '/wp-cron.php',
+    '/xmlrpc.php',
+    '/readme.html',
+    '/license.txt',
+    '/wp-config.php',
+    '/wp-trackback.php',
+    '/wp-signup.php',
+    '/wp-activate.php',
+    '/wp-mail.php',
+    '/wp-links-opml.php',
+    '/wp-comments-post.php',
+    '/wp-settings.php',
+]
+
+WORDPRESS_RULES = [{'prefix': path, 'action': GONE, 'message': GONE_MESSAGE} for path in WORDPRESS_PATHS] + [
+    # Загальний паттерн /wp-*.php
+    {'regex': r'/wp-.*\.php\Z', 'action': GONE, 'message': 'This WordPress resource has been permanently removed.'},
+]
+
+
+@dataclass(frozen=True)
+class PathRule:
+    """Скомпільоване правило: що шукати та яку відповідь повернути."""
+    match_type: str
+    pattern: str
+    action: str
+    target: str = ''
+    permanent: bool = True
+    status: int = 410
+    delay: float = 0.0
+    message: str = ''
+
+    @classmethod
+    def from_dict(cls, data: dict, default_delay: float = 0.0) -> 'PathRule':
+        match_types = [key for key in MATCH_TYPES if key in data]
+        if len(match_types) != 1:
+            raise ImproperlyConfigured(f'PATH_RULES: потрібен рівно один з {MATCH_TYPES}: {data!r}')
+        match_type = match_types[0]
+        action = data.get('action', GONE)
+        if action not in ACTIONS:
+            raise ImproperlyConfigured(f'PATH_RULES: невідома дія {action!r} (можливі: {ACTIONS})')
+        if action == REDIRECT and not data.get('target'):
+            raise ImproperlyConfigured(f'PATH_RULES: redirect без target: {data!r}')
+
+        status = {GONE: 410, NOT_FOUND: 404, REDIRECT: 301 if data.get('permanent', True) else 302}.get(action)
+        return cls(
+            match_type=match_type,
+            pattern=data[match_type],
+            action=action,
+            target=data.get('target', ''),
+            permanent=data.get('permanent', True),
+            status=int(data.get('status', status or 410)),
+            delay=float(data.get('delay', default_delay)) if action == TARPIT else 0.0,
+            message=data.get('message', ''),
+        )
+
+    def regex(self) -> str:
+        if self.match_type == 'prefix':
+            return re.escape(self.pattern)
+        if self.match_type == 'exact':
+            return re.escape(self.pattern) + r'\Z'
+        return self.pattern
+
+    def response(self) -> HttpResponse:
+        if self.action == REDIRECT:
+            response_class = HttpResponsePermanentRedirect if self.permanent else HttpResponseRedirect
+            return response_class(self.target)
+        if self.action == TARPIT and self.delay > 0:
+            # Сповільнюємо сканери; потік воркера зайнятий - тримати delay малим
+            time.sleep(self.delay)
+        return HttpResponse(self.message or '', status=self.status, content_type='text/plain')
+
+
+class PathRules:
+    """
+    Набір правил, скомпільований в один regex.
+
+    Використання:
+        rules = PathRules.from_settings()
+        rule = rules.match(request.path)
+        if rule is not None:
+            return rule.response()
+    """
+
+    def __init__(self, rules: Iterable[PathRule]):
+        self.rules: List[PathRule] = list(rules)
+        self._groups = [f'r{i}' for i in range(len(self.rules))]
+        self._by_group = dict(zip(self._groups, self.rules))
+        if self.rules:
+            pattern = '|'.join(f'(?P<{group}>{rule.regex()})' for group, rule in zip(self._groups, self.rules))
+            try:
+                self._regex = re.compile(pattern)
+            except re.error as e:
+                raise ImproperlyConfigured(f'PATH_RULES: невалідний regex: {e}') from e
+            # Без власних груп у regex правил lastgroup - це група правила
+            self._nested_groups = self._regex.groups != len(self.rules)
+        else:
+            self._regex = None
+
+    @classmethod
+    def from_settings(cls) -> 'PathRules':
+        delay = getattr(settings, 'PATH_RULES_TARPIT_DELAY', 2.0)
+        rules = list(getattr(settings, 'PATH_RULES', []))
+        if getattr(settings, 'PATH_RULES_BLOCK_WORDPRESS', True):
+            rules += WORDPRESS_RULES
+        return cls(PathRule.from_dict(rule, delay) for rule in rules)
+
+    def match(self, path: str) -> Optional[PathRule]:
+        """Перше правило, що відповідає шляху, або None."""
+        if self._regex is None:
+            return None
+        found = self._regex.match(path)
+        if found is None:
+            return None
+        if not self._nested_groups:
+            return self._by_group[found.lastgroup]
+        # Перша (за порядком правил) група, що спрацювала
+        for group in self._groups:
+            if found.group(group) is not None:
+                return self._by_group[group]
+        return None
@@ -0,0 +1,157 @@
+"""
+In-memory індекс 301 редиректів.
+
+Об'єднує статичний REDIRECTS та old_url_uk / old_url_ru усіх NewsArticle
+в одну нормалізовану таблицю. Перевірка редиректу = один dict lookup, без SQL.
+
+Індекс будується при старті (NewsRedirectMiddleware.__init__), скидається
+сигналами при зміні NewsArticle і перебудовується ліниво при наступному запиті.
+REDIRECT_INDEX_TTL обмежує "застарілість" індексу в інших gunicorn воркерах,
+які не отримують сигнали цього процесу.
+"""
+import logging
+import threading
+import time
+from typing import Dict, NamedTuple, Optional
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.urls import reverse
+from django.utils import translation
+
+from .redirects import REDIRECTS
+
+logger = logging.getLogger(__name__)
+
+# Префікс старих news URL (як у NewsRedirectMiddleware до індексу)
+NEWS_PREFIX = '/news/'
+
+
+def normalize_path(path: str) -> str:
+    """Нормалізує шлях: без trailing slash (крім кореня)."""
+    if path == '/':
+        return path
+    return path.rstrip('/') or '/'
+
+
+class RedirectTarget(NamedTuple):
+    """Ціль редиректу: URL для кожної мови + тип ('static' або 'news')."""
+    urls: Dict[str, str]
+    redirect_type: str
+
+    def url_for(self, lang: Optional[str]) -> str:
+        """Повертає URL для мови, fallback на мову за замовчуванням."""
+        return self.urls.get(lang or '') or self.urls[settings.LANGUAGE_CODE]
+
+
+class RedirectIndex:
+    """
+    Process-local таблиця редиректів {нормалізований шлях: RedirectTarget}.
+
+    Trailing-slash варіанти ('/home' та '/home/') поділяють один запис.
+    Статичні редиректи мають пріоритет над news редиректами.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self._table: Optional[Dict[str, RedirectTarget]] = None
+        self._built_at = 0.0
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is not None:
+            return self._ttl
+        return getattr(settings, 'REDIRECT_INDEX_TTL', 300)
+
+    def lookup(self, path: str) -> Optional[RedirectTarget]:
+        """Знаходить ціль редиректу для шляху (без SQL, якщо індекс теплий)."""
+        return self._get_table().get(normalize_path(path))
+
+    def invalidate(self) -> None:
+        """Скидає індекс; наступний lookup перебудує його."""
+        self._table = None
+
+    def warm(self) -> None:
+        """Будує індекс заздалегідь. Помилки БД не блокують старт."""
+        try:
+            self._get_table()
+        except DatabaseError as e:
+            # Наприклад, таблиці ще немає до migrate
+            logger.warning('Redirect index warmup skipped: %s', e)
+
+    def _get_table(self) -> Dict[str, RedirectTarget]:
+        table = self._table
+        if table is not None and time.monotonic() - self._built_at < self.ttl:
+            return table
+
+        with self._lock:
+            # Інший thread міг вже перебудувати індекс
+            table = self._table
+            if table is None or time.monotonic() - self._built_at >= self.ttl:
+                table = self.build()
+                self._table = table
+                self._built_at = time.monotonic()
+        return table
+
+    def build(self) -> Dict[str, RedirectTarget]:
+        """Будує таблицю редиректів: news статті + статичний REDIRECTS."""
+        table: Dict[str, RedirectTarget] = {}
+        self._add_news_redirects(table)
+
+        static: Dict[str, RedirectTarget] = {}
+        for old_url, new_url in REDIRECTS.items():
+            key = normalize_path(old_url)
+            # Ключ без trailing slash має пріоритет над варіантом зі slash
+            if old_url == key or key not in static:
+                static[key] = RedirectTarget(
+                    urls={lang: new_url for lang, _ in settings.LANGUAGES},
+                    redirect_type='static',
+                )
+
+        # Статичні редиректи перекривають news (як і раніше перевірялись першими)
+        table.update(static)
+        return table
+
+    def _add_news_redirects(self, table: Dict[str, RedirectTarget]) -> None:
+        # Імпорт тут, щоб модуль можна було імпортувати до завантаження моделей
+        from .models import NewsArticle
+
+        rows = (
+            NewsArticle.objects
+            .exclude(old_url_uk='', old_url_ru='')
+            .order_by('-published_at')
+            .values_list('slug_uk', 'slug_ru', 'old_url_uk', 'old_url_ru')
+        )
+
+        uk_entries = []
+        ru_entries = []
+        for slug_uk, slug_ru, old_url_uk, old_url_ru in rows:
+            target = RedirectTarget(
+                urls=self._article_urls(slug_uk, slug_ru),
+                redirect_type='news',
+            )
+            if old_url_uk:
+                uk_entries.append((old_url_uk, target))
+            if old_url_ru:
+                ru_entries.append((old_url_ru, target))
+
+        # Спочатку old_url_uk, потім old_url_ru; перша (найновіша) стаття виграє
+        for old_url, target in uk_entries + ru_entries:
+            key = normalize_path(old_url)
+            if key.startswith(NEWS_PREFIX) and key + '/' != NEWS_PREFIX:
+                table.setdefault(key, target)
+
+    @staticmethod
+    def _article_urls(slug_uk: str, slug_ru: Optional[str]) -> Dict[str, str]:
+        """URL статті для кожної мови (як NewsArticle.get_absolute_url)."""
+        urls = {}
+        for lang, _ in settings.LANGUAGES:
+            slug = slug_ru if lang == 'ru' and slug_ru else slug_uk
+            with translation.override(lang):
+                urls[lang] = reverse('core:news_detail', kwargs={'slug': slug})
+        return urls
+
+
+# Singleton
+redirect_index = RedirectIndex()
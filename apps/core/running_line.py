@@ -0,0 +1,88 @@
+"""
+Версіонований кеш текстів бігучої стрічки.
+
+running_line_context викликається на кожен рендер, а тексти змінюються
+кілька разів на місяць. Тому список зберігається в кеші Django (CACHES,
+за замовчуванням local-memory; для спільного кешу між воркерами - Redis
+тощо) під ключем з номером версії. Сигнали post_save / post_delete на
+RunningLineText збільшують версію, старі ключі просто вичерпують timeout.
+
+Додатково процес тримає останню прочитану версію в пам'яті: на теплий
+запит - один cache.get номера версії, без SQL і без десеріалізації списку.
+Локальна копія живе не довше RUNNING_LINE_CACHE_TIMEOUT (як REDIRECT_INDEX_TTL
+для індексу редиректів): зміни в обхід сигналів (queryset.update, ручні
+правки в БД) підхоплюються так само, як після вичерпання ключа в CACHES.
+"""
+import threading
+import time
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+VERSION_KEY = 'running_line:version'
+TEXTS_KEY = 'running_line:texts:{version}'
+
+_local_lock = threading.Lock()
+# (версія, тексти, time.monotonic() після якого перечитати кеш)
+_local: Optional[Tuple[int, Tuple[str, ...], float]] = None
+
+
+def _new_version() -> int:
+    # Не починаємо з 1: після витіснення ключа версії не підхопимо старий список
+    return time.time_ns()
+
+
+def get_version() -> int:
+    """Поточна версія списку (створює її, якщо ключ відсутній)."""
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, _new_version(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def get_running_line_texts() -> Tuple[str, ...]:
+    """Активні тексти бігучої стрічки в порядку відображення."""
+    global _local
+
+    version = get_version()
+    local = _local
+    if local is not None and local[0] == version and time.monotonic() < local[2]:
+        return local[1]
+
+    timeout = getattr(settings, 'RUNNING_LINE_CACHE_TIMEOUT', 86400)
+    key = TEXTS_KEY.format(version=version)
+    texts = cache.get(key)
+    if texts is None:
+        texts = load_texts()
+        cache.set(key, texts, timeout)
+
+    with _local_lock:
+        _local = (version, texts, time.monotonic() + timeout)
+    return texts
+
+
+def load_texts() -> Tuple[str, ...]:
+    """Читає активні тексти з БД."""
+    from .models import RunningLineText
+
+    return tuple(
+        RunningLineText.objects
+        .filter(is_active=True)
+        .order_by('order', 'id')
+        .values_list('text', flat=True)
+    )
+
+
+def invalidate() -> None:
+    """Нова версія: всі процеси перечитають список при наступному запиті."""
+    global _local
+
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        # Ключа версії ще немає (або витіснений)
+        cache.set(VERSION_KEY, _new_version(), timeout=None)
+    with _local_lock:
+        _local = None
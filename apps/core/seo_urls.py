@@ -0,0 +1,159 @@
+"""
+Кеш canonical та hreflang шляхів для seo_context.
+
+translate_url() робить повний resolve + reverse, тому результат для кожного
+(мова, нормалізований шлях) обчислюється один раз:
+- заздалегідь для всіх маршрутів SITEMAP_URLS та опублікованих NewsArticle
+- для решти шляхів - через обмежений LRU (SEO_URL_CACHE_SIZE)
+
+Сигнал зміни NewsArticle скидає кеш у поточному процесі; інші воркери
+перебудовують його не пізніше ніж через SEO_URL_CACHE_TTL секунд.
+
+Кеш зберігає лише шляхи (вже закодовані через iri_to_uri), тому він спільний
+для всіх хостів та схем: абсолютний URL = scheme://host + шлях.
+"""
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.urls import reverse, translate_url
+from django.utils import translation
+from django.utils.encoding import iri_to_uri, uri_to_iri
+
+from .seo_config import SITEMAP_URLS
+
+logger = logging.getLogger(__name__)
+
+HREFLANG_LANGUAGES = ('uk', 'ru')
+
+
+class SeoUrls(NamedTuple):
+    """Canonical шлях та hreflang альтернативи (шляхи без хоста)."""
+    canonical: str
+    alternates: Tuple[Tuple[str, str], ...]
+
+
+def normalize_path(path: str) -> str:
+    """Нормалізує trailing slash (як canonical URL)."""
+    return path.rstrip('/') if path != '/' else '/'
+
+
+def reverse_sitemap_item(item: tuple) -> str:
+    """reverse() для запису SITEMAP_URLS в поточній мові."""
+    url_name = item[0]
+    if len(item) >= 4:
+        # Для city_page використовується 'city', для інших 'slug'
+        kwarg = 'city' if url_name == 'core:city_page' else 'slug'
+        return reverse(url_name, kwargs={kwarg: item[3]})
+    return reverse(url_name)
+
+
+def compute_seo_urls(path: str) -> SeoUrls:
+    """
+    Обчислює canonical та hreflang шляхи для нормалізованого шляху
+    в поточній активній мові (без кешу).
+    """
+    alternates = []
+    for lang_code in HREFLANG_LANGUAGES:
+        try:
+            translated_path = normalize_path(translate_url(path, lang_code))
+        except Exception:
+            # Fallback якщо URL не перекладається
+            translated_path = path
+        alternates.append((lang_code, iri_to_uri(translated_path)))
+    return SeoUrls(canonical=iri_to_uri(path), alternates=tuple(alternates))
+
+
+class SeoUrlCache:
+    """Precomputed map + LRU для (мова, нормалізований шлях) -> SeoUrls."""
+
+    def __init__(self, maxsize: Optional[int] = None, ttl: Optional[float] = None):
+        self._precomputed: Optional[Dict[Tuple[str, str], SeoUrls]] = None
+        self._built_at = 0.0
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._lru = lru_cache(maxsize=maxsize or getattr(settings, 'SEO_URL_CACHE_SIZE', 2048))(
+            self._compute
+        )
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is not None:
+            return self._ttl
+        return getattr(settings, 'SEO_URL_CACHE_TTL', 300)
+
+    def get(self, lang: str, path: str) -> SeoUrls:
+        """SeoUrls для нормалізованого шляху в мові lang."""
+        entry = self._get_precomputed().get((lang, path))
+        if entry is None:
+            entry = self._lru(lang, path)
+        return entry
+
+    def invalidate(self) -> None:
+        """Скидає кеш (наприклад, після зміни slug статті)."""
+        self._precomputed = None
+        self._lru.cache_clear()
+
+    @staticmethod
+    def _compute(lang: str, path: str) -> SeoUrls:
+        with translation.override(lang):
+            return compute_seo_urls(path)
+
+    def _get_precomputed(self) -> Dict[Tuple[str, str], SeoUrls]:
+        table = self._precomputed
+        if table is not None and time.monotonic() - self._built_at < self.ttl:
+            return table
+
+        with self._lock:
+            # Інший thread міг вже перебудувати таблицю
+            table = self._precomputed
+            if table is None or time.monotonic() - self._built_at >= self.ttl:
+                table = self.build()
+                self._lru.cache_clear()
+                self._precomputed = table
+                self._built_at = time.monotonic()
+        return table
+
+    def build(self) -> Dict[Tuple[str, str], SeoUrls]:
+        """Обчислює шляхи для всіх маршрутів sitemap та статей."""
+        table: Dict[Tuple[str, str], SeoUrls] = {}
+
+        for lang_code, _ in settings.LANGUAGES:
+            with translation.override(lang_code):
+                for item in SITEMAP_URLS:
+                    try:
+                        path = normalize_path(uri_to_iri(reverse_sitemap_item(item)))
+                    except Exception:
+                        continue
+                    table[(lang_code, path)] = compute_seo_urls(path)
+
+                for slug in self._article_slugs(lang_code):
+                    path = normalize_path(uri_to_iri(reverse('core:news_detail', kwargs={'slug': slug})))
+                    table[(lang_code, path)] = compute_seo_urls(path)
+
+        return table
+
+    @staticmethod
+    def _article_slugs(lang_code: str):
+        from .models import NewsArticle
+
+        field = 'slug_ru' if lang_code == 'ru' else 'slug_uk'
+        try:
+            return list(
+                NewsArticle.objects
+                .filter(is_published=True)
+                .exclude(**{f'{field}__isnull': True})
+                .exclude(**{field: ''})
+                .values_list(field, flat=True)
+            )
+        except DatabaseError as e:
+            logger.warning('SEO URL cache: news articles skipped: %s', e)
+            return []
+
+
+# Singleton
+seo_url_cache = SeoUrlCache()
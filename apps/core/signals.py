@@ -0,0 +1,66 @@
+"""
+Сигнали core app: інвалідація кешів при зміні контенту.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import running_line, testimonial_stats
+from .fragment_cache import SECTION_MODELS, invalidate_model
+from .models import NewsArticle, RunningLineText, Testimonial
+from .redirect_index import redirect_index
+from .seo_urls import seo_url_cache
+
+
+@receiver(post_save, sender=NewsArticle)
+@receiver(post_delete, sender=NewsArticle)
+def invalidate_redirect_index(sender, **kwargs):
+    """Скидає індекс редиректів та SEO URL кеш при зміні old_url / slug статті."""
+    redirect_index.invalidate()
+    seo_url_cache.invalidate()
+
+
+@receiver(post_save, sender=RunningLineText)
+@receiver(post_delete, sender=RunningLineText)
+def invalidate_running_line(sender, **kwargs):
+    """Нова версія кешу бігучої стрічки (після commit, щоб не закешувати старі дані)."""
+    transaction.on_commit(running_line.invalidate)
+
+
+@receiver(pre_save, sender=Testimonial)
+def remember_testimonial_state(sender, instance, raw=False, **kwargs):
+    """Запам'ятовує, що відгук вносив у статистику до збереження."""
+    previous = None
+    if instance.pk and not instance._state.adding:
+        row = sender.objects.filter(pk=instance.pk).values_list('is_published', 'rating').first()
+        if row and row[0]:
+            previous = row[1]
+    instance._stats_previous = previous
+
+
+@receiver(post_save, sender=Testimonial)
+def update_testimonial_stats(sender, instance, **kwargs):
+    """Інкрементально оновлює TestimonialStats після збереження відгуку."""
+    previous = getattr(instance, '_stats_previous', None)
+    testimonial_stats.apply_delta(
+        testimonial_stats.state_delta(previous, testimonial_stats.published_state(instance))
+    )
+    instance._stats_previous = testimonial_stats.published_state(instance)
+
+
+@receiver(post_delete, sender=Testimonial)
+def remove_testimonial_stats(sender, instance, **kwargs):
+    """Віднімає видалений опублікований відгук зі статистики."""
+    testimonial_stats.apply_delta(
+        testimonial_stats.state_delta(testimonial_stats.published_state(instance), None)
+    )
+
+
+def invalidate_homepage_section(sender, **kwargs):
+    """Скидає фрагмент головної сторінки, що відображає цю модель."""
+    invalidate_model(sender)
+
+
+for model_label in SECTION_MODELS:
+    post_save.connect(invalidate_homepage_section, sender=model_label)
+    post_delete.connect(invalidate_homepage_section, sender=model_label)
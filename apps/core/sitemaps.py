@@ -1,65 +1,76 @@
+"""
+Sitemap для статичних сторінок і news статей (UK + RU).
+
+- items() одразу повертають готові location: reverse() виконується один раз
+  на мову, без activate() на кожен item
+- news читаються через values_list (без content_uk / content_ru)
+- cached_sitemap кешує згенерований XML (CACHES) і підтримує conditional GET:
+  ETag/Last-Modified рахуються з "версій" секцій (один легкий запит до БД),
+  тому бот з If-None-Match отримує 304 без генерації XML
+"""
+import hashlib
+import os
+from datetime import datetime, timezone as dt_timezone
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
 from django.contrib.sitemaps import Sitemap
+from django.contrib.sitemaps.views import sitemap as django_sitemap
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.http import HttpResponse
 from django.urls import reverse
-from django.utils.translation import activate, get_language
-from .seo_config import SITEMAP_URLS
+from django.utils import translation
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from . import seo_config
 from .models import NewsArticle
+from .seo_urls import reverse_sitemap_item
+
+SITEMAP_LANGUAGES = ('uk', 'ru')
+
+# Заглушка для шаблону URL статті (має проходити slug converter)
+SLUG_PLACEHOLDER = 'sitemap-slug-placeholder'
+
+# Заголовки відповіді sitemap view, які зберігаються разом з XML
+CACHED_HEADERS = ('Content-Type', 'X-Robots-Tag')
+
 
 class SpeakUpSitemap(Sitemap):
     """
     Sitemap для всіх сторінок в обох мовах (UK + RU).
 
     Структура items(): кожний item складається з:
-    - original_item: данні з SITEMAP_URLS
+    - original: данні з SITEMAP_URLS
     - lang: 'uk' або 'ru'
+    - location: готовий шлях (з мовним префіксом для RU)
     """
 
     def items(self):
         """
         Повертає всі URL з обома мовними версіями.
-        Для кожного оригінального item створюємо два записи (UK та RU).
+        Для кожного оригінального item два записи (UK та RU), шляхи
+        обчислюються за один прохід на мову.
         """
+        locations = {}
+        for lang in SITEMAP_LANGUAGES:
+            with translation.override(lang):
+                locations[lang] = [reverse_sitemap_item(item) for item in seo_config.SITEMAP_URLS]
+
         items_with_langs = []
-        for original_item in SITEMAP_URLS:
-            # Додаємо українську версію
-            items_with_langs.append({
-                'original': original_item,
-                'lang': 'uk'
-            })
-            # Додаємо російську версію
-            items_with_langs.append({
-                'original': original_item,
-                'lang': 'ru'
-            })
+        for index, original_item in enumerate(seo_config.SITEMAP_URLS):
+            for lang in SITEMAP_LANGUAGES:
+                items_with_langs.append({
+                    'original': original_item,
+                    'lang': lang,
+                    'location': locations[lang][index],
+                })
         return items_with_langs
 
     def location(self, item):
-        """Генерує URL для кожного item (с мовним префіксом для RU)."""
-        original_item = item['original']
-        lang = item['lang']
-        url_name = original_item[0]
-
-        # Активуємо мову для reverse()
-        activate(lang)
-
-        try:
-            # Якщо є slug (4-й елемент tuple)
-            if len(original_item) >= 4:
-                slug = original_item[3]
-
-                # Для city_page використовується 'city', для інших 'slug'
-                if url_name == 'core:city_page':
-                    url = reverse(url_name, kwargs={'city': slug})
-                else:
-                    url = reverse(url_name, kwargs={'slug': slug})
-
-                return url
-            else:
-                # Простий URL без параметрів
-                url = reverse(url_name)
-                return url
-        finally:
-            # Повертаємо попередню мову
-            activate(get_language())
+        """Готовий URL item (с мовним префіксом для RU)."""
+        return item['location']
 
     def priority(self, item):
         """Повертає пріоритет з оригінального item."""
@@ -69,6 +80,15 @@ class SpeakUpSitemap(Sitemap):
         """Повертає частоту оновлення з оригінального item."""
         return item['original'][2]
 
+    def cache_version(self) -> Tuple[str, Optional[datetime]]:
+        """
+        Версія секції для ETag та Last-Modified.
+        SITEMAP_URLS змінюється лише з деплоєм: беремо хеш списку та mtime seo_config.
+        """
+        mtime = os.path.getmtime(seo_config.__file__)
+        version = hashlib.md5(repr(seo_config.SITEMAP_URLS).encode()).hexdigest()
+        return version, datetime.fromtimestamp(int(mtime), tz=dt_timezone.utc)
+
 
 class NewsSitemap(Sitemap):
     """
@@ -85,51 +105,129 @@ class NewsSitemap(Sitemap):
     def items(self):
         """
         Повертає всі опубліковані статті з мовними варіантами.
-        Структура: [{'article': article, 'lang': 'uk'}, {'article': article, 'lang': 'ru'}, ...]
+        Структура: [{'location': ..., 'lastmod': ..., 'lang': 'uk'}, ...]
         """
-        articles = NewsArticle.objects.filter(is_published=True)
-        items_with_langs = []
+        templates = self._url_templates()
+        rows = (
+            NewsArticle.objects
+            .filter(is_published=True)
+            .values_list('slug_uk', 'slug_ru', 'updated_at')
+        )
 
-        for article in articles:
+        items_with_langs = []
+        for slug_uk, slug_ru, updated_at in rows:
             # Завжди додаємо UK версію
             items_with_langs.append({
-                'article': article,
-                'lang': 'uk'
+                'location': self._article_url(templates['uk'], 'uk', slug_uk),
+                'lastmod': updated_at,
+                'lang': 'uk',
             })
 
             # Додаємо RU версію тільки якщо slug_ru існує
-            if article.slug_ru:
+            if slug_ru:
                 items_with_langs.append({
-                    'article': article,
-                    'lang': 'ru'
+                    'location': self._article_url(templates['ru'], 'ru', slug_ru),
+                    'lastmod': updated_at,
+                    'lang': 'ru',
                 })
 
         return items_with_langs
 
     def location(self, item):
-        """
-        Генерує URL для статті залежно від мови.
-        Автоматично добавляє /ru/ префікс для російської версії.
-        """
-        article = item['article']
-        lang = item['lang']
+        """Готовий URL статті (з /ru/ префіксом для російської версії)."""
+        return item['location']
 
-        # Активуємо мову для reverse()
-        activate(lang)
+    def lastmod(self, item):
+        """Остання дата модифікації статті."""
+        return item['lastmod']
+
+    def cache_version(self) -> Tuple[str, Optional[datetime]]:
+        """Версія секції: кількість опублікованих статей + останній updated_at."""
+        stats = NewsArticle.objects.filter(is_published=True).aggregate(
+            count=Count('id'),
+            latest=Max('updated_at'),
+        )
+        latest = stats['latest']
+        version = f"{stats['count']}:{latest.isoformat() if latest else ''}"
+        return version, latest
+
+    @staticmethod
+    def _url_templates() -> Dict[str, Tuple[str, str]]:
+        """Префікс і суфікс URL статті для кожної мови (один reverse на мову)."""
+        templates = {}
+        for lang in SITEMAP_LANGUAGES:
+            with translation.override(lang):
+                url = reverse('core:news_detail', kwargs={'slug': SLUG_PLACEHOLDER})
+            head, _, tail = url.partition(SLUG_PLACEHOLDER)
+            templates[lang] = (head, tail)
+        return templates
+
+    @staticmethod
+    def _article_url(template: Tuple[str, str], lang: str, slug: str) -> str:
+        if slug.isascii() and slug.replace('-', '').replace('_', '').isalnum():
+            return template[0] + slug + template[1]
+        # Нестандартний slug - звичайний reverse (з перевіркою converter)
+        with translation.override(lang):
+            return reverse('core:news_detail', kwargs={'slug': slug})
 
-        try:
-            # Вибираємо правильний slug залежно від мови
-            if lang == 'ru' and article.slug_ru:
-                slug = article.slug_ru
-            else:
-                slug = article.slug_uk
 
-            return reverse('core:news_detail', kwargs={'slug': slug})
-        finally:
-            # Повертаємо попередню мову
-            activate(get_language())
+def sitemap_state(sitemaps: dict, section: Optional[str] = None) -> Tuple[str, Optional[datetime]]:
+    """Комбінована версія та Last-Modified для всіх (або однієї) секцій."""
+    names = [section] if section is not None else list(sitemaps)
+    versions: List[str] = []
+    last_modified = None
+    for name in names:
+        site = sitemaps[name]
+        if callable(site):
+            site = site()
+        version, modified = site.cache_version()
+        versions.append(f'{name}={version}')
+        if modified is not None and (last_modified is None or modified > last_modified):
+            last_modified = modified
+    return '|'.join(versions), last_modified
 
-    def lastmod(self, item):
-        """Остання дата модифікації статті."""
-        return item['article'].updated_at
 
+def cached_sitemap(request, sitemaps, section=None, template_name='sitemap.xml'):
+    """
+    sitemap view з кешем XML та conditional GET (ETag / Last-Modified).
+    XML залежить від scheme/host та сторінки (?p=), тому вони входять у ключ.
+    """
+    if section is not None and section not in sitemaps:
+        return django_sitemap(request, sitemaps, section=section, template_name=template_name)
+
+    version, last_modified = sitemap_state(sitemaps, section)
+    fingerprint = '|'.join([
+        request.scheme,
+        request.get_host(),
+        section or '',
+        request.GET.get('p', '1'),
+        version,
+    ])
+    digest = hashlib.md5(fingerprint.encode()).hexdigest()
+    etag = quote_etag(digest)
+    last_modified_ts = int(last_modified.timestamp()) if last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified_ts)
+    if response is None:
+        cache_key = f'sitemap:{digest}'
+        cached = cache.get(cache_key)
+        if cached is None:
+            rendered = django_sitemap(request, sitemaps, section=section, template_name=template_name)
+            if rendered.status_code != 200:
+                return rendered
+            rendered.render()
+            cached = (
+                rendered.content,
+                {header: rendered[header] for header in CACHED_HEADERS if rendered.has_header(header)},
+            )
+            cache.set(cache_key, cached, getattr(settings, 'SITEMAP_CACHE_TIMEOUT', 3600))
+
+        content, headers = cached
+        response = HttpResponse(content)
+        for header, value in headers.items():
+            response[header] = value
+
+    response['ETag'] = etag
+    if last_modified_ts is not None:
+        response['Last-Modified'] = http_date(last_modified_ts)
+    return response
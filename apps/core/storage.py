@@ -0,0 +1,57 @@
+"""
+Storage для статичних та media файлів.
+
+CompressedManifestStaticFilesStorage (WhiteNoise):
+- імена з хешем вмісту (css/base.3f2a1c.css) + staticfiles.json manifest
+- стиснуті копії .gz та .br поруч з кожним файлом
+- WhiteNoise віддає файли з хешем з Cache-Control: max-age=315360000, immutable
+
+DerivativeMediaStorage: завантажені зображення + їх WebP/AVIF похідні.
+"""
+import logging
+
+from django.core.files.storage import FileSystemStorage
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+from . import image_derivatives
+
+logger = logging.getLogger(__name__)
+
+
+class SpeakUpStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    # Переписувати `import ... from './module.js'` в ES модулях на хешовані імена
+    support_js_module_import_aggregation = True
+
+    # Файл без запису в manifest (наприклад, доданий без collectstatic)
+    # віддається за оригінальним іменем замість ValueError у template
+    manifest_strict = False
+
+    def hashed_name(self, name, content=None, filename=None):
+        """
+        CSS може посилатися на файли, яких немає у static/ (fallback зображення
+        в @supports). Такі посилання залишаються як є, а не ламають collectstatic.
+        """
+        try:
+            return super().hashed_name(name, content, filename)
+        except ValueError:
+            if content is not None or self.exists(filename or name):
+                raise
+            logger.warning('Static file referenced but not found: %s', name)
+            return name
+
+
+class DerivativeMediaStorage(FileSystemStorage):
+    """
+    Media storage, який після збереження зображення генерує його WebP/AVIF
+    похідні (apps.core.image_derivatives) та записує їх у manifest.
+    Помилка генерації не заважає завантаженню - файл віддається як є.
+    """
+
+    def _save(self, name, content):
+        name = super()._save(name, content)
+        if image_derivatives.is_source(name) and image_derivatives.available_formats():
+            try:
+                image_derivatives.process_media(name, storage=self)
+            except Exception:
+                logger.exception('Cannot build image derivatives for %s', name)
+        return name
@@ -0,0 +1,74 @@
+"""
+<picture>/srcset розмітка з manifest похідних зображень (apps.core.image_derivatives).
+
+    {% load responsive_images %}
+    {% picture 'img/speak_man.png' alt='Навчання' class='program-card__image' sizes='(max-width: 767px) 90vw, 400px' %}
+    {% picture article.featured_image alt=article.title_uk class='news-item__image' %}
+    {% preload_image 'img/speak_man.png' sizes='200px' %}
+    <div data-bg-image="{% derivative_url advantage.icon 960 %}"></div>
+
+Без запису в manifest (команда build_image_derivatives ще не запускалась)
+виводиться звичайний <img> з оригіналом.
+"""
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from apps.core import image_derivatives
+
+register = template.Library()
+
+IMG_ATTRIBUTES = ('class', 'loading', 'decoding', 'fetchpriority', 'width', 'height')
+
+
+@register.simple_tag
+def picture(source, alt='', sizes='100vw', **attrs):
+    """<picture> з <source> для кожного формату та <img> з оригіналом."""
+    attrs.setdefault('loading', 'lazy')
+    attrs.setdefault('decoding', 'async')
+    img = format_html(
+        '<img src="{}" alt="{}"{}>',
+        image_derivatives.original_url(source),
+        alt,
+        format_html_join('', ' {}="{}"', (
+            (name, attrs[name]) for name in IMG_ATTRIBUTES if attrs.get(name) not in (None, '')
+        )),
+    )
+    sources = image_derivatives.srcsets(source)
+    if not sources:
+        return img
+    return format_html(
+        '<picture>{}{}</picture>',
+        format_html_join('', '<source type="{}" srcset="{}" sizes="{}">', (
+            (mime, srcset, sizes) for mime, srcset in sources
+        )),
+        img,
+    )
+
+
+@register.simple_tag
+def preload_image(source, sizes='100vw', media=''):
+    """
+    <link rel="preload" as="image"> для зображення з {% picture %}: srcset
+    найкращого формату (з type, щоб браузер без підтримки його пропустив)
+    або оригінал, якщо похідних немає.
+    """
+    media_attr = format_html(' media="{}"', media) if media else ''
+    sources = image_derivatives.srcsets(source)
+    if not sources:
+        return format_html(
+            '<link rel="preload" as="image" href="{}"{}>',
+            image_derivatives.original_url(source), media_attr,
+        )
+    mime, srcset = sources[0]
+    return format_html(
+        '<link rel="preload" as="image" imagesrcset="{}" imagesizes="{}" type="{}"{}>',
+        srcset, sizes, mime, media_attr,
+    )
+
+
+@register.simple_tag
+def derivative_url(source, width=960, fmt='webp'):
+    """URL однієї похідної (для CSS background / data-атрибутів)."""
+    if not source:
+        return ''
+    return image_derivatives.best_url(source, int(width), fmt)
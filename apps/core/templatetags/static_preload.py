@@ -0,0 +1,30 @@
+"""
+Preload підказки для CSS сторінки.
+
+Сторінкові стилі (extra_css) стоять у <head> після ~16 критичних CSS, тому
+браузер починає їх завантаження пізно. {% preload_css %} у блоці
+preload_css base.html додає <link rel="preload"> перед критичними стилями:
+
+    {% load static_preload %}
+    {% block preload_css %}{% preload_css 'css/components/news.css' 'css/components/parallax.css' %}{% endblock %}
+
+URL будуються через {% static %}, тому в production вказують на файли
+з хешем (той самий URL, що й у <link rel="stylesheet">, без повторного
+завантаження).
+"""
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html_join
+
+register = template.Library()
+
+
+@register.simple_tag
+def preload_css(*paths):
+    """<link rel="preload" as="style"> для кожного шляху (без дублікатів)."""
+    unique = dict.fromkeys(path for path in paths if path)
+    return format_html_join(
+        '\n',
+        '<link rel="preload" href="{}" as="style">',
+        ((static(path),) for path in unique),
+    )
@@ -0,0 +1,98 @@
+"""
+Інкрементальне оновлення TestimonialStats.
+
+Статистика змінюється лише коли відгук стає опублікованим / знятим з
+публікації / видаленим або змінюється рейтинг опублікованого відгуку:
+- сигнали pre_save / post_save / post_delete (apps.core.signals)
+- admin дії publish / reject (queryset.update() без сигналів)
+
+Зміни застосовуються через F() вирази, тому паралельні оновлення не
+перезаписують одне одного.
+"""
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.db.models import Count, F, Sum
+
+STATS_PK = 1
+STARS = range(1, 6)
+
+
+def rating_delta(rating: int, sign: int, count: int = 1) -> Dict[str, int]:
+    """Зміни полів статистики для count відгуків з рейтингом rating."""
+    delta = {'count': sign * count, 'rating_sum': sign * count * rating}
+    if rating in STARS:
+        delta[f'stars_{rating}'] = sign * count
+    return delta
+
+
+def merge(*deltas: Dict[str, int]) -> Dict[str, int]:
+    result: Dict[str, int] = {}
+    for delta in deltas:
+        for field, value in delta.items():
+            result[field] = result.get(field, 0) + value
+    return result
+
+
+def apply_delta(delta: Dict[str, int]) -> None:
+    """Застосовує зміни до рядка статистики (або перераховує, якщо його немає)."""
+    from .models import TestimonialStats
+
+    changes = {field: F(field) + value for field, value in delta.items() if value}
+    if not changes:
+        return
+    if not TestimonialStats.objects.filter(pk=STATS_PK).update(**changes):
+        rebuild()
+
+
+def apply_rating_counts(rows: Iterable[Tuple[int, int]], sign: int) -> None:
+    """Зміни для пар (рейтинг, кількість) - для admin дій з queryset.update()."""
+    apply_delta(merge(*(rating_delta(rating, sign, count) for rating, count in rows)))
+
+
+def rating_counts(queryset) -> list:
+    """[(рейтинг, кількість), ...] для queryset відгуків."""
+    return list(queryset.order_by().values_list('rating').annotate(n=Count('id')))
+
+
+def compute(testimonial_model) -> Dict[str, int]:
+    """Повний перерахунок статистики з таблиці відгуків."""
+    published = testimonial_model.objects.filter(is_published=True)
+    totals = published.aggregate(count=Count('id'), rating_sum=Sum('rating'))
+    values = {'count': totals['count'], 'rating_sum': totals['rating_sum'] or 0}
+    values.update({f'stars_{star}': 0 for star in STARS})
+    for rating, count in rating_counts(published):
+        if rating in STARS:
+            values[f'stars_{rating}'] = count
+    return values
+
+
+def rebuild():
+    """Перераховує статистику з нуля; повертає TestimonialStats."""
+    from .models import Testimonial, TestimonialStats
+
+    stats, _ = TestimonialStats.objects.update_or_create(pk=STATS_PK, defaults=compute(Testimonial))
+    return stats
+
+
+def get_stats():
+    """Поточна статистика (один запит по первинному ключу)."""
+    from .models import TestimonialStats
+
+    return TestimonialStats.objects.filter(pk=STATS_PK).first() or rebuild()
+
+
+def published_state(instance) -> Optional[int]:
+    """Рейтинг, який відгук вносить у статистику (None якщо не опублікований)."""
+    return instance.rating if instance.is_published else None
+
+
+def state_delta(previous: Optional[int], current: Optional[int]) -> Dict[str, int]:
+    """Зміни при переході відгуку зі стану previous у current."""
+    if previous == current:
+        return {}
+    deltas = []
+    if previous is not None:
+        deltas.append(rating_delta(previous, -1))
+    if current is not None:
+        deltas.append(rating_delta(current, +1))
+    return merge(*deltas)
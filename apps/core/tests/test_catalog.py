@@ -0,0 +1,50 @@
+"""
+Тести для локалізованого каталогу програм.
+"""
+from django.test import SimpleTestCase
+from apps.core.catalog import CATALOGS, get_catalog
+from apps.core.seo_config import PROGRAMS, LOCATIONS, CITIES
+
+
+class CatalogTest(SimpleTestCase):
+    """Тести для get_catalog"""
+
+    def test_catalog_per_language(self):
+        self.assertEqual(set(CATALOGS), {'uk', 'ru'})
+        for catalog in CATALOGS.values():
+            self.assertEqual(set(catalog.programs), set(PROGRAMS))
+            self.assertEqual(set(catalog.locations), set(LOCATIONS))
+            self.assertEqual(set(catalog.cities), set(CITIES))
+
+    def test_localized_titles(self):
+        program = PROGRAMS['individual']
+        self.assertEqual(get_catalog('uk').programs['individual']['title'], program['title'])
+        self.assertEqual(
+            get_catalog('ru').programs['individual']['title'],
+            program.get('title_ru', program['title'])
+        )
+
+    def test_unknown_language_falls_back_to_default(self):
+        self.assertIs(get_catalog('en'), get_catalog('uk'))
+
+    def test_catalog_is_immutable(self):
+        program = get_catalog('uk').programs['individual']
+        with self.assertRaises(TypeError):
+            program['title'] = 'changed'
+        self.assertIsInstance(program['includes'], tuple)
+
+    def test_categories_contain_every_program_once(self):
+        categories = get_catalog('uk').categories
+        slugs = [p['slug'] for category in categories.values() for p in category['programs']]
+        self.assertEqual(sorted(slugs), sorted(PROGRAMS))
+        self.assertEqual(list(categories)[0], 'kids')
+
+    def test_corporate_program_has_extra_sections(self):
+        corporate = get_catalog('ru').programs['corporate']
+        self.assertIn('programs', corporate)
+        self.assertIn('why_speak_up', corporate)
+
+    def test_city_locations(self):
+        for city in get_catalog('uk').cities.values():
+            for location in city['locations']:
+                self.assertIn(location['slug'], LOCATIONS)
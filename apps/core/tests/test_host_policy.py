@@ -0,0 +1,62 @@
+"""
+Тести для політики хостів (apps.core.host_policy) та AllowedHostsMiddleware.
+"""
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.core.host_policy import HostPolicy, default_host
+
+
+class HostPolicyTest(SimpleTestCase):
+    """Тести для HostPolicy"""
+
+    def setUp(self):
+        self.policy = HostPolicy(['speak-up.com.ua', '.example.com', '*.onrender.com'], cache_size=8)
+
+    def test_allowed(self):
+        for domain in ('speak-up.com.ua', 'example.com', 'a.example.com', 'speakup-zc5s.onrender.com'):
+            with self.subTest(domain=domain):
+                self.assertTrue(self.policy.is_allowed(domain))
+
+    def test_rejected(self):
+        for domain in ('evil.com', 'badexample.com', 'onrender.com', 'speak-up.com.ua.evil.com', ''):
+            with self.subTest(domain=domain):
+                self.assertFalse(self.policy.is_allowed(domain))
+
+    def test_allow_all(self):
+        for hosts in ([], ['*'], ['speak-up.com.ua', '*']):
+            with self.subTest(hosts=hosts):
+                self.assertTrue(HostPolicy(hosts).is_allowed('anything.test'))
+
+    def test_cache_bounded_under_scanning(self):
+        for i in range(100):
+            self.policy.is_allowed(f'scanner-{i}.evil.com')
+        self.assertEqual(self.policy.cache_info().currsize, 8)
+        # Точні хости не потрапляють у LRU
+        self.policy.is_allowed('speak-up.com.ua')
+        self.assertEqual(self.policy.cache_info().misses, 100)
+
+    def test_default_host(self):
+        self.assertEqual(default_host(['*', '.example.com', 'speak-up.com.ua']), 'speak-up.com.ua')
+        self.assertEqual(default_host(['*']), 'localhost')
+
+
+@override_settings(HOST_POLICY_ALLOWED_HOSTS=['testserver', '*.onrender.com'])
+class AllowedHostsMiddlewareTest(TestCase):
+    """Тести для AllowedHostsMiddleware"""
+
+    def test_allowed_host(self):
+        response = self.client.get('/wp-admin/', HTTP_HOST='speakup.onrender.com')
+        self.assertEqual(response.status_code, 410)
+
+    def test_disallowed_host(self):
+        allowed_before = list(settings.ALLOWED_HOSTS)
+        with self.assertLogs('django.security.DisallowedHost', 'ERROR'):
+            response = self.client.get('/wp-admin/', HTTP_HOST='evil.com:8000')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(settings.ALLOWED_HOSTS, allowed_before)
+
+    def test_render_healthcheck_passes(self):
+        response = self.client.get('/healthz', HTTP_HOST='10.228.0.5:10000', HTTP_USER_AGENT='Render/1.0')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'OK')
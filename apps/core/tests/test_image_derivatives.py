@@ -0,0 +1,161 @@
+"""
+Тести для похідних зображень (WebP у кількох ширинах) та {% picture %}.
+"""
+import json
+import os
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from apps.core import image_derivatives
+from apps.core.models import NewsArticle
+
+
+def png_bytes(width=1200, height=800, color=(200, 30, 30)):
+    buffer = BytesIO()
+    Image.new('RGB', (width, height), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+class DerivativesTestMixin:
+    def setUp(self):
+        self.static_root = tempfile.mkdtemp()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.static_root)
+        self.addCleanup(shutil.rmtree, self.media_root)
+        os.makedirs(os.path.join(self.static_root, 'img'))
+        overrides = override_settings(
+            STATICFILES_DIRS=[self.static_root],
+            MEDIA_ROOT=self.media_root,
+            IMAGE_DERIVATIVE_WIDTHS=(480, 960),
+            IMAGE_DERIVATIVE_FORMATS=('avif', 'webp'),
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+    def add_static(self, name, data):
+        with open(os.path.join(self.static_root, name), 'wb') as f:
+            f.write(data)
+
+    def render(self, source, **context):
+        return Template('{% load responsive_images %}' + source).render(Context(context))
+
+
+class BuildEntryTest(DerivativesTestMixin, TestCase):
+    """Тести для image_derivatives.build_entry"""
+
+    def test_target_widths(self):
+        self.assertEqual(image_derivatives.target_widths(1200), [480, 960])
+        self.assertEqual(image_derivatives.target_widths(600), [480, 600])
+        self.assertEqual(image_derivatives.target_widths(300), [300])
+
+    def test_unsupported_formats_skipped(self):
+        with self.settings(IMAGE_DERIVATIVE_FORMATS=('webp', 'nosuchformat')):
+            self.assertEqual(image_derivatives.available_formats(), ('webp',))
+
+    def test_variants_written(self):
+        storage = image_derivatives.static_storage()
+        entry = image_derivatives.build_entry(png_bytes(), storage)
+
+        self.assertEqual((entry['width'], entry['height']), (1200, 800))
+        webp = entry['variants']['webp']
+        self.assertEqual([width for width, _name in webp], [480, 960])
+        for width, name in webp:
+            self.assertTrue(name.startswith(f'derivatives/{entry["hash"][:2]}/{entry["hash"]}/'))
+            with Image.open(storage.path(name)) as image:
+                self.assertEqual(image.format, 'WEBP')
+                self.assertEqual(image.width, width)
+
+    def test_same_content_reuses_files(self):
+        storage = image_derivatives.static_storage()
+        entry = image_derivatives.build_entry(png_bytes(), storage)
+        path = storage.path(entry['variants']['webp'][0][1])
+        os.utime(path, (0, 0))
+
+        self.assertEqual(image_derivatives.build_entry(png_bytes(), storage), entry)
+        self.assertEqual(os.path.getmtime(path), 0)
+
+    def test_changed_content_new_directory(self):
+        storage = image_derivatives.static_storage()
+        first = image_derivatives.build_entry(png_bytes(), storage)
+        second = image_derivatives.build_entry(png_bytes(color=(0, 0, 255)), storage)
+        self.assertNotEqual(first['hash'], second['hash'])
+
+
+class PictureTagTest(DerivativesTestMixin, TestCase):
+    """Тести для {% picture %}, {% preload_image %} та {% derivative_url %}"""
+
+    def test_plain_img_without_manifest(self):
+        html = self.render("{% picture 'img/hero.png' alt='Герой' class='hero' %}")
+        self.assertEqual(
+            html, '<img src="/static/img/hero.png" alt="Герой" class="hero" loading="lazy" decoding="async">'
+        )
+
+    def test_picture_from_manifest(self):
+        self.add_static('img/hero.png', png_bytes())
+        call_command('build_image_derivatives', '--static-only', stdout=StringIO())
+
+        html = self.render("{% picture 'img/hero.png' sizes='50vw' loading='eager' %}")
+        self.assertTrue(html.startswith('<picture><source type="image/webp" srcset="/static/derivatives/'))
+        self.assertIn('480.webp 480w, ', html)
+        self.assertIn('960.webp 960w" sizes="50vw">', html)
+        self.assertIn('<img src="/static/img/hero.png" alt="" loading="eager" decoding="async"></picture>', html)
+
+    def test_preload_image(self):
+        self.assertEqual(
+            self.render("{% preload_image 'img/hero.png' media='(min-width: 768px)' %}"),
+            '<link rel="preload" as="image" href="/static/img/hero.png" media="(min-width: 768px)">',
+        )
+        self.add_static('img/hero.png', png_bytes())
+        call_command('build_image_derivatives', '--static-only', stdout=StringIO())
+        html = self.render("{% preload_image 'img/hero.png' sizes='200px' %}")
+        self.assertIn('imagesizes="200px" type="image/webp"', html)
+
+    def test_derivative_url(self):
+        self.add_static('img/hero.png', png_bytes())
+        call_command('build_image_derivatives', '--static-only', stdout=StringIO())
+        self.assertRegex(self.render("{% derivative_url 'img/hero.png' 600 %}"), r'/960\.webp$')
+        self.assertRegex(self.render("{% derivative_url 'img/hero.png' 2000 %}"), r'/960\.webp$')
+        self.assertEqual(self.render("{% derivative_url '' %}"), '')
+
+    def test_command_drops_removed_sources(self):
+        self.add_static('img/old.png', png_bytes())
+        call_command('build_image_derivatives', '--static-only', stdout=StringIO())
+        os.remove(os.path.join(self.static_root, 'img/old.png'))
+        call_command('build_image_derivatives', '--static-only', stdout=StringIO())
+
+        with open(os.path.join(self.static_root, image_derivatives.MANIFEST_NAME)) as f:
+            self.assertEqual(json.load(f), {})
+
+
+class DerivativeMediaStorageTest(DerivativesTestMixin, TestCase):
+    """Тести для генерації похідних при завантаженні media"""
+
+    def create_article(self, data):
+        return NewsArticle.objects.create(
+            slug_uk='stattya',
+            title_uk='Стаття',
+            content_uk='<p>Текст</p>',
+            featured_image=SimpleUploadedFile('cover.png', data, content_type='image/png'),
+        )
+
+    def test_upload_builds_derivatives(self):
+        article = self.create_article(png_bytes())
+
+        entry = image_derivatives.lookup(article.featured_image)
+        self.assertIsNotNone(entry)
+        html = self.render("{% picture article.featured_image alt='x' %}", article=article)
+        self.assertIn('/media/derivatives/', html)
+        self.assertIn(f'<img src="/media/{article.featured_image.name}"', html)
+
+    def test_broken_upload_still_saved(self):
+        with self.assertLogs('apps.core.storage', level='ERROR'):
+            article = self.create_article(b'not an image')
+        self.assertTrue(os.path.exists(os.path.join(self.media_root, article.featured_image.name)))
+        self.assertIsNone(image_derivatives.lookup(article.featured_image))
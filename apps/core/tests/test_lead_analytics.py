@@ -0,0 +1,146 @@
+"""
+Тести для денних підсумків заявок (apps.leads.analytics, LeadDailyStat).
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.core.models import ConsultationRequest
+from apps.leads import analytics
+from apps.leads.ingestion import bulk_ingest
+from apps.leads.models import LeadDailyStat, TrialLesson
+
+
+class ClassifySourceTest(TestCase):
+    """Тести для classify_source"""
+
+    def test_groups(self):
+        self.assertEqual(analytics.classify_source('Google', 'cpc'), LeadDailyStat.SOURCE_GOOGLE)
+        self.assertEqual(analytics.classify_source('fb', ''), LeadDailyStat.SOURCE_FACEBOOK)
+        self.assertEqual(analytics.classify_source('instagram', 'social'), LeadDailyStat.SOURCE_INSTAGRAM)
+        self.assertEqual(analytics.classify_source('', ''), LeadDailyStat.SOURCE_ORGANIC)
+        self.assertEqual(analytics.classify_source('tiktok', 'cpc'), LeadDailyStat.SOURCE_OTHER)
+
+    def test_click_id_only(self):
+        self.assertEqual(analytics.classify_source('', '', gclid='Cj0KCQjw1234'), LeadDailyStat.SOURCE_GOOGLE)
+        self.assertEqual(analytics.classify_source('', '', fbclid='IwAR0abc'), LeadDailyStat.SOURCE_FACEBOOK)
+
+    def test_gclid_only_lead_rollup(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            TrialLesson.objects.create(name='A', phone='+380501111111', gclid='Cj0KCQjw1234')
+        self.assertEqual(LeadDailyStat.objects.get().source_group, LeadDailyStat.SOURCE_GOOGLE)
+
+
+class RollupTest(TestCase):
+    """Підсумки оновлюються після commit заявок і збігаються з rebuild"""
+
+    def create_leads(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            TrialLesson.objects.create(name='A', phone='+380501111111', utm_source='google', utm_medium='cpc', utm_campaign='spring')
+            TrialLesson.objects.create(name='B', phone='+380502222222', utm_source='google', utm_medium='cpc', utm_campaign='spring')
+            ConsultationRequest.objects.create(phone='+380503333333', utm_source='instagram')
+            bulk_ingest(TrialLesson, [
+                {'name': 'C', 'phone': '+380504444444', 'created_at': timezone.now() - timedelta(days=3)},
+            ])
+
+    def stats(self):
+        return sorted(LeadDailyStat.objects.values_list(*analytics.KEY_FIELDS, 'count'))
+
+    def test_incremental_matches_rebuild(self):
+        self.create_leads()
+        today = timezone.localdate()
+        spring = LeadDailyStat.objects.get(utm_campaign='spring')
+        self.assertEqual((spring.date, spring.lead_type, spring.source_group, spring.count),
+                         (today, LeadDailyStat.LEAD_TYPE_TRIAL, LeadDailyStat.SOURCE_GOOGLE, 2))
+        self.assertEqual(LeadDailyStat.objects.get(source_group=LeadDailyStat.SOURCE_INSTAGRAM).lead_type,
+                         LeadDailyStat.LEAD_TYPE_CONSULTATION)
+        self.assertEqual(LeadDailyStat.objects.get(utm_source='', lead_type='trial').date, today - timedelta(days=3))
+
+        incremental = self.stats()
+        LeadDailyStat.objects.all().delete()
+        out = StringIO()
+        call_command('rebuild_lead_stats', stdout=out)
+        self.assertIn('Перераховано заявок: 4', out.getvalue())
+        self.assertEqual(self.stats(), incremental)
+
+    def test_not_recorded_before_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            TrialLesson.objects.create(name='A', phone='+380501111111')
+            self.assertFalse(LeadDailyStat.objects.exists())
+        callbacks[0]()
+        self.assertEqual(LeadDailyStat.objects.get().count, 1)
+
+    def test_update_does_not_count(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            lead = TrialLesson.objects.create(name='A', phone='+380501111111')
+            lead.name = 'B'
+            lead.save()
+        self.assertEqual(LeadDailyStat.objects.get().count, 1)
+
+    def test_rebuild_period(self):
+        old = datetime(2024, 5, 1, 12, 0, tzinfo=dt_timezone.utc)
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_ingest(TrialLesson, [{'name': 'A', 'phone': '+380501111111', 'created_at': old}])
+            TrialLesson.objects.create(name='B', phone='+380502222222')
+        LeadDailyStat.objects.update(count=100)
+
+        call_command('rebuild_lead_stats', '--start', '2024-05-01', '--end', '2024-05-01', stdout=StringIO())
+        self.assertEqual(LeadDailyStat.objects.get(date=old.date()).count, 1)
+        # Поза періодом - без змін
+        self.assertEqual(LeadDailyStat.objects.get(date=timezone.localdate()).count, 100)
+
+
+class ReportTest(TestCase):
+    """Тести для report, JSON endpoint та admin дашборду"""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        with self.captureOnCommitCallbacks(execute=True):
+            TrialLesson.objects.create(name='A', phone='+380501111111', utm_source='google', utm_medium='cpc', utm_campaign='spring')
+            ConsultationRequest.objects.create(phone='+380503333333')
+
+    def test_report(self):
+        today = timezone.localdate()
+        data = analytics.report(today - timedelta(days=6), today)
+        self.assertEqual(data['total'], 2)
+        self.assertEqual(data['by_day'], [{'date': today.isoformat(), 'trial': 1, 'consultation': 1, 'total': 2}])
+        self.assertEqual(data['by_campaign'], [{'campaign': 'spring', 'count': 1}])
+        self.assertEqual({row['source'] for row in data['by_source']}, {'google', 'organic'})
+
+        # Звіт з кешу без запитів; нова заявка - нова версія кешу
+        with self.assertNumQueries(0):
+            analytics.report(today - timedelta(days=6), today)
+        with self.captureOnCommitCallbacks(execute=True):
+            TrialLesson.objects.create(name='B', phone='+380502222222')
+        self.assertEqual(analytics.report(today - timedelta(days=6), today)['total'], 3)
+
+    def test_json_endpoint(self):
+        url = reverse('leads:lead_analytics')
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        self.client.force_login(self.admin)
+        response = self.client.get(url, {'days': 7})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['total'], 2)
+        self.assertEqual(self.client.get(url, {'start': '2024-13-01'}).status_code, 400)
+        self.assertEqual(self.client.get(url, {'start': '2024-05-02', 'end': '2024-05-01'}).status_code, 400)
+
+    def test_admin_dashboard(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(reverse('admin:leads_leaddailystat_changelist'), {'days': 30})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['report']['total'], 2)
+        self.assertContains(response, 'spring')
+
+    def test_lead_changelist_source_column(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            TrialLesson.objects.create(name='C', phone='+380504444444', utm_source='tiktok', utm_medium='cpc', utm_campaign='c1')
+        self.client.force_login(self.admin)
+        response = self.client.get(reverse('admin:leads_triallesson_changelist'))
+        self.assertContains(response, '📊 <strong>tiktok</strong> (c1)', html=False)
+        self.assertContains(response, '💰 Платна реклама')
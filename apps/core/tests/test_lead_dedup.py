@@ -0,0 +1,61 @@
+"""
+Тести для об'єднання повторних заявок (phone_normalized, LEAD_DEDUP_WINDOW_MINUTES).
+"""
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.core.models import ConsultationRequest
+from apps.leads.ingestion import bulk_ingest
+from apps.leads.models import LeadNotification, TrialLesson
+
+
+class PhoneNormalizedTest(TestCase):
+    """phone_normalized заповнюється при save() та bulk_ingest"""
+
+    def test_save(self):
+        lead = TrialLesson.objects.create(name='A', phone='+380501234567')
+        self.assertEqual(lead.phone_normalized, '+380501234567')
+
+    def test_bulk_ingest(self):
+        result = bulk_ingest(TrialLesson, [{'name': 'A', 'phone': '+380501234567'}])
+        self.assertEqual(TrialLesson.objects.get(pk=result.created[0].pk).phone_normalized, '+380501234567')
+
+
+@override_settings(LEAD_DEDUP_WINDOW_MINUTES=10)
+class DedupTest(TestCase):
+    """Повторна відправка форми з того ж номера"""
+
+    def submit(self, phone):
+        return self.client.post(reverse('leads:submit_trial_form'), {'name': 'Іван', 'phone': phone})
+
+    def test_repeat_submission_merged(self):
+        self.assertEqual(self.submit('050 123 45 67').status_code, 200)
+        self.assertEqual(self.submit('+38 (050) 123-45-67').status_code, 200)
+
+        lead = TrialLesson.objects.get()
+        self.assertEqual(lead.submission_count, 2)
+        self.assertIsNotNone(lead.last_submitted_at)
+        # Нотифікація лише про першу заявку
+        self.assertEqual(LeadNotification.objects.filter(lead=lead, channel=LeadNotification.CHANNEL_EMAIL).count(), 1)
+
+    def test_window_expired(self):
+        self.submit('0501234567')
+        TrialLesson.objects.update(created_at=timezone.now() - timedelta(minutes=11))
+        self.submit('0501234567')
+        self.assertEqual(TrialLesson.objects.count(), 2)
+
+    def test_other_phone_and_model(self):
+        self.submit('0501234567')
+        self.submit('0501234568')
+        self.client.post(reverse('core:submit_consultation'), {'phone': '0501234567', 'selected_pricing': 'standard'})
+        self.assertEqual(TrialLesson.objects.count(), 2)
+        self.assertEqual(ConsultationRequest.objects.count(), 1)
+
+    @override_settings(LEAD_DEDUP_WINDOW_MINUTES=0)
+    def test_disabled(self):
+        self.submit('0501234567')
+        self.submit('0501234567')
+        self.assertEqual(TrialLesson.objects.count(), 2)
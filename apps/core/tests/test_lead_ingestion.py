@@ -0,0 +1,130 @@
+"""
+Тести для єдиного шляху запису заявок (apps.leads.ingestion).
+"""
+import json
+import shutil
+import tempfile
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from apps.leads.ingestion import bulk_ingest, extract_attribution, metrics
+from apps.leads.models import ConsultationRequest, LeadNotification, TrialLesson
+
+
+class ExtractAttributionTest(TestCase):
+    """Тести для extract_attribution"""
+
+    def test_query_string_wins_and_values_truncated(self):
+        request = RequestFactory().post(
+            '/x/?utm_source=google&gclid=' + 'g' * 300,
+            {'utm_source': 'facebook', 'utm_medium': ' cpc ', 'fbclid': 'fb'},
+            HTTP_REFERER='https://example.com/page', REMOTE_ADDR='10.0.0.1',
+        )
+        data = extract_attribution(request, TrialLesson)
+        self.assertEqual(data['utm_source'], 'google')
+        self.assertEqual(data['utm_medium'], 'cpc')
+        self.assertEqual(data['fbclid'], 'fb')
+        self.assertEqual(len(data['gclid']), 200)
+        self.assertEqual(data['utm_term'], '')
+        self.assertEqual(data['referrer'], 'https://example.com/page')
+        self.assertEqual(data['ip_address'], '10.0.0.1')
+
+
+class IngestViewsTest(TestCase):
+    """Обидва endpoint'и пишуть заявки через ingest"""
+
+    def setUp(self):
+        metrics.reset()
+
+    def test_trial_form(self):
+        response = self.client.post(
+            reverse('leads:submit_trial_form') + '?utm_campaign=spring',
+            {'name': 'Іван', 'phone': '050 123 45 67', 'utm_source': 'google'},
+            HTTP_REFERER='https://speak-up.com.ua/',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('lead-save;dur=', response['Server-Timing'])
+        lead = TrialLesson.objects.get()
+        self.assertEqual((lead.phone, lead.utm_source, lead.utm_campaign), ('+380501234567', 'google', 'spring'))
+        self.assertEqual(lead.referrer, 'https://speak-up.com.ua/')
+        self.assertTrue(LeadNotification.objects.filter(lead=lead).exists())
+        self.assertEqual(metrics.snapshot()['total']['count'], 1)
+
+    def test_trial_form_invalid(self):
+        response = self.client.post(reverse('leads:submit_trial_form'), {'name': 'Іван', 'phone': '123'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('phone', response.json()['errors'])
+        self.assertIn('lead-validate;dur=', response['Server-Timing'])
+        self.assertFalse(TrialLesson.objects.exists())
+
+    def test_consultation_form(self):
+        response = self.client.post(
+            reverse('core:submit_consultation') + '?utm_source=instagram',
+            {'phone': '0501234567', 'selected_pricing': 'standard', 'utm_content': 'ignored'},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['HX-Redirect'], reverse('core:thank_you'))
+        consultation = ConsultationRequest.objects.get()
+        self.assertEqual(consultation.utm_source, 'instagram')
+        self.assertEqual(consultation.utm_content, 'pricing:standard')
+
+    def test_consultation_form_invalid(self):
+        response = self.client.post(reverse('core:submit_consultation'), {'phone': ''})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(ConsultationRequest.objects.exists())
+
+
+class BulkIngestTest(TestCase):
+    """Тести для bulk_ingest та replay_leads"""
+
+    def test_bulk_ingest(self):
+        created_at = datetime(2024, 5, 1, 12, 0, tzinfo=dt_timezone.utc)
+        saved = []
+        result = bulk_ingest(TrialLesson, [
+            {'name': 'A', 'phone': '+380501111111', 'created_at': created_at},
+            {'name': 'B', 'phone': 'bad'},
+            {'name': 'C', 'phone': '+380502222222'},
+        ], batch_size=1, on_saved=saved.extend)
+
+        self.assertEqual(len(result.created), 2)
+        self.assertEqual([index for index, _ in result.invalid], [1])
+        self.assertIn('phone', result.invalid[0][1])
+        self.assertEqual(len(saved), 2)
+        self.assertEqual(TrialLesson.objects.get(name='A').created_at, created_at)
+        self.assertIn('bulk_save', result.timings)
+
+    def test_replay_command(self):
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp)
+        source = tmp / 'leads.jsonl'
+        source.write_text('\n'.join([
+            json.dumps({'name': 'A', 'phone': '+380501111111', 'created_at': '2024-05-01T12:00:00+00:00'}),
+            '',
+            json.dumps({'name': 'B', 'phone': 'bad'}),
+        ]))
+        out, err = StringIO(), StringIO()
+        call_command('replay_leads', str(source), '--notify', stdout=out, stderr=err)
+        self.assertIn('Записано: 1, відхилено: 1', out.getvalue())
+        self.assertIn('Рядок 3', err.getvalue())
+        self.assertEqual(LeadNotification.objects.count(), 1)
+
+    def test_replay_rejects_malformed_rows(self):
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp)
+        source = tmp / 'leads.jsonl'
+        valid = json.dumps({'name': 'A', 'phone': '+380501111111'})
+        cases = [
+            ('[1, 2]', 'очікується JSON об\'єкт'),
+            (json.dumps({'name': 'B', 'created_at': '2024-02-30T12:00:00'}), 'некоректна дата'),
+            (json.dumps({'name': 'B', 'created_at': 'вчора'}), 'created_at має бути у форматі ISO 8601'),
+        ]
+        for line, message in cases:
+            source.write_text(f'{valid}\n{line}\n')
+            with self.assertRaisesMessage(CommandError, f'Рядок 2: {message}'):
+                call_command('replay_leads', str(source), stdout=StringIO())
+        self.assertFalse(TrialLesson.objects.exists())
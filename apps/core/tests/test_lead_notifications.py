@@ -0,0 +1,138 @@
+"""
+Тести для outbox нотифікацій про заявки (apps.leads.notifications).
+"""
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core import mail
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.leads.models import LeadNotification, TrialLesson
+from apps.leads.notifications import NotificationWorker, enqueue
+
+
+class FlakyChannel:
+    """Канал, що падає для заданих заявок."""
+
+    def __init__(self, failing_leads=()):
+        self.failing_leads = set(failing_leads)
+        self.delivered = []
+
+    def deliver(self, notifications):
+        errors = {}
+        for notification in notifications:
+            if notification.lead_id in self.failing_leads:
+                errors[notification.pk] = 'boom'
+            else:
+                self.delivered.append(notification.lead_id)
+        return errors
+
+
+@override_settings(
+    LEAD_NOTIFICATION_EMAILS=['admin@example.com'],
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    TELEGRAM_BOT_TOKEN='', TELEGRAM_CHAT_ID='',
+)
+class LeadNotificationTest(TestCase):
+    """Тести для enqueue / NotificationWorker / send_lead_notifications"""
+
+    def create_lead(self, phone='+380501234567'):
+        return TrialLesson.objects.create(name='Іван', phone=phone)
+
+    def test_submit_does_not_deliver_inline(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/leads/api/trial-form/', {'name': 'Іван', 'phone': '0501234567'})
+        self.assertEqual(response.status_code, 200)
+
+        statements = [query['sql'].split()[0] for query in queries.captured_queries]
+        writes = [statement for statement in statements if statement in ('INSERT', 'UPDATE', 'DELETE')]
+        self.assertEqual(writes, ['INSERT', 'INSERT'])  # заявка + outbox, без UPDATE email_sent
+        self.assertEqual(len(mail.outbox), 0)
+        notification = LeadNotification.objects.get()
+        self.assertEqual(notification.channel, LeadNotification.CHANNEL_EMAIL)
+        self.assertFalse(notification.lead.email_sent)
+
+    def test_enqueue_idempotent(self):
+        lead = self.create_lead()
+        enqueue(lead)
+        enqueue(lead)
+        self.assertEqual(LeadNotification.objects.count(), 1)
+
+    @override_settings(TELEGRAM_BOT_TOKEN='token', TELEGRAM_CHAT_ID='42')
+    def test_enqueue_telegram_when_configured(self):
+        enqueue(self.create_lead())
+        self.assertEqual(
+            sorted(LeadNotification.objects.values_list('channel', flat=True)),
+            [LeadNotification.CHANNEL_EMAIL, LeadNotification.CHANNEL_TELEGRAM],
+        )
+
+    def test_worker_sends_batch(self):
+        leads = [self.create_lead(f'+38050123456{i}') for i in range(3)]
+        for lead in leads:
+            enqueue(lead)
+
+        stats = NotificationWorker().run_once()
+
+        self.assertEqual((stats.claimed, stats.sent), (3, 3))
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertIn('+380501234560', mail.outbox[0].body)
+        self.assertEqual(LeadNotification.objects.filter(status=LeadNotification.STATUS_SENT).count(), 3)
+        lead = TrialLesson.objects.get(pk=leads[0].pk)
+        self.assertTrue(lead.email_sent)
+        self.assertIsNotNone(lead.notified_at)
+        # Відправлене не відправляється повторно
+        self.assertEqual(NotificationWorker().run_once().claimed, 0)
+
+    @override_settings(LEAD_NOTIFICATION_MAX_ATTEMPTS=2)
+    def test_retry_with_backoff_then_failed(self):
+        ok, bad = self.create_lead('+380501111111'), self.create_lead('+380502222222')
+        enqueue(ok)
+        enqueue(bad)
+        channel = FlakyChannel(failing_leads=[bad.pk])
+        worker = NotificationWorker(channels={LeadNotification.CHANNEL_EMAIL: channel})
+
+        stats = worker.run_once()
+        self.assertEqual((stats.sent, stats.retried), (1, 1))
+        failed = LeadNotification.objects.get(lead=bad)
+        self.assertEqual((failed.status, failed.attempts, failed.last_error), ('pending', 1, 'boom'))
+        self.assertGreater(failed.available_at, timezone.now())
+        # До закінчення затримки не забирається
+        self.assertEqual(worker.run_once().claimed, 0)
+
+        LeadNotification.objects.filter(pk=failed.pk).update(available_at=timezone.now())
+        stats = worker.run_once()
+        self.assertEqual(stats.failed, 1)
+        self.assertEqual(LeadNotification.objects.get(pk=failed.pk).status, LeadNotification.STATUS_FAILED)
+        self.assertEqual(channel.delivered, [ok.pk])
+
+    def test_claim_leases_rows(self):
+        enqueue(self.create_lead())
+        worker = NotificationWorker()
+        self.assertEqual(len(worker.claim()), 1)
+        # Оренда: інший воркер не бачить рядок, поки не мине LEAD_NOTIFICATION_LEASE
+        self.assertEqual(worker.claim(), [])
+        LeadNotification.objects.update(available_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(len(worker.claim()), 1)
+
+    @override_settings(TELEGRAM_BOT_TOKEN='token', TELEGRAM_CHAT_ID='42')
+    def test_telegram_channel(self):
+        lead = self.create_lead()
+        enqueue(lead, [LeadNotification.CHANNEL_TELEGRAM])
+        with mock.patch('apps.leads.notifications.requests.Session.post') as post:
+            post.return_value.raise_for_status.return_value = None
+            stats = NotificationWorker().run_once()
+        self.assertEqual(stats.sent, 1)
+        self.assertEqual(post.call_args.kwargs['json']['chat_id'], '42')
+        self.assertTrue(TrialLesson.objects.get(pk=lead.pk).telegram_sent)
+
+    def test_command(self):
+        enqueue(self.create_lead())
+        out = StringIO()
+        call_command('send_lead_notifications', stdout=out)
+        self.assertIn('Відправлено: 1', out.getvalue())
+        self.assertEqual(len(mail.outbox), 1)
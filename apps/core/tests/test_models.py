@@ -11,6 +11,45 @@ class BaseModelTestCase(TestCase):
         pass
 
 
-
-
-
+class NewsArticleListProjectionTestCase(TestCase):
+    """Тести для анонсу та NewsArticle.objects.for_list()."""
+
+    def setUp(self):
+        from apps.core.models import NewsArticle
+
+        self.article = NewsArticle.objects.create(
+            slug_uk='stattya',
+            title_uk='Стаття',
+            content_uk='<p>' + 'слово ' * 100 + '</p>',
+            meta_description_uk=' '.join(f'w{i}' for i in range(40)),
+            content_ru='<p>Русский <b>текст</b></p>',
+        )
+
+    def test_excerpt_generated_on_save(self):
+        self.assertEqual(self.article.excerpt_uk, ' '.join(f'w{i}' for i in range(30)) + ' …')
+        # Без meta description - текст контенту без HTML
+        self.assertEqual(self.article.excerpt_ru, 'Русский текст')
+
+    def test_excerpt_updated_with_update_fields(self):
+        from apps.core.models import NewsArticle
+
+        self.article.meta_description_uk = 'Новий опис'
+        self.article.save(update_fields=['meta_description_uk'])
+        self.assertEqual(NewsArticle.objects.get(pk=self.article.pk).excerpt_uk, 'Новий опис')
+
+    def test_for_list_defers_content(self):
+        from apps.core.models import NewsArticle
+
+        article = NewsArticle.objects.published().for_list().get()
+        self.assertEqual(
+            article.get_deferred_fields() & {'content_uk', 'content_ru'},
+            {'content_uk', 'content_ru'},
+        )
+        with self.assertNumQueries(0):
+            article.title_uk, article.excerpt_uk, article.featured_image, article.published_at
+            article.get_absolute_url()
+
+    def test_news_list_renders_excerpt(self):
+        response = self.client.get('/news/')
+        self.assertContains(response, 'w29 …')
+        self.assertNotContains(response, 'слово слово')
@@ -0,0 +1,208 @@
+"""
+Тести для імпорту news статей (apps.core.news_import) з локальним HTTP сервером.
+"""
+import shutil
+import tempfile
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO, StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from apps.core.models import NewsArticle
+from apps.core.news_import import (
+    CONFLICT_SUFFIX,
+    Checkpoint,
+    NewsImporter,
+    parse_article,
+)
+
+
+def png_bytes():
+    buffer = BytesIO()
+    Image.new('RGB', (8, 8), (10, 20, 30)).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+PNG = png_bytes()
+
+
+def article_page(title, body, date='05.03.2021'):
+    return f'''<html><head>
+<meta name="description" content="{title} опис">
+<link rel="canonical" href="https://example.com/news/x/">
+</head><body><h1>{title}</h1><div class="entry-date">{date}</div>
+<img class="attachment-post wp-post-image" src="/wp-content/uploads/cover.png">
+<div class="entry-content">{body}</div></body></html>'''
+
+
+class FixtureSite:
+    """Локальний HTTP сервер з фіксованими сторінками; рахує запити."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.hits = Counter()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                site.hits[self.path] += 1
+                page = site.pages.get(self.path)
+                if page is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                content_type, body = page
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def html(text):
+    return ('text/html; charset=utf-8', text.encode())
+
+
+SHARED_IMAGE = '<p>Текст <img class="wp-image-5 aligncenter" src="/wp-content/uploads/shared-300x200.png"></p>'
+
+PAGES = {
+    '/news/first/': html(article_page('Перша', SHARED_IMAGE)),
+    '/ru/news/first/': html(article_page('Первая', SHARED_IMAGE)),
+    '/news/second/': html(article_page('Друга', SHARED_IMAGE + '<p>ще</p>')),
+    '/news/harkov/': html(article_page('Харків', '<p>місто</p>')),
+    '/wp-content/uploads/cover.png': ('image/png', PNG),
+    '/wp-content/uploads/shared-300x200.png': ('image/png', PNG),
+}
+
+
+class ParseArticleTest(TestCase):
+    """Тести для parse_article"""
+
+    def test_parse(self):
+        data = parse_article(article_page('Заголовок', '<p>Тіло</p>'), '/news/slug/', 'http://x/news/slug/')
+        self.assertEqual(data['title'], 'Заголовок')
+        self.assertEqual(data['slug'], 'slug')
+        self.assertEqual(data['meta_description'], 'Заголовок опис')
+        self.assertEqual(data['published_date'].strftime('%Y-%m-%d'), '2021-03-05')
+        self.assertEqual(data['featured_image_url'], '/wp-content/uploads/cover.png')
+        self.assertIn('<p>Тіло</p>', data['content_html'])
+
+
+class NewsImporterTest(TestCase):
+    """Тести для NewsImporter проти локального сервера"""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        overrides = override_settings(MEDIA_ROOT=self.media_root, IMAGE_DERIVATIVE_FORMATS=())
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.checkpoint_path = Path(self.media_root) / 'checkpoint.json'
+
+    def run_import(self, site, urls, **kwargs):
+        importer = NewsImporter(
+            base_url=site.url,
+            checkpoint=Checkpoint(self.checkpoint_path),
+            workers=4,
+            batch_size=kwargs.pop('batch_size', 10),
+            max_retries=0,
+            log=lambda message: None,
+            **kwargs,
+        )
+        return importer.run(urls)
+
+    def test_imports_articles_in_bulk(self):
+        with FixtureSite(PAGES) as site:
+            with self.assertNumQueries(5):
+                # 2 запити existing slugs + savepoint/insert/release
+                stats = self.run_import(site, ['/news/first/', '/news/second/'])
+
+        self.assertEqual(stats.imported, 2)
+        first = NewsArticle.objects.get(slug_uk='first')
+        self.assertEqual(first.title_ru, 'Первая')
+        self.assertEqual(first.slug_ru, 'first')
+        self.assertTrue(first.excerpt_uk)
+        self.assertTrue(first.featured_image.name.startswith('news/images/'))
+        self.assertNotIn('wp-image-5', first.content_uk)
+        self.assertIn('src="/media/news/images/', first.content_uk)
+        self.assertNotIn('/wp-content/', first.content_ru)
+        second = NewsArticle.objects.get(slug_uk='second')
+        self.assertIsNone(second.slug_ru)
+
+    def test_images_downloaded_once(self):
+        with FixtureSite(PAGES) as site:
+            stats = self.run_import(site, ['/news/first/', '/news/second/'])
+        self.assertEqual(site.hits['/wp-content/uploads/shared-300x200.png'], 1)
+        self.assertEqual(site.hits['/wp-content/uploads/cover.png'], 1)
+        self.assertEqual(stats.images_downloaded, 2)
+
+    def test_resume_from_checkpoint(self):
+        with FixtureSite(PAGES) as site:
+            self.run_import(site, ['/news/first/'])
+            NewsArticle.objects.all().delete()
+            stats = self.run_import(site, ['/news/first/', '/news/second/'])
+
+        # first уже в checkpoint - не завантажується повторно
+        self.assertEqual(site.hits['/news/first/'], 1)
+        self.assertEqual(stats.imported, 1)
+        self.assertEqual(stats.images_reused, 2)
+        self.assertEqual(site.hits['/wp-content/uploads/shared-300x200.png'], 1)
+
+    def test_failed_article_retried(self):
+        with FixtureSite({}) as site:
+            stats = self.run_import(site, ['/news/first/'])
+        self.assertEqual(stats.failed, 1)
+        with FixtureSite(PAGES) as site:
+            stats = self.run_import(site, ['/news/first/'])
+        self.assertEqual(stats.imported, 1)
+
+    def test_existing_slug_skipped_without_fetch(self):
+        NewsArticle.objects.create(slug_uk='first', title_uk='Є', content_uk='<p>x</p>')
+        with FixtureSite(PAGES) as site:
+            stats = self.run_import(site, ['/news/first/'])
+        self.assertEqual(stats.skipped, 1)
+        self.assertEqual(site.hits['/news/first/'], 0)
+
+    def test_conflict_skip(self):
+        with FixtureSite(PAGES) as site:
+            stats = self.run_import(site, ['/news/harkov/'])
+        self.assertEqual(stats.conflicts, 1)
+        self.assertFalse(NewsArticle.objects.exists())
+
+    def test_conflict_suffix(self):
+        with FixtureSite(PAGES) as site:
+            stats = self.run_import(site, ['/news/harkov/'], conflict_policy=CONFLICT_SUFFIX)
+        self.assertEqual(stats.imported, 1)
+        self.assertTrue(NewsArticle.objects.filter(slug_uk='harkov-news', old_url_uk='/news/harkov/').exists())
+
+    def test_command(self):
+        urls_file = Path(self.media_root) / 'urls.txt'
+        urls_file.write_text('/news/first/\n\n/news/second/\n')
+        out = StringIO()
+        with FixtureSite(PAGES) as site:
+            call_command(
+                'import_news', '--urls-file', str(urls_file), '--base-url', site.url,
+                '--checkpoint', str(self.checkpoint_path), stdout=out,
+            )
+        self.assertIn('Імпортовано: 2', out.getvalue())
+        self.assertTrue(self.checkpoint_path.exists())
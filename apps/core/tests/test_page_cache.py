@@ -0,0 +1,107 @@
+"""
+Тести для FullPageCacheMiddleware.
+"""
+import re
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, Client, override_settings
+
+from apps.core import running_line
+from apps.core.models import RunningLineText
+
+
+@override_settings(FULL_PAGE_CACHE_ENABLED=True)
+class FullPageCacheTest(TestCase):
+    """Тести для кешу сторінок анонімних відвідувачів"""
+
+    url = '/programs/individual'
+
+    def setUp(self):
+        cache.clear()
+        running_line.invalidate()
+        self.client = Client()
+
+    def test_miss_then_hit(self):
+        first = self.client.get(self.url)
+        second = self.client.get(self.url)
+        self.assertEqual(first['X-Page-Cache'], 'MISS')
+        self.assertEqual(second['X-Page-Cache'], 'HIT')
+        self.assertEqual(second.status_code, 200)
+
+    def test_hit_without_queries(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+    def test_csrf_token_per_request(self):
+        self.client.get(self.url)
+        client = Client(enforce_csrf_checks=True)
+        response = client.get(self.url)
+        self.assertEqual(response['X-Page-Cache'], 'HIT')
+
+        content = response.content.decode()
+        self.assertNotIn('__page_cache_csrf_token__', content)
+        meta_token = re.search(r'<meta name="csrf-token" content="([A-Za-z0-9]+)"', content).group(1)
+        self.assertIn('csrftoken', response.cookies)
+
+        # Токен з закешованої сторінки проходить CSRF перевірку
+        post = client.post('/leads/api/trial-form/', {
+            'csrfmiddlewaretoken': meta_token, 'name': 'Іван', 'phone': '+380501234567',
+        })
+        self.assertNotEqual(post.status_code, 403)
+
+    def test_language_and_host_in_key(self):
+        uk = self.client.get(self.url)
+        ru = self.client.get('/ru' + self.url)
+        self.assertEqual(ru['X-Page-Cache'], 'MISS')
+        self.assertIn('<html lang="ru">', ru.content.decode())
+        self.assertIn('<html lang="uk">', uk.content.decode())
+
+        with self.settings(ALLOWED_HOSTS=['example.com', 'testserver']):
+            other = self.client.get(self.url, HTTP_HOST='example.com')
+        self.assertEqual(other['X-Page-Cache'], 'MISS')
+
+    def test_bypass(self):
+        self.client.get(self.url)
+        cases = [
+            {'path': self.url + '?utm_source=google'},
+            {'path': self.url + '?gclid=abc'},
+            {'path': self.url + '?fbclid=abc'},
+            {'path': self.url, 'HTTP_HX_REQUEST': 'true'},
+        ]
+        for case in cases:
+            with self.subTest(case=case):
+                response = self.client.get(**case)
+                self.assertEqual(response.status_code, 200)
+                self.assertFalse(response.has_header('X-Page-Cache'))
+
+    def test_bypass_authenticated(self):
+        self.client.get(self.url)
+        user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'pass')
+        self.client.force_login(user)
+        self.assertFalse(self.client.get(self.url).has_header('X-Page-Cache'))
+
+    def test_not_cached_views(self):
+        self.client.get('/')
+        self.assertFalse(self.client.get('/').has_header('X-Page-Cache'))
+        self.assertEqual(self.client.get('/programs/invalid').status_code, 404)
+        self.assertFalse(self.client.get('/programs/invalid').has_header('X-Page-Cache'))
+
+    def test_running_line_change_invalidates(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            RunningLineText.objects.create(text='Нова акція')
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Page-Cache'], 'MISS')
+        self.assertContains(response, 'Нова акція')
+
+    def test_healthcheck_still_first(self):
+        self.client.get(self.url)
+        response = self.client.get('/', HTTP_USER_AGENT='Render/1.0')
+        self.assertEqual(response.content, b'OK')
+
+    @override_settings(FULL_PAGE_CACHE_ENABLED=False)
+    def test_disabled(self):
+        self.client.get(self.url)
+        self.assertFalse(self.client.get(self.url).has_header('X-Page-Cache'))
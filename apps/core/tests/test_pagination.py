@@ -0,0 +1,113 @@
+"""
+Тести для keyset пагінації новин та відгуків.
+"""
+import base64
+from datetime import timedelta
+
+from django.http import Http404, QueryDict
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.core.models import NewsArticle, Testimonial
+from apps.core.pagination import KeysetPaginator, decode_cursor, encode_cursor, AFTER
+
+
+class KeysetPaginatorTest(TestCase):
+    """Тести для KeysetPaginator"""
+
+    def setUp(self):
+        now = timezone.now()
+        # 25 статей; дві пари з однаковою датою (перевірка tie-break по id)
+        for i in range(25):
+            NewsArticle.objects.create(
+                slug_uk=f'stattya-{i}',
+                title_uk=f'Стаття {i}',
+                content_uk='<p>Текст</p>',
+                meta_description_uk='Опис',
+                published_at=now - timedelta(days=i // 2),
+            )
+        self.expected = list(
+            NewsArticle.objects.published().order_by('-published_at', '-id').values_list('pk', flat=True)
+        )
+        self.paginator = KeysetPaginator(NewsArticle.objects.published(), 'published_at', per_page=10)
+
+    def _page(self, query=''):
+        return self.paginator.get_page(QueryDict(query))
+
+    def test_walk_forward_and_back(self):
+        page1 = self._page()
+        page2 = self._page(page1.next_querystring)
+        page3 = self._page(page2.next_querystring)
+
+        self.assertEqual([a.pk for a in page1], self.expected[:10])
+        self.assertEqual([a.pk for a in page2], self.expected[10:20])
+        self.assertEqual([a.pk for a in page3], self.expected[20:])
+        self.assertEqual((page2.number, page3.number), (2, 3))
+        self.assertFalse(page3.has_next())
+
+        back = self._page(page3.previous_querystring)
+        self.assertEqual([a.pk for a in back], self.expected[10:20])
+        self.assertEqual(back.number, 2)
+        self.assertTrue(back.has_previous())
+        self.assertEqual(page2.previous_querystring, 'page=1')
+
+    def test_legacy_page_param(self):
+        page = self._page('page=2')
+        self.assertEqual([a.pk for a in page], self.expected[10:20])
+        self.assertTrue(page.has_previous())
+        self.assertTrue(page.has_next())
+
+    def test_keyset_page_without_offset_or_count(self):
+        page1 = self._page()
+        with self.assertNumQueries(1) as context:
+            self._page(page1.next_querystring)
+        sql = context.captured_queries[0]['sql'].upper()
+        self.assertNotIn('OFFSET', sql)
+        self.assertNotIn('COUNT(', sql)
+
+    def test_invalid_params(self):
+        self.assertEqual(self._page('page=abc').number, 1)
+        self.assertEqual([a.pk for a in self._page('cursor=broken')], self.expected[:10])
+        with self.assertRaises(Http404):
+            self._page('page=100')
+
+    def test_cursor_roundtrip(self):
+        value = timezone.now()
+        self.assertEqual(decode_cursor(encode_cursor(AFTER, value, 7)), (AFTER, value, 7))
+
+    def test_crafted_cursor_falls_back_to_first_page(self):
+        crafted = [
+            'a|0001-01-01T00:00:00|1',
+            'a|0001-01-01T00:00:00+05:00|1',
+            f'a|{timezone.now().isoformat()}|{10 ** 30}',
+            f'a|{timezone.now().isoformat()}|0',
+        ]
+        for raw in crafted:
+            token = base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+            self.assertIsNone(decode_cursor(token), raw)
+            self.assertEqual([a.pk for a in self._page(f'cursor={token}')], self.expected[:10])
+
+    def test_num_pages_from_count(self):
+        paginator = KeysetPaginator(NewsArticle.objects.published(), 'published_at', per_page=10, count=25)
+        self.assertEqual(paginator.get_page(QueryDict('')).num_pages, 3)
+
+
+class FeedViewsPaginationTest(TestCase):
+    """Пагінація на сторінках новин та відгуків"""
+
+    def test_news_list_next_link(self):
+        for i in range(12):
+            NewsArticle.objects.create(
+                slug_uk=f'stattya-{i}', title_uk=f'Стаття {i}',
+                content_uk='<p>Текст</p>', meta_description_uk='Опис',
+            )
+        response = self.client.get('/news/')
+        self.assertContains(response, '?page=2&amp;cursor=')
+        self.assertEqual(self.client.get('/news/?page=2').status_code, 200)
+
+    def test_feedback_pages(self):
+        for i in range(11):
+            Testimonial.objects.create(name=f'Клієнт {i}', text='Відгук', rating=5, is_published=True)
+        response = self.client.get('/feedback/')
+        self.assertContains(response, 'Сторінка 1 з 2')
+        self.assertEqual(len(response.context['page_obj']), 10)
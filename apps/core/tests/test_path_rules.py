@@ -0,0 +1,104 @@
+"""
+Тести для правил шляхів (apps.core.path_rules) та WordPressBlockMiddleware.
+"""
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.core.path_rules import GONE, REDIRECT, TARPIT, WORDPRESS_PATHS, PathRule, PathRules
+
+
+def legacy_blocked(path):
+    """Перевірка як у WordPressBlockMiddleware до компіляції правил."""
+    return any(path.startswith(p) for p in WORDPRESS_PATHS) or (path.startswith('/wp-') and path.endswith('.php'))
+
+
+class PathRulesTest(SimpleTestCase):
+    """Тести для PathRules"""
+
+    def rules(self, *rules, **kwargs):
+        return PathRules(PathRule.from_dict(rule, **kwargs) for rule in rules)
+
+    @override_settings(PATH_RULES=[], PATH_RULES_BLOCK_WORDPRESS=True)
+    def test_wordpress_rules_match_legacy_check(self):
+        rules = PathRules.from_settings()
+        paths = [
+            '/', '/news/', '/wp-content/uploads/a.jpg', '/wp-admin', '/wp-admin/',
+            '/wp-login.php', '/wp-login.php?x', '/wp-anything.php', '/wp-x/y.php',
+            '/wp-', '/xmlrpc.php', '/readme.html', '/programs/wp-content/', '/license.txt.bak',
+        ]
+        for path in paths:
+            with self.subTest(path=path):
+                self.assertEqual(rules.match(path) is not None, legacy_blocked(path))
+
+    def test_first_rule_wins(self):
+        rules = self.rules(
+            {'exact': '/old/', 'action': REDIRECT, 'target': '/new/'},
+            {'prefix': '/old/', 'action': GONE},
+        )
+        self.assertEqual(rules.match('/old/').action, REDIRECT)
+        self.assertEqual(rules.match('/old/page').action, GONE)
+        self.assertIsNone(rules.match('/older'))
+
+    def test_regex_rule(self):
+        rules = self.rules({'regex': r'/.*\.env\Z', 'action': TARPIT, 'status': 404}, default_delay=0)
+        rule = rules.match('/config/.env')
+        self.assertEqual(rule.status, 404)
+        self.assertIsNone(rules.match('/.env.example'))
+
+    def test_regex_with_own_groups(self):
+        rules = self.rules(
+            {'prefix': '/a/', 'action': GONE},
+            {'regex': r'/(?P<lang>uk|ru)/old/', 'action': REDIRECT, 'target': '/new/'},
+        )
+        self.assertEqual(rules.match('/ru/old/x').action, REDIRECT)
+        self.assertEqual(rules.match('/a/b').action, GONE)
+
+    def test_empty(self):
+        self.assertIsNone(PathRules([]).match('/wp-admin/'))
+
+    def test_invalid_rules(self):
+        for rule in (
+            {'action': GONE},
+            {'prefix': '/a', 'exact': '/a'},
+            {'prefix': '/a', 'action': 'explode'},
+            {'prefix': '/a', 'action': REDIRECT},
+        ):
+            with self.subTest(rule=rule), self.assertRaises(ImproperlyConfigured):
+                PathRule.from_dict(rule)
+        with self.assertRaises(ImproperlyConfigured):
+            self.rules({'regex': '/(', 'action': GONE})
+
+    def test_tarpit_delay(self):
+        rule = PathRule.from_dict({'prefix': '/scan', 'action': TARPIT}, default_delay=1.5)
+        with mock.patch('apps.core.path_rules.time.sleep') as sleep:
+            response = rule.response()
+        sleep.assert_called_once_with(1.5)
+        self.assertEqual(response.status_code, 410)
+
+
+class WordPressBlockMiddlewareTest(TestCase):
+    """Тести для WordPressBlockMiddleware"""
+
+    def test_wordpress_gone(self):
+        for path in ('/wp-admin/', '/wp-content/uploads/2021/03/a.jpg', '/wp-foo.php', '/xmlrpc.php'):
+            with self.subTest(path=path):
+                response = self.client.get(path)
+                self.assertEqual(response.status_code, 410)
+                self.assertEqual(response['Content-Type'], 'text/plain')
+
+    @override_settings(PATH_RULES=[
+        {'prefix': '/old-blog/', 'action': REDIRECT, 'target': '/news/'},
+        {'exact': '/wp-admin/', 'action': 'not_found'},
+    ])
+    def test_settings_rules(self):
+        response = self.client.get('/old-blog/post/')
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response['Location'], '/news/')
+        self.assertEqual(self.client.get('/wp-admin/').status_code, 404)
+        self.assertEqual(self.client.get('/wp-admin/edit.php').status_code, 410)
+
+    @override_settings(PATH_RULES_BLOCK_WORDPRESS=False)
+    def test_wordpress_block_disabled(self):
+        self.assertNotEqual(self.client.get('/wp-admin/').status_code, 410)
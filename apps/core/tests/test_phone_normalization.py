@@ -0,0 +1,122 @@
+"""
+Тести для нормалізації телефонів (apps.leads.utils).
+
+Властивісні тести: випадкові номери (фіксований seed) порівнюються з
+попередньою реалізацією normalize_phone_number - результат і текст помилки
+мають збігатися для кожного входу.
+"""
+import random
+
+from django import forms
+from django.test import SimpleTestCase
+
+from apps.leads.utils import normalize_many, normalize_phone_number, phone_key
+
+
+def legacy_normalize_phone_number(phone):  # noqa: C901
+    """Попередня реалізація normalize_phone_number (еталон поведінки)."""
+    if not phone:
+        return phone
+
+    phone = phone.strip()
+    if not phone:
+        return phone
+
+    phone_clean = phone.replace(' ', '').replace('(', '').replace(')', '').replace('-', '')
+    has_plus = phone_clean.startswith('+')
+    digits = ''.join(filter(str.isdigit, phone_clean))
+
+    if not digits:
+        raise forms.ValidationError("Введіть коректний український номер телефону")
+
+    if has_plus and phone_clean.startswith('+380'):
+        if len(digits) >= 3:
+            phone_digits = digits[3:] if len(digits) > 3 else digits
+            if len(phone_digits) == 9:
+                phone = '+380' + phone_digits
+            else:
+                raise forms.ValidationError("Введіть коректний український номер телефону (9 цифр після +380)")
+        else:
+            raise forms.ValidationError("Введіть коректний український номер телефону")
+    elif len(digits) == 12 and digits.startswith('380'):
+        phone = '+380' + digits[3:]
+    elif len(digits) == 11 and digits.startswith('38'):
+        phone = '+380' + digits[2:]
+    elif len(digits) == 10 and digits.startswith('0'):
+        phone = '+380' + digits[1:]
+    elif len(digits) == 9:
+        phone = '+380' + digits
+    else:
+        raise forms.ValidationError("Введіть коректний український номер телефону")
+
+    if not phone.startswith('+380') or len(phone) != 13:
+        raise forms.ValidationError("Номер має містити 9 цифр після коду +380")
+
+    return phone
+
+
+PREFIXES = ['', '+', '+380', '380', '38', '0', '+38', '+7', '8', '(0', '+3 80', '+(380)']
+NOISE = [' ', ' ', '-', '(', ')', '.', '/', '\t', '+', 'x', '٣', '²', ' ']
+
+
+def random_phone(rng):
+    """Номер у «людському» форматі: префікс, цифри, роздільники та сміття."""
+    body = ''.join(rng.choice('0123456789') for _ in range(rng.choice([0, 1, 7, 8, 9, 9, 9, 10, 11, 12])))
+    chars = list(rng.choice(PREFIXES) + body)
+    for _ in range(rng.choice([0, 0, 1, 2, 4])):
+        chars.insert(rng.randint(0, len(chars)), rng.choice(NOISE))
+    return ''.join(chars)
+
+
+def outcome(func, phone):
+    try:
+        return 'ok', func(phone)
+    except forms.ValidationError as e:
+        return 'error', e.messages
+
+
+class NormalizePhoneNumberTest(SimpleTestCase):
+    """Тести для normalize_phone_number"""
+
+    def test_formats(self):
+        for phone in ['+380501234567', '380501234567', '38501234567', '0501234567', '501234567',
+                      ' +38 (050) 123-45-67 ', '(050) 123 45 67']:
+            self.assertEqual(normalize_phone_number(phone), '+380501234567', phone)
+
+    def test_errors(self):
+        with self.assertRaisesMessage(forms.ValidationError, '9 цифр після +380'):
+            normalize_phone_number('+38050123456')
+        with self.assertRaisesMessage(forms.ValidationError, 'Введіть коректний український номер телефону'):
+            normalize_phone_number('12345')
+
+    def test_empty_values_returned_as_is(self):
+        self.assertIsNone(normalize_phone_number(None))
+        self.assertEqual(normalize_phone_number(''), '')
+        self.assertEqual(normalize_phone_number('   '), '')
+
+    def test_matches_legacy_implementation(self):
+        rng = random.Random(20240501)
+        for _ in range(20000):
+            phone = random_phone(rng)
+            self.assertEqual(outcome(normalize_phone_number, phone), outcome(legacy_normalize_phone_number, phone), repr(phone))
+
+    def test_idempotent(self):
+        rng = random.Random(7)
+        for _ in range(2000):
+            normalized = phone_key(random_phone(rng))
+            if normalized:
+                self.assertEqual(normalize_phone_number(normalized), normalized)
+
+
+class NormalizeManyTest(SimpleTestCase):
+    """Тести для normalize_many"""
+
+    def test_matches_single_calls(self):
+        rng = random.Random(42)
+        phones = [random_phone(rng) for _ in range(5000)] + [None, '', '  ']
+        expected = [phone_key(phone) for phone in phones]
+        self.assertEqual(normalize_many(phones), expected)
+        self.assertEqual(normalize_many(phones * 2), expected * 2)
+
+    def test_invalid_value(self):
+        self.assertEqual(normalize_many(['0501234567', 'bad', None], invalid=None), ['+380501234567', None, None])
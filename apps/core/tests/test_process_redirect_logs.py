@@ -0,0 +1,109 @@
+"""
+Тести для батчевої відправки redirect logs в GTM.
+"""
+import json
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from apps.core.utils.gtm_sender import GTMBatchSender, TokenBucket
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class GTMBatchSenderTest(SimpleTestCase):
+    """Тести для GTMBatchSender"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dead_letter = Path(self.tmp.name) / 'dead.log'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _sender(self, session, **kwargs):
+        return GTMBatchSender(
+            container_url='https://gtm.example.com',
+            measurement_id='G-TEST',
+            api_secret='secret',
+            dead_letter_file=self.dead_letter,
+            rate=0,
+            backoff=0,
+            session=session,
+            **kwargs
+        )
+
+    def test_events_grouped_into_multi_event_payloads(self):
+        session = mock.Mock()
+        session.post.return_value = FakeResponse(204)
+        records = [{'old_url': f'/old-{i}/', 'new_url': '/'} for i in range(60)]
+
+        stats = self._sender(session, workers=4).send(records)
+
+        self.assertEqual(stats.sent, 60)
+        self.assertEqual(stats.requests, 3)
+        sizes = sorted(len(c.kwargs['json']['events']) for c in session.post.call_args_list)
+        self.assertEqual(sizes, [10, 25, 25])
+
+    def test_retry_then_dead_letter(self):
+        session = mock.Mock()
+        session.post.return_value = FakeResponse(503)
+
+        stats = self._sender(session, max_retries=2).send([{'old_url': '/old/'}])
+
+        self.assertEqual(stats.failed, 1)
+        self.assertEqual(session.post.call_count, 3)
+        with open(self.dead_letter) as f:
+            self.assertEqual(json.loads(f.readline())['old_url'], '/old/')
+
+    def test_client_error_not_retried(self):
+        session = mock.Mock()
+        session.post.return_value = FakeResponse(400)
+
+        stats = self._sender(session, max_retries=3).send([{'old_url': '/old/'}])
+
+        self.assertEqual(stats.failed, 1)
+        self.assertEqual(session.post.call_count, 1)
+
+    def test_token_bucket_limits_rate(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        # 1 токен одразу + 5 токенів по 20ms
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+class ProcessRedirectLogsCommandTest(SimpleTestCase):
+    """Тести для management command process_redirect_logs"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.logs_dir = Path(self.tmp.name) / 'logs'
+        self.logs_dir.mkdir()
+        self.log_file = self.logs_dir / 'redirects.log'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_streams_log_and_archives(self):
+        with open(self.log_file, 'w') as f:
+            for i in range(30):
+                f.write(json.dumps({'old_url': f'/old-{i}/', 'new_url': '/'}) + '\n')
+            f.write('not json\n')
+
+        out = StringIO()
+        with override_settings(BASE_DIR=self.tmp.name, GTM_SERVER_CONTAINER_URL='https://gtm.example.com'):
+            with mock.patch.object(GTMBatchSender, '_build_session') as build_session:
+                build_session.return_value.post.return_value = FakeResponse(200)
+                call_command('process_redirect_logs', '--rate=0', stdout=out, stderr=StringIO())
+
+        self.assertIn('Processed 31 redirects (Success: 30, Errors: 1)', out.getvalue())
+        self.assertFalse(self.log_file.exists())
+        self.assertEqual(len(list((self.logs_dir / 'processed').iterdir())), 1)
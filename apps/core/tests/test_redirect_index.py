@@ -0,0 +1,98 @@
+"""
+Тести для in-memory індексу редиректів.
+"""
+from django.test import TestCase, Client, override_settings
+from apps.core.models import NewsArticle
+from apps.core.redirect_index import RedirectIndex, redirect_index, normalize_path
+
+
+class RedirectIndexTest(TestCase):
+    """Тести для RedirectIndex"""
+
+    def setUp(self):
+        redirect_index.invalidate()
+        self.article = NewsArticle.objects.create(
+            slug_uk='new-slug',
+            slug_ru='new-slug-ru',
+            title_uk='Стаття',
+            content_uk='<p>Текст</p>',
+            meta_description_uk='Опис',
+            old_url_uk='/news/old-slug/',
+            old_url_ru='/news/old-slug-ru/',
+        )
+
+    def test_normalize_path(self):
+        self.assertEqual(normalize_path('/'), '/')
+        self.assertEqual(normalize_path('/home/'), '/home')
+        self.assertEqual(normalize_path('/home'), '/home')
+
+    def test_static_redirect_slash_variants(self):
+        index = RedirectIndex()
+        for path in ['/home', '/home/', '/product/misyacz-bezlimitu/', '/product/misyacz-bezlimitu']:
+            with self.subTest(path=path):
+                target = index.lookup(path)
+                self.assertIsNotNone(target)
+                self.assertEqual(target.redirect_type, 'static')
+
+    def test_news_redirect_uk_and_ru_old_urls(self):
+        index = RedirectIndex()
+        for path in ['/news/old-slug/', '/news/old-slug', '/news/old-slug-ru/']:
+            with self.subTest(path=path):
+                target = index.lookup(path)
+                self.assertEqual(target.redirect_type, 'news')
+                self.assertEqual(target.url_for('uk'), '/news/new-slug/')
+                self.assertEqual(target.url_for('ru'), '/ru/news/new-slug-ru/')
+
+    def test_lookup_without_queries(self):
+        index = RedirectIndex()
+        index.warm()
+        with self.assertNumQueries(0):
+            index.lookup('/news/old-slug/')
+            index.lookup('/news/unknown/')
+            index.lookup('/about')
+
+    def test_invalidated_on_article_change(self):
+        redirect_index.warm()
+        self.article.old_url_uk = '/news/another-old-slug/'
+        self.article.save()
+        self.assertIsNotNone(redirect_index.lookup('/news/another-old-slug/'))
+        self.assertIsNone(redirect_index.lookup('/news/old-slug/'))
+
+        self.article.delete()
+        self.assertIsNone(redirect_index.lookup('/news/another-old-slug/'))
+
+    @override_settings(REDIRECT_INDEX_TTL=0)
+    def test_ttl_forces_rebuild(self):
+        index = RedirectIndex()
+        index.warm()
+        NewsArticle.objects.filter(pk=self.article.pk).update(old_url_uk='/news/bulk-updated/')
+        self.assertIsNotNone(index.lookup('/news/bulk-updated/'))
+
+
+class NewsRedirectMiddlewareTest(TestCase):
+    """Тести для NewsRedirectMiddleware поверх індексу"""
+
+    def setUp(self):
+        redirect_index.invalidate()
+        self.client = Client()
+        NewsArticle.objects.create(
+            slug_uk='new-slug',
+            title_uk='Стаття',
+            content_uk='<p>Текст</p>',
+            meta_description_uk='Опис',
+            old_url_uk='/news/old-slug/',
+        )
+
+    def test_static_redirect(self):
+        response = self.client.get('/home/')
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response['Location'], '/')
+
+    def test_news_redirect(self):
+        response = self.client.get('/news/old-slug/')
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response['Location'], '/news/new-slug/')
+
+    def test_no_redirect_loop_for_target_path(self):
+        response = self.client.get('/programs/toefl')
+        self.assertEqual(response.status_code, 200)
@@ -22,6 +22,8 @@ class RedirectLoggerTest(TestCase):
             self.log_file.unlink()
 
     def tearDown(self):
+        # Дочекатися writer thread, щоб записи не потрапили в наступний тест
+        self.logger.flush()
         # Очищаємо лог файл після тесту
         if self.log_file.exists():
             self.log_file.unlink()
@@ -123,3 +125,47 @@ class RedirectLoggerTest(TestCase):
 
         data = json.loads(lines[0])
         self.assertEqual(len(data['user_agent']), 200)
+
+    @override_settings(GTM_TRACKING_ENABLED=True)
+    def test_single_writer_thread_batches_records(self):
+        """Перевіряє що всі записи пише один writer thread батчами."""
+        import threading
+
+        request = self.factory.get('/old-url/')
+        for i in range(100):
+            self.logger.log_redirect(
+                request=request,
+                old_url=f'/old-{i}/',
+                new_url='/new/',
+                redirect_type='test'
+            )
+
+        writers = [t for t in threading.enumerate() if t is self.logger._writer]
+        self.assertEqual(len(writers), 1)
+        self.assertTrue(self.logger.flush())
+
+        with open(self.log_file, 'r') as f:
+            lines = f.readlines()
+
+        self.assertEqual(len(lines), 100)
+        self.assertEqual(json.loads(lines[-1])['old_url'], '/old-99/')
+
+    @override_settings(GTM_TRACKING_ENABLED=True)
+    def test_full_queue_drops_with_counter(self):
+        """Перевіряє що при переповненій черзі записи відкидаються з лічильником."""
+        from unittest import mock
+
+        logger = AsyncRedirectLogger(queue_size=2)
+        request = self.factory.get('/old-url/')
+
+        # Без writer thread черга не спорожнюється
+        with mock.patch.object(logger, '_ensure_writer'):
+            for _ in range(5):
+                logger.log_redirect(
+                    request=request,
+                    old_url='/old/',
+                    new_url='/new/',
+                    redirect_type='test'
+                )
+
+        self.assertEqual(logger.dropped, 3)
@@ -0,0 +1,79 @@
+"""
+Тести для кешу бігучої стрічки.
+"""
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.core import running_line
+from apps.core.models import RunningLineText
+from apps.leads.context_processors import running_line_context
+
+
+class RunningLineCacheTest(TestCase):
+    """Тести для get_running_line_texts та інвалідації"""
+
+    def setUp(self):
+        cache.clear()
+        running_line.invalidate()
+        self.first = RunningLineText.objects.create(text='Знижка 10%', order=1)
+        RunningLineText.objects.create(text='Нова група', order=2)
+        RunningLineText.objects.create(text='Неактивний', order=0, is_active=False)
+
+    def test_active_texts_in_order(self):
+        self.assertEqual(running_line.get_running_line_texts(), ('Знижка 10%', 'Нова група'))
+
+    def test_second_call_without_queries(self):
+        running_line.get_running_line_texts()
+        with self.assertNumQueries(0):
+            running_line.get_running_line_texts()
+
+    def test_shared_cache_used_after_local_reset(self):
+        """Інший процес (порожній локальний кеш) бере список з CACHES без SQL."""
+        running_line.get_running_line_texts()
+        running_line._local = None
+        with self.assertNumQueries(0):
+            self.assertEqual(running_line.get_running_line_texts(), ('Знижка 10%', 'Нова група'))
+
+    def test_save_invalidates(self):
+        running_line.get_running_line_texts()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first.text = 'Знижка 20%'
+            self.first.save()
+        self.assertEqual(running_line.get_running_line_texts(), ('Знижка 20%', 'Нова група'))
+
+    def test_delete_invalidates(self):
+        running_line.get_running_line_texts()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first.delete()
+        self.assertEqual(running_line.get_running_line_texts(), ('Нова група',))
+
+    def test_missing_version_key(self):
+        """Витіснений ключ версії не повертає старий список."""
+        running_line.get_running_line_texts()
+        cache.delete(running_line.VERSION_KEY)
+        RunningLineText.objects.filter(pk=self.first.pk).update(text='Оновлено')
+        self.assertEqual(running_line.get_running_line_texts()[0], 'Оновлено')
+
+    @override_settings(RUNNING_LINE_CACHE_TIMEOUT=0)
+    def test_local_copy_expires(self):
+        """Зміна в обхід сигналів видна після RUNNING_LINE_CACHE_TIMEOUT."""
+        running_line.get_running_line_texts()
+        RunningLineText.objects.filter(pk=self.first.pk).update(text='Оновлено')
+        self.assertEqual(running_line.get_running_line_texts()[0], 'Оновлено')
+
+    def test_context_processor(self):
+        context = running_line_context(RequestFactory().get('/'))
+        self.assertEqual(list(context['running_line_texts']), ['Знижка 10%', 'Нова група'])
+        self.assertEqual(context['running_line_text'], 'Знижка 10%')
+
+    def test_warm_homepage_without_running_line_query(self):
+        client = Client()
+        client.get(reverse('core:index'))
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse('core:index'))
+        self.assertContains(response, 'Знижка 10%')
+        for query in queries:
+            self.assertNotIn('leads_runninglinetext', query['sql'])
@@ -0,0 +1,107 @@
+"""
+Тести для кешу canonical / hreflang шляхів.
+"""
+from unittest import mock
+
+from django.test import TestCase, RequestFactory
+from django.urls import translate_url
+from django.utils import translation
+
+from apps.core.context_processors import seo_context
+from apps.core.models import NewsArticle
+from apps.core.seo_urls import SeoUrlCache, seo_url_cache
+
+
+def reference_seo_urls(request):
+    """Оригінальна логіка seo_context (до кешу) для порівняння."""
+    path = request.path.rstrip('/') if request.path != '/' else '/'
+    canonical_url = request.build_absolute_uri(path)
+    hreflang_urls = []
+    for lang_code in ['uk', 'ru']:
+        try:
+            translated_path = translate_url(path, lang_code)
+            translated_path = translated_path.rstrip('/') if translated_path != '/' else '/'
+            hreflang_urls.append({'lang': lang_code, 'url': request.build_absolute_uri(translated_path)})
+        except Exception:
+            hreflang_urls.append({'lang': lang_code, 'url': canonical_url})
+    return canonical_url, hreflang_urls
+
+
+class SeoUrlCacheTest(TestCase):
+    """Тести для SeoUrlCache та seo_context"""
+
+    PATHS = [
+        ('uk', '/'),
+        ('ru', '/ru/'),
+        ('uk', '/programs/individual/'),
+        ('ru', '/ru/programs/individual'),
+        ('uk', '/school/poznyaki'),
+        ('uk', '/harkov'),
+        ('uk', '/news/stattya'),
+        ('ru', '/ru/news/statya/'),
+        ('uk', '/not-a-route/'),
+        ('uk', '/news/%D1%82%D0%B5%D1%81%D1%82'),
+    ]
+
+    def setUp(self):
+        seo_url_cache.invalidate()
+        self.factory = RequestFactory()
+        NewsArticle.objects.create(
+            slug_uk='stattya',
+            slug_ru='statya',
+            title_uk='Стаття',
+            content_uk='<p>Текст</p>',
+            meta_description_uk='Опис',
+        )
+
+    def _context(self, lang, path, **extra):
+        request = self.factory.get(path, **extra)
+        with translation.override(lang):
+            return request, seo_context(request), reference_seo_urls(request)
+
+    def test_matches_original_logic(self):
+        for lang, path in self.PATHS:
+            with self.subTest(path=path):
+                _request, context, (canonical_url, hreflang_urls) = self._context(lang, path)
+                self.assertEqual(context['canonical_url'], canonical_url)
+                self.assertEqual(context['hreflang_urls'], hreflang_urls)
+
+    def test_host_and_scheme_not_cached(self):
+        with self.settings(ALLOWED_HOSTS=['example.com']):
+            _request, context, _ref = self._context('uk', '/programs/individual', HTTP_HOST='example.com')
+        self.assertEqual(context['canonical_url'], 'http://example.com/programs/individual')
+
+        _request, context, _ref = self._context('uk', '/programs/individual', secure=True)
+        self.assertEqual(context['canonical_url'], 'https://testserver/programs/individual')
+        self.assertTrue(all(item['url'].startswith('https://testserver/') for item in context['hreflang_urls']))
+
+    def test_sitemap_and_news_paths_precomputed(self):
+        cache = SeoUrlCache()
+        with mock.patch('apps.core.seo_urls.translate_url', wraps=translate_url) as translate:
+            cache.get('uk', '/')
+            translate.reset_mock()
+            cache.get('uk', '/programs/individual')
+            cache.get('ru', '/ru/programs/individual')
+            cache.get('uk', '/news/stattya')
+            cache.get('ru', '/ru/news/statya')
+        translate.assert_not_called()
+
+    def test_lru_for_other_paths(self):
+        cache = SeoUrlCache()
+        cache.get('uk', '/')
+        with mock.patch('apps.core.seo_urls.translate_url', wraps=translate_url) as translate:
+            first = cache.get('uk', '/not-a-route')
+            second = cache.get('uk', '/not-a-route')
+        self.assertEqual(first, second)
+        self.assertEqual(translate.call_count, 2)  # uk + ru, лише один раз
+
+    def test_article_save_invalidates_cache(self):
+        seo_url_cache.get('uk', '/')
+        article = NewsArticle.objects.get(slug_uk='stattya')
+        article.slug_uk = 'stattya-new'
+        article.save()
+
+        seo_url_cache.get('uk', '/')
+        with mock.patch('apps.core.seo_urls.translate_url', wraps=translate_url) as translate:
+            seo_url_cache.get('uk', '/news/stattya-new')
+        translate.assert_not_called()
@@ -0,0 +1,81 @@
+"""
+Тести для sitemap: готові location, кеш XML та conditional GET.
+"""
+from django.core.cache import cache
+from django.test import TestCase, Client
+
+from apps.core.models import NewsArticle
+from apps.core.sitemaps import NewsSitemap, SpeakUpSitemap
+
+
+class SitemapTest(TestCase):
+    """Тести для SpeakUpSitemap / NewsSitemap / cached_sitemap"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.article = NewsArticle.objects.create(
+            slug_uk='stattya',
+            slug_ru='statya',
+            title_uk='Стаття',
+            content_uk='<p>Текст</p>',
+            meta_description_uk='Опис',
+        )
+        NewsArticle.objects.create(
+            slug_uk='tilky-uk',
+            title_uk='Стаття 2',
+            content_uk='<p>Текст</p>',
+            meta_description_uk='Опис',
+        )
+
+    def test_news_locations(self):
+        locations = [(item['lang'], item['location']) for item in NewsSitemap().items()]
+        self.assertIn(('uk', '/news/stattya/'), locations)
+        self.assertIn(('ru', '/ru/news/statya/'), locations)
+        self.assertIn(('uk', '/news/tilky-uk/'), locations)
+        self.assertEqual(len(locations), 3)
+
+    def test_news_items_skip_content(self):
+        with self.assertNumQueries(1):
+            items = NewsSitemap().items()
+        self.assertTrue(items)
+
+    def test_static_locations_both_languages(self):
+        locations = {item['location'] for item in SpeakUpSitemap().items()}
+        self.assertIn('/', locations)
+        self.assertIn('/ru/', locations)
+
+    def test_sitemap_contains_news(self):
+        response = self.client.get('/sitemap.xml')
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'http://testserver/ru/news/statya/')
+        self.assertEqual(response['X-Robots-Tag'], 'noindex, noodp, noarchive')
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+    def test_conditional_get_not_modified(self):
+        etag = self.client.get('/sitemap.xml')['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get('/sitemap.xml', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_cached_xml_reused(self):
+        first = self.client.get('/sitemap.xml')
+        with self.assertNumQueries(1):
+            second = self.client.get('/sitemap.xml')
+        self.assertEqual(first.content, second.content)
+
+    def test_article_change_updates_etag(self):
+        etag = self.client.get('/sitemap.xml')['ETag']
+        self.article.slug_ru = 'statya-nova'
+        self.article.save()
+
+        response = self.client.get('/sitemap.xml', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '/ru/news/statya-nova/')
+
+    def test_section(self):
+        response = self.client.get('/sitemap-news.xml')
+        self.assertContains(response, '/news/stattya/')
+        self.assertNotContains(response, '/programs/')
+        self.assertEqual(self.client.get('/sitemap-missing.xml').status_code, 404)
@@ -0,0 +1,88 @@
+"""
+Тести для static storage з хешами та тегу preload_css.
+"""
+import json
+import os
+import shutil
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.storage import SpeakUpStaticFilesStorage
+
+
+class PreloadCssTagTest(SimpleTestCase):
+    """Тести для {% preload_css %}"""
+
+    def render(self, source):
+        return Template('{% load static_preload %}' + source).render(Context())
+
+    def test_preload_links(self):
+        html = self.render("{% preload_css 'css/a.css' 'css/b.css' %}")
+        self.assertEqual(
+            html,
+            '<link rel="preload" href="/static/css/a.css" as="style">\n'
+            '<link rel="preload" href="/static/css/b.css" as="style">',
+        )
+
+    def test_duplicates_and_empty_skipped(self):
+        html = self.render("{% preload_css 'css/a.css' '' 'css/a.css' %}")
+        self.assertEqual(html.count('rel="preload"'), 1)
+
+    def test_escapes_path(self):
+        html = self.render("{% preload_css 'css/a\"b.css' %}")
+        self.assertNotIn('a"b', html)
+
+
+class SpeakUpStaticFilesStorageTest(SimpleTestCase):
+    """Тести для manifest storage (collectstatic post_process)"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.storage = SpeakUpStaticFilesStorage(location=self.root, base_url='/static/')
+
+    def collect(self, files):
+        for name, content in files.items():
+            self.storage.save(name, ContentFile(content.encode()))
+        paths = {name: (self.storage, name) for name in files}
+        processed = list(self.storage.post_process(paths))
+        errors = [result for result in processed if isinstance(result[2], Exception)]
+        self.assertEqual(errors, [])
+        with open(os.path.join(self.root, 'staticfiles.json')) as f:
+            return json.load(f)['paths']
+
+    def read(self, name):
+        with open(os.path.join(self.root, name)) as f:
+            return f.read()
+
+    def test_hashed_names_and_compressed_copies(self):
+        manifest = self.collect({
+            'img/bg.png': 'png' * 200,
+            'css/page.css': 'body { background: url("../img/bg.png"); }' * 20,
+        })
+        hashed_css = manifest['css/page.css']
+        self.assertRegex(hashed_css, r'^css/page\.[0-9a-f]{12}\.css$')
+        self.assertIn(manifest['img/bg.png'].split('/')[-1], self.read(hashed_css))
+        self.assertTrue(os.path.exists(os.path.join(self.root, hashed_css + '.gz')))
+
+    def test_missing_css_reference_kept(self):
+        """Посилання на відсутній файл не ламає collectstatic"""
+        with self.assertLogs('apps.core.storage', level='WARNING'):
+            manifest = self.collect({'css/page.css': 'body { background: url("../img/missing.png"); }'})
+        self.assertIn('../img/missing.png', self.read(manifest['css/page.css']))
+
+    def test_js_module_imports_rewritten(self):
+        manifest = self.collect({
+            'js/dep.js': 'export const x = 1;',
+            'js/app.js': "import { x } from './dep.js';\nconsole.log(x);",
+        })
+        hashed_dep = manifest['js/dep.js'].split('/')[-1]
+        self.assertIn(f'"./{hashed_dep}"', self.read(manifest['js/app.js']))
+
+    @override_settings(STATIC_URL='/static/')
+    def test_unknown_file_served_by_original_name(self):
+        self.collect({'css/page.css': 'body {}'})
+        self.assertEqual(self.storage.url('css/not-collected.css'), '/static/css/not-collected.css')
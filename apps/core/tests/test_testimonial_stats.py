@@ -0,0 +1,123 @@
+"""
+Тести для матеріалізованої статистики відгуків.
+"""
+from io import StringIO
+
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth import get_user_model
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, RequestFactory
+
+from apps.core.admin import TestimonialAdmin
+from apps.core.models import Testimonial, TestimonialStats
+from apps.core.testimonial_stats import compute, get_stats
+
+
+class TestimonialStatsTest(TestCase):
+    """Тести для TestimonialStats та інкрементальних оновлень"""
+
+    def assertStatsConsistent(self):
+        stats = TestimonialStats.objects.get()
+        expected = compute(Testimonial)
+        for field, value in expected.items():
+            self.assertEqual(getattr(stats, field), value, field)
+        return stats
+
+    def _create(self, rating=5, is_published=True):
+        return Testimonial.objects.create(name='Клієнт', text='Відгук', rating=rating, is_published=is_published)
+
+    def test_publish_unpublish_delete(self):
+        first = self._create(rating=5)
+        self._create(rating=3)
+        draft = self._create(rating=1, is_published=False)
+        stats = self.assertStatsConsistent()
+        self.assertEqual((stats.count, stats.avg_rating), (2, 4.0))
+
+        draft.is_published = True
+        draft.save()
+        self.assertEqual(self.assertStatsConsistent().stars_1, 1)
+
+        first.rating = 4
+        first.save()
+        self.assertEqual(self.assertStatsConsistent().stars_4, 1)
+
+        first.is_published = False
+        first.save()
+        self.assertEqual(self.assertStatsConsistent().count, 2)
+
+        draft.delete()
+        self.assertEqual(self.assertStatsConsistent().count, 1)
+
+    def test_repeated_save_does_not_double_count(self):
+        testimonial = self._create()
+        testimonial.save()
+        testimonial.save()
+        self.assertEqual(self.assertStatsConsistent().count, 1)
+
+    def test_admin_actions(self):
+        drafts = [self._create(rating=r, is_published=False) for r in (2, 4, 4)]
+        self._create(rating=5)
+        user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'pass')
+        request = RequestFactory().post('/admin/')
+        request.user = user
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        admin = TestimonialAdmin(Testimonial, AdminSite())
+
+        admin.publish_testimonials(request, Testimonial.objects.all())
+        stats = self.assertStatsConsistent()
+        self.assertEqual((stats.count, stats.stars_4), (4, 2))
+
+        admin.reject_testimonials(request, Testimonial.objects.filter(pk__in=[d.pk for d in drafts]))
+        self.assertEqual(self.assertStatsConsistent().count, 1)
+
+    def test_rebuild_command(self):
+        self._create(rating=5)
+        self._create(rating=2)
+        TestimonialStats.objects.all().update(count=100, stars_5=0)
+
+        out = StringIO()
+        call_command('rebuild_testimonial_stats', stdout=out)
+        self.assertIn('Відгуків: 2', out.getvalue())
+        self.assertStatsConsistent()
+
+    def test_rebuild_command_refreshes_homepage(self):
+        cache.clear()
+        self._create(rating=5)
+        self._create(rating=5)
+        self._create(rating=2)
+        TestimonialStats.objects.all().update(stars_5=0, stars_2=3)
+        self.assertContains(self.client.get('/'), 'value="100" aria-label="2 ★: 100%"', html=False)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('rebuild_testimonial_stats', stdout=StringIO())
+        self.assertContains(self.client.get('/'), 'value="33" aria-label="2 ★: 33%"', html=False)
+
+    def test_distribution(self):
+        self._create(rating=5)
+        self._create(rating=5)
+        self._create(rating=4)
+        self._create(rating=1)
+        self.assertEqual(
+            get_stats().distribution,
+            [(5, 2, 50), (4, 1, 25), (3, 0, 0), (2, 0, 0), (1, 1, 25)],
+        )
+
+    def test_feedback_page_uses_stats(self):
+        self._create(rating=5)
+        self._create(rating=4)
+        response = self.client.get('/feedback/')
+        self.assertContains(response, '<strong>2+</strong>')
+        self.assertEqual(response.context['avg_rating'], 4.5)
+        self.assertContains(response, 'class="rating-distribution"')
+        self.assertContains(response, 'max="100" value="50" aria-label="5 ★: 50%"', html=False)
+
+    def test_homepage_shows_distribution(self):
+        self._create(rating=5)
+        self._create(rating=5)
+        self._create(rating=2)
+        response = self.client.get('/')
+        self.assertContains(response, 'value="67" aria-label="5 ★: 67%"', html=False)
+        self.assertContains(response, 'value="33" aria-label="2 ★: 33%"', html=False)
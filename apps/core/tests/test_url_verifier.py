@@ -0,0 +1,157 @@
+"""
+Тести для перевірки старих URL (apps.core.url_verifier, команда verify_urls).
+"""
+import csv
+import json
+import shutil
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase
+
+from apps.core.models import NewsArticle
+from apps.core.redirect_index import redirect_index
+from apps.core.url_verifier import (
+    ERROR,
+    MISSING_REDIRECT,
+    REDIRECT_OK,
+    REDIRECT_WRONG,
+    SUCCESS,
+    ClientTransport,
+    HttpTransport,
+    URLVerifier,
+)
+
+
+class RedirectSite:
+    """Локальний HTTP сервер: шлях -> (статус, Location)."""
+
+    def __init__(self, routes):
+        class Handler(BaseHTTPRequestHandler):
+            def do_HEAD(self):
+                status, location = routes.get(self.path, (404, ''))
+                self.send_response(status)
+                if location:
+                    self.send_header('Location', location)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+ROUTES = {
+    '/ok/': (200, ''),
+    # /pidgotovka-do-ispitu-ielts є в REDIRECTS -> /programs/ielts
+    '/pidgotovka-do-ispitu-ielts': (301, '/hop/'),
+    '/hop/': (302, '/programs/ielts'),
+    '/programs/ielts': (200, ''),
+    '/anglijska-dlya-ditej-kids-30': (301, '/programs/ielts'),
+    '/pidgotovka-do-ispitu-toefl': (404, ''),
+    '/loop-a/': (301, '/loop-b/'),
+    '/loop-b/': (301, '/loop-a/'),
+    '/broken/': (301, '/gone/'),
+    '/error/': (500, ''),
+}
+
+
+class HttpTransportTest(SimpleTestCase):
+    """Тести для URLVerifier з HttpTransport проти локального сервера"""
+
+    def verify(self, paths, **kwargs):
+        with RedirectSite(ROUTES) as site:
+            return URLVerifier(HttpTransport(site.url, concurrency=4), **kwargs).verify(paths)
+
+    def test_categories(self):
+        report = self.verify(list(ROUTES) + ['/ok/', '/missing/'])
+        by_path = {result.path: result for result in report.results}
+
+        self.assertEqual(len(report.results), len(ROUTES) + 1)
+        self.assertEqual(by_path['/ok/'].category, SUCCESS)
+        chained = by_path['/pidgotovka-do-ispitu-ielts']
+        self.assertEqual(chained.category, REDIRECT_OK)
+        self.assertEqual(chained.chain, ['301 /hop/', '302 /programs/ielts'])
+        self.assertEqual(by_path['/anglijska-dlya-ditej-kids-30'].category, REDIRECT_WRONG)
+        self.assertEqual(by_path['/pidgotovka-do-ispitu-toefl'].category, MISSING_REDIRECT)
+        self.assertIn('цикл', by_path['/loop-a/'].message)
+        self.assertEqual(by_path['/loop-a/'].category, ERROR)
+        self.assertEqual(by_path['/broken/'].category, ERROR)
+        self.assertEqual(by_path['/error/'].category, ERROR)
+        self.assertEqual(by_path['/missing/'].category, ERROR)
+        self.assertFalse(report.ok)
+
+    def test_max_redirects(self):
+        report = self.verify(['/pidgotovka-do-ispitu-ielts'], max_redirects=1)
+        self.assertEqual(report.results[0].category, ERROR)
+
+    def test_connection_error(self):
+        report = URLVerifier(HttpTransport('http://127.0.0.1:1', timeout=1)).verify(['/ok/'])
+        self.assertEqual(report.results[0].category, ERROR)
+        self.assertTrue(report.results[0].message.startswith('Error:'))
+
+
+class ClientTransportTest(TestCase):
+    """Тести для in-process перевірки та команди verify_urls"""
+
+    def setUp(self):
+        redirect_index.invalidate()
+        self.article = NewsArticle.objects.create(
+            slug_uk='new-slug',
+            title_uk='Стаття',
+            content_uk='<p>Текст</p>',
+            old_url_uk='/news/old-slug/',
+        )
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_news_and_static_redirects(self):
+        report = URLVerifier(ClientTransport('testserver')).verify([
+            '/news/old-slug/',
+            '/pidgotovka-do-ispitu-ielts',
+        ])
+        for result in report.results:
+            self.assertEqual(result.category, REDIRECT_OK, result.message)
+        self.assertEqual(report.results[0].expected, self.article.get_absolute_url())
+        self.assertTrue(report.ok)
+
+    def test_command_writes_reports(self):
+        json_file, csv_file = self.tmp / 'results.json', self.tmp / 'results.csv'
+        urls = self.tmp / 'urls.txt'
+        urls.write_text('/news/old-slug/\n\n/news/old-slug/\n')
+        out = StringIO()
+        call_command(
+            'verify_urls', '--in-process', '--host', 'testserver', '--url-file', str(urls),
+            '--json', str(json_file), '--csv', str(csv_file), stdout=out,
+        )
+        self.assertIn('Всього перевірено: 1', out.getvalue())
+
+        data = json.loads(json_file.read_text())
+        self.assertEqual(data['summary']['total'], 1)
+        self.assertEqual(data['summary'][REDIRECT_OK], 1)
+        with open(csv_file, newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(rows[0]['path'], '/news/old-slug/')
+        self.assertEqual(rows[0]['category'], REDIRECT_OK)
+
+    def test_command_fails_on_problems(self):
+        urls = self.tmp / 'urls.txt'
+        urls.write_text('/news/never-existed/\n')
+        with self.assertRaises(CommandError):
+            call_command('verify_urls', '--in-process', '--host', 'testserver', '--url-file', str(urls), stdout=StringIO())
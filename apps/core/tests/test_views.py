@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 
@@ -14,6 +16,72 @@ class IndexViewTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
 
 
+class IndexFragmentCacheTestCase(TestCase):
+    """Тести для кешування секцій головної сторінки."""
 
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        self.client = Client()
+
+    def test_warm_index_renders_sections_from_cache(self):
+        """Повторний запит не виконує запитів секцій до БД."""
+        from apps.core.models import Achievement, FAQ
+
+        Achievement.objects.create(number=100, label_uk='Випускників')
+        FAQ.objects.create(question_uk='Питання?', answer_uk='Відповідь')
+        self.client.get(reverse('core:index'))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('core:index'))
+
+        self.assertContains(response, 'Випускників')
+        self.assertContains(response, 'Питання?')
+        section_tables = ['core_achievement', 'core_advantage', 'core_testimonial', 'core_faq']
+        for query in queries:
+            for table in section_tables:
+                self.assertNotIn(table, query['sql'])
+
+    def test_section_invalidated_on_save(self):
+        """Збереження моделі секції скидає її кеш."""
+        from apps.core.models import Achievement
+
+        achievement = Achievement.objects.create(number=100, label_uk='Випускників')
+        self.client.get(reverse('core:index'))
+
+        achievement.label_uk = 'Студентів'
+        achievement.save()
+
+        response = self.client.get(reverse('core:index'))
+        self.assertContains(response, 'Студентів')
+        self.assertNotContains(response, 'Випускників')
+
+    def test_invalidation_bumps_section_version(self):
+        """Інвалідація змінює версію лише своєї секції."""
+        from apps.core.fragment_cache import invalidate_section, section_versions
+
+        before = section_versions()
+        invalidate_section('faq')
+        after = section_versions()
+        self.assertNotEqual(after['faq'], before['faq'])
+        self.assertEqual(after['achievements'], before['achievements'])
+
+
+class FormsContextTestCase(TestCase):
+    """Тести для лінивої TrialLessonForm у forms_context."""
+
+    def test_form_not_built_until_used(self):
+        from unittest import mock
+        from django.test import RequestFactory
+        from apps.core.context_processors import forms_context
 
+        with mock.patch('apps.core.context_processors.TrialLessonForm') as form_class:
+            context = forms_context(RequestFactory().get('/'))
+            form_class.assert_not_called()
+            context['trial_form'].fields
+            form_class.assert_called_once_with()
 
+    def test_header_form_rendered(self):
+        response = Client().get(reverse('core:index'))
+        self.assertContains(response, 'trial-form--header-desktop')
+        self.assertContains(response, 'name="name"')
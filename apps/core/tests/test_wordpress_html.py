@@ -0,0 +1,101 @@
+"""
+Тести для очищення WordPress HTML та переписування URL зображень.
+"""
+from django.test import SimpleTestCase
+
+from apps.core.utils.wordpress import (
+    ImageUrlIndex,
+    clean_wordpress_html,
+    normalize_image_url,
+    sanitize_wordpress_html,
+    update_html_image_urls,
+)
+
+OLD = 'https://speak-up.com.ua/wp-content/uploads/2021/03/photo.jpg'
+NEW = '/media/news/images/photo.jpg'
+
+
+class NormalizeImageUrlTest(SimpleTestCase):
+    """Тести для normalize_image_url"""
+
+    def test_variants_share_key(self):
+        key = normalize_image_url(OLD)
+        for url in (
+            OLD + '?ver=2',
+            OLD + '.webp',
+            'https://speak-up.com.ua/wp-content/uploads/2021/03/photo-300x200.jpg',
+            'https://speak-up.com.ua/wp-content/uploads/2021/03/photo-300x200.jpg.webp',
+            '/wp-content/uploads/2021/03/photo.jpg',
+        ):
+            self.assertEqual(normalize_image_url(url), key, url)
+
+    def test_real_webp_kept(self):
+        self.assertEqual(normalize_image_url('/u/photo.webp'), '/u/photo.webp')
+
+    def test_size_only_before_extension(self):
+        self.assertEqual(normalize_image_url('/u/1920x1080-bg.jpg'), '/u/1920x1080-bg.jpg')
+
+
+class ImageUrlIndexTest(SimpleTestCase):
+    """Тести для ImageUrlIndex"""
+
+    def setUp(self):
+        self.index = ImageUrlIndex({OLD: NEW})
+
+    def test_get(self):
+        self.assertEqual(self.index.get(OLD + '.webp?x=1'), NEW)
+        self.assertIsNone(self.index.get('/wp-content/uploads/other.jpg'))
+        self.assertIsNone(self.index.get('data:image/png;base64,AAAA'))
+        self.assertIsNone(self.index.get(''))
+
+    def test_rewrite_srcset(self):
+        srcset = (
+            'https://speak-up.com.ua/wp-content/uploads/2021/03/photo-300x200.jpg 300w, '
+            'https://cdn.example.com/other.jpg 600w'
+        )
+        self.assertEqual(
+            self.index.rewrite_srcset(srcset),
+            f'{NEW} 300w, https://cdn.example.com/other.jpg 600w',
+        )
+
+
+class SanitizeWordpressHtmlTest(SimpleTestCase):
+    """Тести для sanitize_wordpress_html / clean_wordpress_html / update_html_image_urls"""
+
+    HTML = (
+        '<p style="font-weight: 400;">Текст</p>'
+        '<p class="has-text-color lead" style="font-weight: 400; color: red">Колір</p>'
+        '<a href="' + OLD + '"><img class="wp-image-12 aligncenter size-full" '
+        'src="' + OLD + '.webp" srcset="' + OLD.replace('.jpg', '-300x200.jpg') + ' 300w" '
+        'sizes="(max-width: 300px) 100vw"></a>'
+    )
+
+    def test_clean(self):
+        html = clean_wordpress_html(self.HTML)
+        self.assertIn('<p>Текст</p>', html)
+        self.assertIn('<p class="lead" style="color: red">Колір</p>', html)
+        self.assertNotIn('wp-image-12', html)
+        self.assertNotIn('class=""', html)
+        self.assertIn(OLD, html)
+
+    def test_clean_and_rewrite_in_one_pass(self):
+        html = sanitize_wordpress_html(self.HTML, ImageUrlIndex({OLD: NEW}))
+        self.assertNotIn('speak-up.com.ua', html)
+        self.assertIn(f'<a href="{NEW}">', html)
+        self.assertIn(f'src="{NEW}"', html)
+        self.assertIn(f'srcset="{NEW} 300w"', html)
+        self.assertIn('sizes="(max-width: 300px) 100vw"', html)
+        self.assertNotIn('aligncenter', html)
+
+    def test_rewrite_without_clean(self):
+        html = update_html_image_urls(self.HTML, {OLD: NEW})
+        self.assertIn(f'src="{NEW}"', html)
+        self.assertIn('wp-image-12', html)
+
+    def test_empty(self):
+        self.assertEqual(sanitize_wordpress_html(''), '')
+        self.assertEqual(update_html_image_urls('<p>x</p>', {}), '<p>x</p>')
+
+    def test_leading_head_elements_kept(self):
+        html = sanitize_wordpress_html('<style>.a{color:red}</style><meta charset="utf-8"><p>Текст</p>')
+        self.assertEqual(html, '<style>.a{color:red}</style><meta charset="utf-8"/><p>Текст</p>')
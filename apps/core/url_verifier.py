@@ -0,0 +1,262 @@
+"""
+Перевірка старих URL (all_news_urls.txt, REDIRECTS, old_url статей):
+кожен має відповідати 200 або 301/302 на очікувану нову адресу.
+
+- очікувана адреса - з redirect_index (той самий індекс, що й у
+  NewsRedirectMiddleware), без SQL запиту на кожен URL
+- ланцюжок редиректів проходиться до кінця (до max_redirects) з
+  виявленням циклів; кінцева сторінка має відповідати 200
+- два транспорти:
+  HttpTransport - реальний сервер, один requests.Session (keep-alive)
+  на N паралельних потоків;
+  ClientTransport - django.test.Client у процесі, без сервера (CI)
+- результати - VerificationReport з JSON / CSV експортом
+
+Використання: python manage.py verify_urls (див. команду verify_urls).
+"""
+import csv
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .redirect_index import normalize_path, redirect_index
+from .redirects import REDIRECTS
+
+# Категорії результатів (як у scripts/verify_all_urls.py)
+SUCCESS = 'success'
+REDIRECT_OK = 'redirect_ok'
+REDIRECT_WRONG = 'redirect_wrong'
+MISSING_REDIRECT = 'missing_redirect'
+ERROR = 'errors'
+CATEGORIES = (SUCCESS, REDIRECT_OK, REDIRECT_WRONG, MISSING_REDIRECT, ERROR)
+PROBLEM_CATEGORIES = (REDIRECT_WRONG, MISSING_REDIRECT, ERROR)
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+CSV_FIELDS = ('path', 'category', 'status_code', 'final_path', 'expected', 'chain', 'message')
+
+
+@dataclass
+class CheckResult:
+    """Результат перевірки одного URL."""
+    path: str
+    category: str
+    status_code: Optional[int] = None
+    final_path: str = ''
+    expected: str = ''
+    chain: List[str] = field(default_factory=list)
+    message: str = ''
+
+    @property
+    def ok(self) -> bool:
+        return self.category not in PROBLEM_CATEGORIES
+
+
+class HttpTransport:
+    """HEAD запити до сервера через спільний requests.Session (пул з'єднань)."""
+
+    def __init__(self, base_url: str, concurrency: int = 8, timeout: float = 10.0):
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def url(self, path: str) -> str:
+        return urljoin(self.base_url + '/', path.lstrip('/')) if not path.startswith('http') else path
+
+    def fetch(self, url: str) -> Tuple[int, str]:
+        """(статус, Location) без автоматичного переходу по редиректу."""
+        response = self.session.head(url, allow_redirects=False, timeout=self.timeout)
+        if response.status_code == 405:
+            response = self.session.get(url, allow_redirects=False, timeout=self.timeout, stream=True)
+            response.close()
+        return response.status_code, response.headers.get('Location', '')
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class ClientTransport:
+    """
+    Запити через django.test.Client у поточному процесі (без сервера).
+    Послідовно: Client та з'єднання з БД не розраховані на спільне використання потоками.
+    """
+
+    concurrency = 1
+
+    def __init__(self, host: str = 'localhost', secure: bool = False):
+        from django.test import Client
+
+        self.client = Client(HTTP_HOST=host)
+        self.base_url = f'{"https" if secure else "http"}://{host}'
+        self.secure = secure
+
+    def url(self, path: str) -> str:
+        return urljoin(self.base_url + '/', path.lstrip('/')) if not path.startswith('http') else path
+
+    def fetch(self, url: str) -> Tuple[int, str]:
+        parts = urlsplit(url)
+        path = parts.path + (f'?{parts.query}' if parts.query else '')
+        response = self.client.head(path, secure=self.secure)
+        return response.status_code, response.headers.get('Location', '')
+
+    def close(self) -> None:
+        pass
+
+
+def expected_target(path: str, lang: str = 'uk') -> Optional[str]:
+    """Очікувана нова адреса для старого URL (None - редирект не налаштований)."""
+    target = redirect_index.lookup(urlsplit(path).path)
+    return target.url_for(lang) if target else None
+
+
+def same_path(a: str, b: str) -> bool:
+    return normalize_path(urlsplit(a).path) == normalize_path(urlsplit(b).path)
+
+
+class URLVerifier:
+    """
+    Паралельна перевірка URL.
+
+    Використання:
+        verifier = URLVerifier(HttpTransport('https://speak-up.com.ua', concurrency=16))
+        report = verifier.verify(paths)
+        report.write_json('results.json')
+    """
+
+    def __init__(self, transport, max_redirects: int = 10):
+        self.transport = transport
+        self.max_redirects = max_redirects
+
+    def verify(self, paths: Iterable[str]) -> 'VerificationReport':
+        paths = [path for path in dict.fromkeys(path.strip() for path in paths) if path]
+        # Індекс будується один раз до запуску потоків
+        redirect_index.warm()
+        try:
+            if self.transport.concurrency > 1:
+                with ThreadPoolExecutor(max_workers=self.transport.concurrency, thread_name_prefix='verify') as pool:
+                    results = list(pool.map(self.check, paths))
+            else:
+                results = [self.check(path) for path in paths]
+        finally:
+            self.transport.close()
+        return VerificationReport(results)
+
+    def follow(self, path: str) -> Tuple[int, str, List[str], str]:
+        """
+        Проходить ланцюжок редиректів.
+        Повертає (статус першої відповіді, кінцевий URL, ланцюжок, помилка ланцюжка).
+        """
+        url = self.transport.url(path)
+        first_status = None
+        chain: List[str] = []
+        seen = {url}
+        for _hop in range(self.max_redirects + 1):
+            status, location = self.transport.fetch(url)
+            if first_status is None:
+                first_status = status
+            if status not in REDIRECT_CODES or not location:
+                return first_status, url, chain, '' if status == 200 else f'кінцевий статус {status}'
+            url = urljoin(url, location)
+            chain.append(f'{status} {urlsplit(url).path}')
+            if url in seen:
+                return first_status, url, chain, 'цикл редиректів'
+            seen.add(url)
+        return first_status, url, chain, f'більше {self.max_redirects} редиректів'
+
+    def check(self, path: str) -> CheckResult:
+        expected = expected_target(path) or ''
+        try:
+            status, final_url, chain, chain_error = self.follow(path)
+        except (requests.RequestException, OSError) as e:
+            return CheckResult(path, ERROR, expected=expected, message=f'Error: {e}')
+
+        final_path = urlsplit(final_url).path
+        result = CheckResult(path, ERROR, status, final_path, expected, chain)
+
+        if status == 200:
+            result.category, result.message = SUCCESS, 'OK'
+        elif status in REDIRECT_CODES:
+            if chain_error:
+                result.message = f'Redirect -> {final_path}: {chain_error}'
+            elif expected and not same_path(final_path, expected):
+                result.category = REDIRECT_WRONG
+                result.message = f'Redirect WRONG: got {final_path}, expected {expected}'
+            else:
+                result.category = REDIRECT_OK
+                result.message = f'Redirect OK -> {final_path}' + ('' if expected else ' (no expected)')
+        elif status == 404 and expected:
+            result.category, result.message = MISSING_REDIRECT, f'404 - should redirect to {expected}'
+        elif status == 404:
+            result.message = '404 - not found and no redirect'
+        else:
+            result.message = f'Status {status}'
+        return result
+
+
+class VerificationReport:
+    """Результати перевірки з підсумком та експортом."""
+
+    def __init__(self, results: List[CheckResult]):
+        self.results = results
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results)
+
+    def counts(self) -> Dict[str, int]:
+        counts = {category: 0 for category in CATEGORIES}
+        for result in self.results:
+            counts[result.category] += 1
+        return counts
+
+    def problems(self) -> List[CheckResult]:
+        return [result for result in self.results if not result.ok]
+
+    def success_rate(self) -> float:
+        counts = self.counts()
+        total = len(self.results)
+        return (counts[SUCCESS] + counts[REDIRECT_OK]) / total * 100 if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            'summary': {**self.counts(), 'total': len(self.results), 'ok': self.ok},
+            'results': [asdict(result) for result in self.results],
+        }
+
+    def write_json(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+    def write_csv(self, path: str) -> None:
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for result in self.results:
+                row = asdict(result)
+                row['chain'] = ' | '.join(row['chain'])
+                writer.writerow(row)
+
+
+def load_paths(url_files: Iterable[str] = (), include_redirects: bool = False, include_news: bool = False) -> List[str]:
+    """Шляхи для перевірки з файлів, REDIRECTS та old_url статей."""
+    paths: List[str] = []
+    for url_file in url_files:
+        with open(url_file) as f:
+            paths.extend(line.strip() for line in f if line.strip())
+    if include_redirects:
+        paths.extend(REDIRECTS)
+    if include_news:
+        from .models import NewsArticle
+
+        for old_uk, old_ru in NewsArticle.objects.values_list('old_url_uk', 'old_url_ru'):
+            paths.extend(url for url in (old_uk, old_ru) if url)
+    return list(dict.fromkeys(paths))
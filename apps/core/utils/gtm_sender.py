@@ -0,0 +1,198 @@
+"""
+Відправка redirect подій у GTM server container (GA4 Measurement Protocol).
+
+- один пул з'єднань (requests.Session) на всі потоки
+- до 25 подій в одному запиті (ліміт Measurement Protocol)
+- N паралельних відправників з token-bucket rate limiting
+- retry з експоненційним backoff; невдалі події - у dead-letter файл
+"""
+import json
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# GA4 Measurement Protocol: максимум 25 подій в одному запиті
+MAX_EVENTS_PER_REQUEST = 25
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket: не більше `rate` запитів на секунду."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Блокує, поки не з'явиться токен."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+
+@dataclass
+class SendStats:
+    """Підсумок відправки."""
+    sent: int = 0
+    failed: int = 0
+    requests: int = 0
+    retries: int = 0
+
+
+class GTMBatchSender:
+    """
+    Паралельна батчева відправка redirect подій у GTM.
+
+    Використання:
+        sender = GTMBatchSender(url, measurement_id, api_secret, dead_letter_file=path)
+        stats = sender.send(records)
+    """
+
+    def __init__(
+        self,
+        container_url: str,
+        measurement_id: str,
+        api_secret: str,
+        dead_letter_file: Path,
+        workers: int = 8,
+        batch_size: int = MAX_EVENTS_PER_REQUEST,
+        rate: float = 20.0,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 5.0,
+        session: Optional[requests.Session] = None,
+    ):
+        self.endpoint = f'{container_url}/g/collect'
+        self.params = {'measurement_id': measurement_id, 'api_secret': api_secret}
+        self.dead_letter_file = dead_letter_file
+        self.workers = max(1, workers)
+        self.batch_size = max(1, min(batch_size, MAX_EVENTS_PER_REQUEST))
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.bucket = TokenBucket(rate)
+        self.session = session or self._build_session()
+        self.stats = SendStats()
+        self._stats_lock = threading.Lock()
+        self._dead_letter_lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def send(self, records: Iterable[dict]) -> SendStats:
+        """
+        Відправляє записи батчами. Читає records потоково:
+        в пам'яті тримається не більше ніж workers * 2 батчів.
+        """
+        max_in_flight = self.workers * 2
+        in_flight: Set[Future] = set()
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='gtm-sender') as executor:
+            for batch in self._batches(records):
+                if len(in_flight) >= max_in_flight:
+                    _done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                in_flight.add(executor.submit(self._send_batch, batch))
+            wait(in_flight)
+
+        self.session.close()
+        return self.stats
+
+    def _batches(self, records: Iterable[dict]) -> Iterable[List[dict]]:
+        batch: List[dict] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _send_batch(self, batch: List[dict]) -> bool:
+        """Відправляє один батч з retry. Невдалий батч пише в dead-letter."""
+        payload = {
+            'client_id': 'server_side',
+            'events': [self._build_event(record) for record in batch],
+        }
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                with self._stats_lock:
+                    self.stats.retries += 1
+                time.sleep(self.backoff * (2 ** (attempt - 1)))
+
+            self.bucket.acquire()
+            with self._stats_lock:
+                self.stats.requests += 1
+
+            try:
+                response = self.session.post(
+                    self.endpoint,
+                    params=self.params,
+                    json=payload,
+                    timeout=self.timeout
+                )
+            except (requests.Timeout, requests.ConnectionError) as e:
+                logger.warning('GTM request failed (attempt %s): %s', attempt + 1, e)
+                continue
+            except Exception as e:
+                logger.error('GTM request error: %s', e)
+                break
+
+            if response.status_code in (200, 204):
+                with self._stats_lock:
+                    self.stats.sent += len(batch)
+                return True
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                break
+
+        self._dead_letter(batch)
+        with self._stats_lock:
+            self.stats.failed += len(batch)
+        return False
+
+    @staticmethod
+    def _build_event(data: dict) -> dict:
+        return {
+            'name': 'page_view',
+            'params': {
+                'page_location': data.get('old_url', ''),
+                'redirect_to': data.get('new_url', ''),
+                'redirect_type': data.get('redirect_type', 'unknown'),
+            }
+        }
+
+    def _dead_letter(self, batch: List[dict]) -> None:
+        """Дописує невдалі записи у dead-letter файл (формат як у redirects.log)."""
+        lines = ''.join(json.dumps(record) + '\n' for record in batch)
+        with self._dead_letter_lock:
+            try:
+                with open(self.dead_letter_file, 'a', encoding='utf-8') as f:
+                    f.write(lines)
+            except Exception as e:
+                logger.error('Dead-letter write error: %s', e)
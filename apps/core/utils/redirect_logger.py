@@ -1,32 +1,72 @@
 """
 Асинхронне логування редіректів без блокування HTTP відповіді.
-Використовує threading для запису в фоновому режимі.
+
+Один довгоживучий writer thread на процес читає з обмеженої черги і пише
+записи в logs/redirects.log батчами (по розміру або по часу).
+Якщо черга переповнена (burst від краулерів), запис відкидається і
+збільшується лічильник dropped.
+
+Формат файлу не змінився: один JSON об'єкт на рядок
+(сумісно з process_redirect_logs).
 """
+import atexit
 import logging
+import os
+import queue
 import threading
+import time
 import json
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
 
+class _FlushRequest:
+    """Маркер у черзі: записати поточний батч і сигналізувати event."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
 class AsyncRedirectLogger:
     """
     Асинхронне логування редіректів БЕЗ блокування HTTP відповіді.
-    Використовує threading для запису в фоновому режимі.
+    log_redirect() лише кладе запис у чергу (put_nowait), запис у файл
+    виконує один фоновий writer thread.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
         self.log_dir = Path(settings.BASE_DIR) / 'logs'
         self.log_dir.mkdir(exist_ok=True)
         self.log_file = self.log_dir / 'redirects.log'
 
+        self.queue_size = queue_size or getattr(settings, 'REDIRECT_LOG_QUEUE_SIZE', 10000)
+        self.batch_size = batch_size or getattr(settings, 'REDIRECT_LOG_BATCH_SIZE', 500)
+        self.flush_interval = flush_interval or getattr(settings, 'REDIRECT_LOG_FLUSH_INTERVAL', 0.2)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self._writer: Optional[threading.Thread] = None
+        self._writer_pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+
+        # Статистика (для моніторингу)
+        self.written = 0
+        self.dropped = 0
+        self._dropped_reported = 0
+
     def log_redirect(self, request, old_url: str, new_url: str, redirect_type: str):
         """
-        Логує редірект асинхронно в окремому thread.
-        НЕ блокує HTTP відповідь.
+        Ставить запис про редірект у чергу.
+        НЕ блокує HTTP відповідь: якщо черга повна, запис відкидається.
 
         Args:
             request: Django request object
@@ -48,22 +88,96 @@ class AsyncRedirectLogger:
             'ip': self._get_client_ip(request),
         }
 
-        # Записуємо в окремому thread (НЕ блокує)
-        thread = threading.Thread(
-            target=self._write_log,
-            args=(data,),
-            daemon=True  # Не блокує shutdown
-        )
-        thread.start()
-        # Одразу повертаємось, не чекаємо завершення
-
-    def _write_log(self, data: dict):
-        """Записує лог у файл (виконується в окремому thread)."""
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            with self._counter_lock:
+                self.dropped += 1
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Чекає, поки writer запише всі записи, що вже в черзі.
+        Returns: True якщо встигли за timeout.
+        """
+        if self._writer is None or not self._writer.is_alive() or self._writer_pid != os.getpid():
+            return True
+
+        request = _FlushRequest()
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(data) + '\n')
-        except Exception as e:
-            logger.error(f'Redirect logging error: {e}')
+            self._queue.put(request, timeout=timeout)
+        except queue.Full:
+            return False
+        return request.done.wait(timeout)
+
+    def _ensure_writer(self):
+        """Запускає writer thread (один на процес, перезапуск після fork)."""
+        pid = os.getpid()
+        if self._writer_pid == pid and self._writer is not None and self._writer.is_alive():
+            return
+
+        with self._start_lock:
+            if self._writer_pid == pid and self._writer is not None and self._writer.is_alive():
+                return
+            if self._writer_pid != pid:
+                # Після fork черга могла залишитись з lock батьківського процесу
+                self._queue = queue.Queue(maxsize=self.queue_size)
+            self._writer = threading.Thread(
+                target=self._run,
+                name='redirect-log-writer',
+                daemon=True  # Не блокує shutdown
+            )
+            self._writer_pid = pid
+            self._writer.start()
+
+    def _run(self):
+        """Цикл writer thread: збирає батч і пише його по розміру або по часу."""
+        batch: List[str] = []
+        deadline = 0.0
+
+        while True:
+            if batch:
+                timeout = max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+            else:
+                # Порожній батч - чекаємо без пробуджень
+                item = self._queue.get()
+                deadline = time.monotonic() + self.flush_interval
+
+            if isinstance(item, _FlushRequest):
+                self._write_batch(batch)
+                batch = []
+                item.done.set()
+                continue
+
+            if item is not None:
+                batch.append(json.dumps(item))
+
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._write_batch(batch)
+                batch = []
+
+    def _write_batch(self, batch: List[str]):
+        """Записує батч у файл одним write (виконується у writer thread)."""
+        if batch:
+            try:
+                # Файл відкриваємо на кожен батч: process_redirect_logs видаляє його після обробки
+                with open(self.log_file, 'a', encoding='utf-8') as f:
+                    f.write('\n'.join(batch) + '\n')
+                self.written += len(batch)
+            except Exception as e:
+                logger.error(f'Redirect logging error: {e}')
+
+        if self.dropped != self._dropped_reported:
+            logger.error(
+                'Redirect log queue full: dropped %s records (total %s)',
+                self.dropped - self._dropped_reported,
+                self.dropped,
+            )
+            self._dropped_reported = self.dropped
 
     def _get_client_ip(self, request) -> str:
         """Отримує IP клієнта."""
@@ -75,3 +189,6 @@ class AsyncRedirectLogger:
 
 # Singleton
 redirect_logger = AsyncRedirectLogger()
+
+# Дописуємо залишок черги при завершенні воркера
+atexit.register(redirect_logger.flush, 1.0)
@@ -0,0 +1,260 @@
+"""
+Утиліти для імпорту статей з WordPress (очищення HTML, зображення).
+
+sanitize_wordpress_html - один прохід по документу: видаляє WordPress
+класи / зайві inline styles і одночасно переписує URL зображень
+(src, srcset, data-src, посилання <a> на зображення) через ImageUrlIndex.
+ImageUrlIndex нормалізує URL один раз при побудові (query, .webp від
+webp-express, розмір -300x200), тому пошук для кожного <img> - O(1)
+замість перебору всього mapping.
+
+Парсер завжди html.parser: lxml переносить <style> / <script> / <meta>
+з початку фрагмента в <head> і дав би інший результат на іншому оточенні.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+HTML_PARSER = 'html.parser'
+
+# Підрядки WordPress класів, які видаляються
+WORDPRESS_CLASSES = (
+    'wp-image-', 'aligncenter', 'alignleft', 'alignright',
+    'size-full', 'size-medium', 'size-large', 'size-thumbnail',
+    'wp-block-', 'has-', 'is-',
+)
+
+# Inline style за замовчуванням, який WordPress редактор додає до тексту
+DEFAULT_STYLE_RE = re.compile(r'font-weight:\s*(?:400|normal);?\s*')
+
+# Розмір мініатюри WordPress перед розширенням: image-300x200.jpg
+SIZE_SUFFIX_RE = re.compile(r'-\d+x\d+(?=\.[A-Za-z0-9]+$)')
+
+# Атрибути з URL зображення, які переписуються
+IMAGE_URL_ATTRIBUTES = ('src', 'data-src', 'data-lazy-src')
+IMAGE_SRCSET_ATTRIBUTES = ('srcset', 'data-srcset')
+
+
+def normalize_image_url(url: str) -> str:
+    """
+    Ключ зображення: шлях без query / fragment, без .webp від webp-express
+    та без розміру мініатюри (-300x200). Хост ігнорується, тому відносні
+    та абсолютні URL одного файлу дають той самий ключ.
+    """
+    path = urlsplit(url.strip()).path
+    if path.endswith('.webp') and '.' in path[:-5].rsplit('/', 1)[-1]:
+        path = path[:-5]
+    return SIZE_SUFFIX_RE.sub('', path)
+
+
+class ImageUrlIndex:
+    """
+    Індекс {нормалізований URL: новий URL} для переписування зображень.
+
+    Використання:
+        index = ImageUrlIndex({'https://old.site/wp-content/uploads/a.jpg': '/media/news/images/a.jpg'})
+        index.get('/wp-content/uploads/a-300x200.jpg.webp?ver=2')  # '/media/news/images/a.jpg'
+    """
+
+    def __init__(self, mapping: Optional[Dict[str, str]] = None):
+        self._index: Dict[str, str] = {}
+        for old_url, new_url in (mapping or {}).items():
+            self.add(old_url, new_url)
+
+    def add(self, old_url: str, new_url: str) -> None:
+        key = normalize_image_url(old_url)
+        if key:
+            self._index.setdefault(key, new_url)
+
+    def get(self, url: str) -> Optional[str]:
+        if not url or url.startswith('data:'):
+            return None
+        return self._index.get(normalize_image_url(url))
+
+    def rewrite_srcset(self, srcset: str) -> str:
+        """Переписує кожен кандидат srcset ('url 300w, url 2x'), решту лишає як є."""
+        candidates = []
+        for candidate in srcset.split(','):
+            parts = candidate.split()
+            if parts:
+                new_url = self.get(parts[0])
+                if new_url:
+                    parts[0] = new_url
+                candidates.append(' '.join(parts))
+        return ', '.join(candidates)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __bool__(self):
+        return bool(self._index)
+
+
+def _clean_element(element) -> None:
+    classes = element.get('class')
+    if classes:
+        cleaned = [cls for cls in classes if not any(wp_cls in cls for wp_cls in WORDPRESS_CLASSES)]
+        if cleaned:
+            element['class'] = cleaned
+        else:
+            del element['class']
+
+    style = element.get('style')
+    if style:
+        style = DEFAULT_STYLE_RE.sub('', style).strip()
+        if style:
+            element['style'] = style
+        else:
+            del element['style']
+
+
+def _rewrite_images(element, index: ImageUrlIndex) -> None:
+    if element.name == 'img' or element.name == 'source':
+        for attribute in IMAGE_URL_ATTRIBUTES:
+            new_url = index.get(element.get(attribute, ''))
+            if new_url:
+                element[attribute] = new_url
+        for attribute in IMAGE_SRCSET_ATTRIBUTES:
+            if element.get(attribute):
+                element[attribute] = index.rewrite_srcset(element[attribute])
+    elif element.name == 'a':
+        # Посилання на повнорозмірне зображення (lightbox)
+        new_url = index.get(element.get('href', ''))
+        if new_url:
+            element['href'] = new_url
+
+
+def sanitize_wordpress_html(
+    html_content: str,
+    image_index: Optional[ImageUrlIndex] = None,
+    clean: bool = True,
+) -> str:
+    """
+    Один прохід по HTML: очищення WordPress класів / styles (clean) та
+    переписування URL зображень через image_index.
+    """
+    if not html_content or not (clean or image_index):
+        return html_content
+
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    for element in soup.find_all(True):
+        if clean:
+            _clean_element(element)
+        if image_index:
+            _rewrite_images(element, image_index)
+    # srcset та sizes для responsive images не видаляються
+    return str(soup)
+
+
+def clean_wordpress_html(html_content: str) -> str:
+    """
+    Очищає HTML від WordPress-специфічних класів та inline styles.
+    Зберігає структуру та семантику.
+
+    Args:
+        html_content: HTML контент з WordPress
+
+    Returns:
+        Очищений HTML контент
+    """
+    return sanitize_wordpress_html(html_content)
+
+
+def extract_images_from_html(html_content: str, base_url: str = '') -> List[Dict[str, str]]:
+    """
+    Витягує всі зображення з HTML контенту.
+
+    Args:
+        html_content: HTML контент
+        base_url: Базовий URL для відносних посилань
+
+    Returns:
+        Список словників з інформацією про зображення
+    """
+    if not html_content:
+        return []
+
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    images = []
+
+    for img in soup.find_all('img'):
+        src = img.get('src', '')
+        if not src:
+            continue
+
+        # Конвертувати відносні URL в абсолютні
+        if base_url and not src.startswith('http'):
+            src = urljoin(base_url, src)
+
+        # Отримати оригінальне зображення (без webp-express)
+        # webp-express додає .webp в кінець, потрібно видалити
+        original_src = src.replace('.webp', '').split('?')[0]
+
+        images.append({
+            'src': src,
+            'original_src': original_src,
+            'alt': img.get('alt', ''),
+            'width': img.get('width', ''),
+            'height': img.get('height', ''),
+        })
+
+    return images
+
+
+def download_and_save_image(image_url: str, upload_path: str) -> Tuple[str, bool]:
+    """
+    Завантажує зображення з URL та зберігає локально.
+
+    Args:
+        image_url: URL зображення
+        upload_path: Шлях для збереження (відносно MEDIA_ROOT)
+
+    Returns:
+        Tuple (локальний URL, успіх)
+    """
+    try:
+        # Завантажити зображення
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        }
+        response = requests.get(image_url, timeout=30, allow_redirects=True, headers=headers)
+        response.raise_for_status()
+
+        # Отримати ім'я файлу з URL
+        parsed_url = urlparse(image_url)
+        filename = parsed_url.path.split('/')[-1]
+        if not filename or '.' not in filename:
+            filename = 'image.jpg'
+
+        # Зберегти файл
+        full_path = default_storage.save(
+            f'{upload_path}/{filename}',
+            ContentFile(response.content)
+        )
+
+        return full_path, True
+    except Exception as e:
+        print(f"Помилка завантаження зображення {image_url}: {e}")
+        return '', False
+
+
+def update_html_image_urls(html_content: str, image_mapping: Dict[str, str]) -> str:
+    """
+    Оновлює URL зображень в HTML на локальні.
+    Оновлює src, srcset та всі варіанти URL (webp, розміри, query).
+
+    Args:
+        html_content: HTML контент
+        image_mapping: Словник {старий_url: новий_url}
+
+    Returns:
+        HTML з оновленими URL
+    """
+    if not html_content or not image_mapping:
+        return html_content
+    return sanitize_wordpress_html(html_content, ImageUrlIndex(image_mapping), clean=False)
@@ -2,14 +2,17 @@ from django.shortcuts import render, get_object_or_404
 from django.http import Http404, JsonResponse, HttpResponse
 from django.urls import reverse
 from django.utils.translation import get_language
-from django.core.paginator import Paginator
 from django.core.exceptions import ValidationError
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
-from django.db import models
+from django.conf import settings
+from django.utils.functional import SimpleLazyObject
 import logging
-from .seo_config import PROGRAMS, LOCATIONS, CITIES
+from .catalog import get_catalog, CORPORATE_SLUG
+from .fragment_cache import section_versions
+from .pagination import KeysetPaginator
+from .testimonial_stats import get_stats as get_testimonial_stats
 
 logger = logging.getLogger(__name__)
 from .models import (
@@ -17,7 +20,7 @@ from .models import (
     Testimonial, FAQ, ConsultationRequest, ContactInfo
 )
 from .forms import TestimonialForm, ConsultationForm, CorporateConsultationForm
-from apps.leads.forms import TrialLessonForm
+from apps.leads.ingestion import ingest
 
 def index(request):
     """Головна сторінка з усіма секціями."""
@@ -31,7 +34,9 @@ def index(request):
                 return value
         return getattr(obj, f'{field}_uk', '')
 
-    faqs_list = list(FAQ.objects.filter(is_active=True).order_by('order'))
+    # Всі дані секцій ліниві: якщо фрагмент секції є в кеші ({% cache %} в index.html),
+    # запит до БД не виконується
+    faqs_list = SimpleLazyObject(lambda: list(FAQ.objects.filter(is_active=True).order_by('order')))
     context = {
         'achievements': Achievement.objects.filter(is_active=True).order_by('order'),
         'advantages': Advantage.objects.prefetch_related('items').filter(is_active=True).order_by('order'),
@@ -40,13 +45,16 @@ def index(request):
         ).filter(courses__is_active=True).distinct().order_by('order'),
         'testimonials': Testimonial.objects.filter(is_published=True).order_by('-created_at')[:10],
         'faqs': faqs_list,
-        'faqs_column1': faqs_list[:4],
-        'faqs_column2': faqs_list[4:8],
-        'faqs_column3': faqs_list[8:12],
-        'trial_form': TrialLessonForm(),
+        'faqs_column1': SimpleLazyObject(lambda: faqs_list[:4]),
+        'faqs_column2': SimpleLazyObject(lambda: faqs_list[4:8]),
+        'faqs_column3': SimpleLazyObject(lambda: faqs_list[8:12]),
         'consultation_form': ConsultationForm(),
         'testimonial_form': TestimonialForm(),
         'current_language': lang,
+        'testimonial_stats': SimpleLazyObject(get_testimonial_stats),
+        # trial_form - лінивий, з forms_context
+        'home_cache_timeout': getattr(settings, 'HOMEPAGE_CACHE_TIMEOUT', 300),
+        'home_versions': section_versions(),
     }
     return render(request, 'core/index.html', context)
 
@@ -87,67 +95,8 @@ def programs_list(request):
     """Сторінка з усіма програмами, структурованими за категоріями."""
     lang = get_language()
 
-    # Категорії програм
-    categories = {
-        'kids': {
-            'title': 'Діти та підлітки',
-            'title_ru': 'Дети и подростки',
-            'programs': []
-        },
-        'group': {
-            'title': 'Дорослі - Групові та онлайн програми',
-            'title_ru': 'Взрослые - Групповые и онлайн программы',
-            'programs': []
-        },
-        'individual': {
-            'title': 'Дорослі - Індивідуальні програми',
-            'title_ru': 'Взрослые - Индивидуальные программы',
-            'programs': []
-        },
-        'professional': {
-            'title': 'Профільні курси',
-            'title_ru': 'Профильные курсы',
-            'programs': []
-        },
-        'exams': {
-            'title': 'Підготовка до іспитів',
-            'title_ru': 'Подготовка к экзаменам',
-            'programs': []
-        },
-        'beginners': {
-            'title': 'Для початківців',
-            'title_ru': 'Для начинающих',
-            'programs': []
-        },
-    }
-
-    # Структуруємо програми за категоріями
-    for slug, program in PROGRAMS.items():
-        category_key = program.get('category', 'group')
-        if category_key not in categories:
-            category_key = 'group'  # fallback
-
-        # Вибрати переклад згідно з мовою
-        program_data = {
-            'slug': slug,
-            'title': program.get(f'title_{lang}', program['title']),
-            'description': program.get(f'description_{lang}', program['description']),
-            'price': program.get('price', {}),
-            'duration': program.get('duration', ''),
-            'badge': program.get('badge'),
-            'includes': program.get(f'includes_{lang}', program.get('includes', [])),
-            'benefits': program.get(f'benefits_{lang}', program.get('benefits', [])),
-            'url': f'/programs/{slug}',
-        }
-
-        categories[category_key]['programs'].append(program_data)
-
-    # Локалізуємо назви категорій
-    for category_key, category_data in categories.items():
-        category_data['title'] = category_data.get(f'title_{lang}', category_data['title'])
-
     context = {
-        'categories': categories,
+        'categories': get_catalog(lang).categories,
         'current_language': lang,
     }
 
@@ -155,124 +104,29 @@ def programs_list(request):
 
 def program_detail(request, slug):
     """Сторінка програми (26 програм)."""
-    program = PROGRAMS.get(slug)
+    lang = get_language()
+    program = get_catalog(lang).programs.get(slug)
 
     if not program:
         raise Http404(f"Програма '{slug}' не знайдена")
 
-    # Вибрати переклад згідно з мовою
-    lang = get_language()
-    data = {
-        'slug': slug,
-        'title': program.get(f'title_{lang}', program['title']),
-        'description': program.get(f'description_{lang}', program['description']),
-        'full_content': program.get(f'full_content_{lang}', program.get('full_content', '')),
-        'includes': program.get(f'includes_{lang}', program.get('includes', [])),
-        'benefits': program.get(f'benefits_{lang}', program.get('benefits', [])),
-        'price': program.get('price', {}),
-        'duration': program.get('duration', ''),
-        'badge': program.get('badge'),
-    }
-
-    # Для корпоративної програми додаємо детальну інформацію
-    if slug == 'corporate':
-        corporate_data = program.get('schedule', {})
-        if corporate_data:
-            data['schedule'] = corporate_data.get(lang, corporate_data.get('uk', []))
-
-        corporate_data = program.get('course_types', {})
-        if corporate_data:
-            data['course_types'] = corporate_data.get(lang, corporate_data.get('uk', []))
-
-        corporate_data = program.get('pricing_details', {})
-        if corporate_data:
-            data['pricing_details'] = corporate_data.get(lang, corporate_data.get('uk', []))
-
-        # Програми навчання
-        programs_data = program.get('programs', {})
-        if programs_data:
-            data['programs'] = {}
-            for key, prog in programs_data.items():
-                data['programs'][key] = {
-                    'title': prog.get(f'title_{lang}', prog.get('title_uk', '')),
-                    'description': prog.get(f'description_{lang}', prog.get('description_uk', '')),
-                    'features': prog.get(f'features_{lang}', prog.get('features_uk', [])),
-                    'target': prog.get(f'target_{lang}', prog.get('target_uk', [])),
-                    'components': prog.get(f'components_{lang}', prog.get('components_uk', [])),
-                    'benefits': prog.get(f'benefits_{lang}', prog.get('benefits_uk', []))
-                }
-
-        # Чому саме Speak Up
-        why_data = program.get('why_speak_up', {})
-        if why_data:
-            data['why_speak_up'] = {}
-            for key, item in why_data.items():
-                data['why_speak_up'][key] = {
-                    'title': item.get(f'title_{lang}', item.get('title_uk', '')),
-                    'content': item.get(f'content_{lang}', item.get('content_uk', []))
-                }
-
-        # Етапи співпраці
-        stages_data = program.get('stages', {})
-        if stages_data:
-            data['stages'] = stages_data.get(lang, stages_data.get('uk', []))
-
-        # Навички
-        skills_data = program.get('skills', {})
-        if skills_data:
-            data['skills'] = skills_data.get(lang, skills_data.get('uk', []))
-
-        # Гарантія
-        guarantee_data = program.get('guarantee', {})
-        if guarantee_data:
-            data['guarantee'] = {
-                'title': guarantee_data.get(f'title_{lang}', guarantee_data.get('title_uk', '')),
-                'content': guarantee_data.get(f'content_{lang}', guarantee_data.get('content_uk', []))
-            }
-
-        # Компоненти
-        components_data = program.get('components', {})
-        if components_data:
-            data['components'] = {}
-            for key, comp in components_data.items():
-                data['components'][key] = {
-                    'title': comp.get(f'title_{lang}', comp.get('title_uk', '')),
-                    'subtitle': comp.get(f'subtitle_{lang}', comp.get('subtitle_uk', '')),
-                    'features': comp.get(f'features_{lang}', comp.get('features_uk', []))
-                }
-
-        # Досвід
-        experience_data = program.get('experience', {})
-        if experience_data:
-            data['experience'] = experience_data.get(lang, experience_data.get('uk', ''))
-
-        # Форма консультації
-        data['consultation_form'] = CorporateConsultationForm()
-
+    if slug == CORPORATE_SLUG:
         # Використовуємо спеціальний шаблон для корпоративної програми
-        return render(request, 'core/program_detail_corporate.html', {'program': data})
+        return render(request, 'core/program_detail_corporate.html', {
+            'program': program,
+            'consultation_form': CorporateConsultationForm(),
+        })
 
-    return render(request, 'core/program_detail.html', {'program': data})
+    return render(request, 'core/program_detail.html', {'program': program})
 
 def school_location(request, slug):
     """Orphan page: локація (13 локацій)."""
-    location = LOCATIONS.get(slug)
+    location = get_catalog(get_language()).locations.get(slug)
 
     if not location:
         raise Http404(f"Локація '{slug}' не знайдена")
 
-    # Переклад
-    lang = get_language()
-    data = {
-        'slug': slug,
-        'name': location.get(f'name_{lang}', location['name']),
-        'district': location.get(f'district_{lang}', location['district']),
-        'city': location.get(f'city_{lang}', location.get('city', '')),
-        'seo_content': location.get(f'seo_content_{lang}', location.get('seo_content', '')),
-        'why_online': location.get(f'why_online_{lang}', location.get('why_online', [])),
-    }
-
-    return render(request, 'core/school_location.html', {'location': data})
+    return render(request, 'core/school_location.html', {'location': location})
 
 def city_page(request, city):
     """Orphan page: місто (4 міста)."""
@@ -281,46 +135,23 @@ def city_page(request, city):
         from django.shortcuts import redirect
         return redirect('core:news_list', permanent=True)
 
-    city_data = CITIES.get(city)
+    city_data = get_catalog(get_language()).cities.get(city)
 
     if not city_data:
         raise Http404(f"Місто '{city}' не знайдене")
 
-    # Переклад
-    lang = get_language()
-    city_name = city_data.get(f'name_{lang}', city_data['name'])
-    city_name_ru = city_data.get('name_ru', city_data['name'])
-
-    # Знайти локації в цьому місті
-    city_locations = []
-    for loc_slug, loc_data in LOCATIONS.items():
-        if loc_data.get('city') == city_name or loc_data.get('city_ru') == city_name_ru:
-            city_locations.append({
-                'slug': loc_slug,
-                'district': loc_data.get(f'district_{lang}', loc_data.get('district', '')),
-            })
-
-    data = {
-        'slug': city,
-        'name': city_name,
-        'name_ru': city_name_ru,
-        'seo_content': city_data.get(f'seo_content_{lang}', city_data.get('seo_content', '')),
-        'achievements': city_data.get(f'achievements_{lang}', city_data.get('achievements', [])),
-        'locations': city_locations,
-    }
-
-    return render(request, 'core/city_page.html', {'city': data})
+    return render(request, 'core/city_page.html', {'city': city_data})
 
 
 def news_list(request):
     """Список всіх статей блогу."""
     lang = get_language()
-    articles = NewsArticle.objects.filter(is_published=True)
+    # Лише поля для списку (без content_uk / content_ru)
+    articles = NewsArticle.objects.published().for_list()
 
-    # Пагінація
-    paginator = Paginator(articles, 10)  # 10 статей на сторінку
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Keyset пагінація по (published_at, id), 10 статей на сторінку (без COUNT(*))
+    paginator = KeysetPaginator(articles, 'published_at', per_page=10)
+    page_obj = paginator.get_page(request.GET)
 
     context = {
         'articles': page_obj,
@@ -365,15 +196,14 @@ def feedback_list(request):
     lang = get_language()
     testimonials = Testimonial.objects.filter(is_published=True).order_by('-created_at')
 
-    # Статистика для intro
-    total_count = testimonials.count()
-    avg_rating = testimonials.aggregate(avg=models.Avg('rating'))['avg'] or 0
-    avg_rating = round(avg_rating, 1) if avg_rating else 0
+    # Статистика для intro (матеріалізована, один запит по pk)
+    stats = get_testimonial_stats()
+    total_count = stats.count
+    avg_rating = stats.avg_rating
 
-    # Пагінація
-    paginator = Paginator(testimonials, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Keyset пагінація по (created_at, id)
+    paginator = KeysetPaginator(testimonials, 'created_at', per_page=10, count=total_count)
+    page_obj = paginator.get_page(request.GET)
 
     context = {
         'testimonials': page_obj,
@@ -381,6 +211,7 @@ def feedback_list(request):
         'current_language': lang,
         'total_count': total_count,
         'avg_rating': avg_rating,
+        'testimonial_stats': stats,
     }
     return render(request, 'core/feedback.html', context)
 
@@ -644,62 +475,32 @@ def submit_consultation(request):
     else:
         form = ConsultationForm(request.POST)
 
-    if form.is_valid():
-        try:
-            consultation = form.save(commit=False)
-
-            # Збираємо UTM параметри
-            consultation.utm_source = request.GET.get('utm_source', '') or request.POST.get('utm_source', '')
-            consultation.utm_medium = request.GET.get('utm_medium', '') or request.POST.get('utm_medium', '')
-            consultation.utm_campaign = request.GET.get('utm_campaign', '') or request.POST.get('utm_campaign', '')
-            consultation.utm_term = request.GET.get('utm_term', '') or request.POST.get('utm_term', '')
-            consultation.fbclid = request.GET.get('fbclid', '') or request.POST.get('fbclid', '')
-            consultation.gclid = request.GET.get('gclid', '') or request.POST.get('gclid', '')
-            consultation.referrer = request.META.get('HTTP_REFERER', '')
-
-            # Зберегти вибраний прайс-пакет
-            selected_pricing = request.POST.get('selected_pricing', '')
-            if selected_pricing:
-                consultation.utm_content = f"pricing:{selected_pricing}"
-            else:
-                consultation.utm_content = request.GET.get('utm_content', '') or request.POST.get('utm_content', '')
-
-            # IP адреса
-            from apps.leads.utils import get_client_ip
-            consultation.ip_address = get_client_ip(request)
-
-            # КРИТИЧНО: Обробка ValidationError при збереженні
-            try:
-                consultation.save()
-            except ValidationError as e:
-                # ValidationError від model validators
-                if hasattr(e, 'error_dict'):
-                    for field, errors in e.error_dict.items():
-                        form.add_error(field, errors)
-                else:
-                    form.add_error(None, e)
-
-                return render(request, 'core/components/consultation_form.html', {
-                    'form': form
-                }, status=400)
-
-            # Повертаємо success message з HTMX redirect
-            response = HttpResponse(status=200)
-            response['HX-Redirect'] = reverse('core:thank_you')
-            return response
-
-        except Exception as e:
-            # Інші несподівані помилки
-            logger.error('[ConsultationForm] Unexpected error: %s', e, exc_info=True)
-            form.add_error(None, 'Помилка сервера. Спробуйте ще раз.')
-            return render(request, 'core/components/consultation_form.html', {
-                'form': form
-            }, status=500)
-
-    # Якщо форма невалідна, повертаємо помилки
-    return render(request, 'core/components/consultation_form.html', {
-        'form': form
-    }, status=400)
+    # Зберегти вибраний прайс-пакет замість utm_content
+    selected_pricing = request.POST.get('selected_pricing', '')
+    overrides = {'utm_content': f'pricing:{selected_pricing}'} if selected_pricing else None
+
+    try:
+        # Валідація, атрибуція та запис - спільний шлях з TrialLesson (apps.leads.ingestion)
+        result = ingest(form, request, overrides=overrides)
+    except Exception as e:
+        # Інші несподівані помилки
+        logger.error('[ConsultationForm] Unexpected error: %s', e, exc_info=True)
+        form.add_error(None, 'Помилка сервера. Спробуйте ще раз.')
+        return render(request, 'core/components/consultation_form.html', {
+            'form': form
+        }, status=500)
+
+    if result.ok:
+        # Повертаємо success message з HTMX redirect
+        response = HttpResponse(status=200)
+        response['HX-Redirect'] = reverse('core:thank_you')
+    else:
+        # Якщо форма невалідна, повертаємо помилки
+        response = render(request, 'core/components/consultation_form.html', {
+            'form': form
+        }, status=400)
+    response['Server-Timing'] = result.server_timing()
+    return response
 
 
 @require_http_methods(["GET"])
@@ -2,7 +2,12 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
-from .models import TrialLesson, ConsultationRequest
+from django.utils import timezone
+from . import analytics
+from .analytics import MEDIUM_LABELS, SOURCE_ICONS, classify_source
+from .models import TrialLesson, ConsultationRequest, LeadDailyStat, LeadNotification
+
+SOURCE_LABELS = dict(LeadDailyStat.SOURCE_CHOICES)
 
 
 # Українізація Admin Site
@@ -25,27 +30,13 @@ class UnifiedLeadAdminMixin:
 
     def get_source_display(self, obj):
         """Відображення джерела з іконками"""
-        source = obj.utm_source.lower() if obj.utm_source else ''
-        medium = obj.utm_medium.lower() if obj.utm_medium else ''
-
-        if 'google' in source or 'gclid' in str(obj.gclid):
-            icon = '🔍'
-            label = 'Google'
-        elif 'facebook' in source or 'fb' in source or 'fbclid' in str(obj.fbclid):
-            icon = '📘'
-            label = 'Facebook'
-        elif 'instagram' in source:
-            icon = '📷'
-            label = 'Instagram'
-        elif 'organic' in medium or not source:
-            icon = '🌐'
-            label = 'Органічний трафік'
-        else:
-            icon = '📊'
+        source = classify_source(obj.utm_source, obj.utm_medium, obj.gclid, obj.fbclid)
+        if source == LeadDailyStat.SOURCE_OTHER:
             label = obj.utm_source or 'Не вказано'
-
+        else:
+            label = SOURCE_LABELS[source]
         campaign = f' ({obj.utm_campaign})' if obj.utm_campaign else ''
-        return format_html(f'{icon} <strong>{label}</strong>{campaign}')
+        return format_html('{} <strong>{}</strong>{}', SOURCE_ICONS[source], label, campaign)
     get_source_display.short_description = 'Джерело'
 
     def get_contact_info(self, obj):
@@ -60,29 +51,22 @@ class UnifiedLeadAdminMixin:
     def get_channel_display(self, obj):
         """Відображення каналу"""
         medium = obj.utm_medium or 'Не вказано'
-        medium_map = {
-            'cpc': '💰 Платна реклама',
-            'organic': '🌿 Органічний пошук',
-            'social': '📱 Соціальні мережі',
-            'email': '📧 Email',
-            'direct': '🔗 Прямий перехід',
-        }
-        return medium_map.get(medium.lower(), medium)
+        return MEDIUM_LABELS.get(medium.lower(), medium)
     get_channel_display.short_description = 'Канал'
 
 
 @admin.register(TrialLesson)
 class TrialLessonAdmin(admin.ModelAdmin, UnifiedLeadAdminMixin):
     """Admin для заявок на пробний урок"""
-    list_display = ['get_lead_type_display', 'get_contact_info', 'get_source_display', 'get_channel_display', 'test_status', 'created_at']
+    list_display = ['get_lead_type_display', 'get_contact_info', 'get_source_display', 'get_channel_display', 'test_status', 'submission_count', 'created_at']
     list_filter = ['test_status', 'created_at', 'utm_source', 'utm_medium', 'email_sent']
     search_fields = ['name', 'phone', 'utm_campaign', 'utm_source']
-    readonly_fields = ['created_at', 'ip_address', 'fbclid', 'gclid', 'referrer']
+    readonly_fields = ['created_at', 'last_submitted_at', 'submission_count', 'ip_address', 'fbclid', 'gclid', 'referrer']
     date_hierarchy = 'created_at'
 
     fieldsets = (
         ('Основна інформація', {
-            'fields': ('name', 'phone', 'created_at')
+            'fields': ('name', 'phone', 'created_at', 'submission_count', 'last_submitted_at')
         }),
         ('Джерело ліду', {
             'fields': ('utm_source', 'utm_medium', 'utm_campaign'),
@@ -112,15 +96,15 @@ class TrialLessonAdmin(admin.ModelAdmin, UnifiedLeadAdminMixin):
 @admin.register(ConsultationRequest)
 class ConsultationRequestAdmin(admin.ModelAdmin, UnifiedLeadAdminMixin):
     """Admin для заявок на консультацію"""
-    list_display = ['get_lead_type_display', 'get_contact_info', 'get_source_display', 'get_channel_display', 'prefers_messenger', 'created_at']
+    list_display = ['get_lead_type_display', 'get_contact_info', 'get_source_display', 'get_channel_display', 'prefers_messenger', 'submission_count', 'created_at']
     list_filter = ['prefers_messenger', 'messenger_choice', 'created_at', 'utm_source', 'utm_medium']
     search_fields = ['phone', 'utm_campaign', 'utm_source']
-    readonly_fields = ['created_at', 'updated_at', 'ip_address', 'fbclid', 'gclid', 'referrer']
+    readonly_fields = ['created_at', 'last_submitted_at', 'submission_count', 'updated_at', 'ip_address', 'fbclid', 'gclid', 'referrer']
     date_hierarchy = 'created_at'
 
     fieldsets = (
         ('Основна інформація', {
-            'fields': ('phone', 'prefers_messenger', 'messenger_choice', 'created_at')
+            'fields': ('phone', 'prefers_messenger', 'messenger_choice', 'created_at', 'submission_count', 'last_submitted_at')
         }),
         ('Джерело ліду', {
             'fields': ('utm_source', 'utm_medium', 'utm_campaign'),
@@ -139,3 +123,56 @@ class ConsultationRequestAdmin(admin.ModelAdmin, UnifiedLeadAdminMixin):
             'classes': ('collapse',)
         }),
     )
+
+
+@admin.register(LeadNotification)
+class LeadNotificationAdmin(admin.ModelAdmin):
+    """Admin для outbox нотифікацій (доставляє send_lead_notifications)"""
+    list_display = ['lead', 'channel', 'status', 'attempts', 'available_at', 'sent_at']
+    list_filter = ['status', 'channel']
+    readonly_fields = ['lead', 'channel', 'created_at', 'sent_at', 'last_error']
+    actions = ['retry_notifications']
+
+    @admin.action(description='Повторити відправку')
+    def retry_notifications(self, request, queryset):
+        updated = queryset.exclude(status=LeadNotification.STATUS_SENT).update(
+            status=LeadNotification.STATUS_PENDING, attempts=0, available_at=timezone.now(),
+        )
+        self.message_user(request, f'Повторна відправка: {updated}')
+
+
+@admin.register(LeadDailyStat)
+class LeadDailyStatAdmin(admin.ModelAdmin):
+    """
+    Дашборд заявок: підсумки за період (analytics.report, з кешу) над списком
+    денних рядків. Дані лише для читання - оновлюються при створенні заявок
+    та командою rebuild_lead_stats.
+    """
+    change_list_template = 'admin/leads/leaddailystat/change_list.html'
+    list_display = ['date', 'lead_type', 'source_group', 'utm_source', 'utm_medium', 'utm_campaign', 'count']
+    list_filter = ['lead_type', 'source_group', 'utm_medium']
+    search_fields = ['utm_source', 'utm_campaign']
+    date_hierarchy = 'date'
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def changelist_view(self, request, extra_context=None):
+        # Параметри періоду не є фільтрами ChangeList
+        params = request.GET.copy()
+        period = {name: params.pop(name)[-1] for name in analytics.PERIOD_PARAMS if name in params}
+        request.GET = params
+        try:
+            start, end = analytics.parse_period(period)
+        except ValueError as e:
+            self.message_user(request, str(e), level='error')
+            start, end = analytics.default_period()
+        extra_context = {
+            **(extra_context or {}),
+            'report': analytics.report(start, end),
+            'report_days': [7, 30, 90, 365],
+        }
+        return super().changelist_view(request, extra_context)
@@ -0,0 +1,265 @@
+"""
+Аналітика заявок за денними підсумками (LeadDailyStat).
+
+Звіти (admin дашборд, JSON endpoint) читають лише LeadDailyStat - кілька
+рядків на день замість сканування TrialLesson / ConsultationRequest:
+
+- record: при створенні заявки (сигнал post_save, bulk_ingest) лічильник
+  рядка (дата, тип, джерело, utm_source, utm_medium, utm_campaign)
+  збільшується через F() після commit транзакції заявки - без додаткових
+  записів і блокувань рядків підсумків у ній
+- rebuild: повний перерахунок за період (команда rebuild_lead_stats)
+- report: підсумки за період, кешуються під номером версії; record /
+  rebuild збільшують версію після commit
+
+Класифікація джерела (classify_source) та підписи каналів (MEDIUM_LABELS)
+спільні з admin списками заявок.
+"""
+import time
+from collections import Counter
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from apps.core.models import ConsultationRequest
+
+from .models import LeadDailyStat, TrialLesson
+
+VERSION_KEY = 'lead_analytics:version'
+REPORT_KEY = 'lead_analytics:report:{version}:{start}:{end}'
+
+# Тип заявки за моделлю (proxy leads.ConsultationRequest має те саме model_name)
+LEAD_TYPES = {
+    'triallesson': LeadDailyStat.LEAD_TYPE_TRIAL,
+    'consultationrequest': LeadDailyStat.LEAD_TYPE_CONSULTATION,
+}
+
+SOURCE_ICONS = {
+    LeadDailyStat.SOURCE_GOOGLE: '🔍',
+    LeadDailyStat.SOURCE_FACEBOOK: '📘',
+    LeadDailyStat.SOURCE_INSTAGRAM: '📷',
+    LeadDailyStat.SOURCE_ORGANIC: '🌐',
+    LeadDailyStat.SOURCE_OTHER: '📊',
+}
+
+MEDIUM_LABELS = {
+    'cpc': '💰 Платна реклама',
+    'organic': '🌿 Органічний пошук',
+    'social': '📱 Соціальні мережі',
+    'email': '📧 Email',
+    'direct': '🔗 Прямий перехід',
+}
+
+PERIOD_PARAMS = ('start', 'end', 'days')
+
+KEY_FIELDS = ('date', 'lead_type', 'source_group', 'utm_source', 'utm_medium', 'utm_campaign')
+LEAD_FIELDS = ('created_at', 'utm_source', 'utm_medium', 'utm_campaign', 'gclid', 'fbclid')
+
+StatKey = Tuple[date, str, str, str, str, str]
+
+
+def classify_source(utm_source: str, utm_medium: str, gclid: str = '', fbclid: str = '') -> str:
+    """Група джерела заявки (LeadDailyStat.SOURCE_*)."""
+    source = utm_source.lower() if utm_source else ''
+    medium = utm_medium.lower() if utm_medium else ''
+
+    # Click ID без UTM (автотегування Google Ads / Facebook)
+    if 'google' in source or gclid:
+        return LeadDailyStat.SOURCE_GOOGLE
+    if 'facebook' in source or 'fb' in source or fbclid:
+        return LeadDailyStat.SOURCE_FACEBOOK
+    if 'instagram' in source:
+        return LeadDailyStat.SOURCE_INSTAGRAM
+    if 'organic' in medium or not source:
+        return LeadDailyStat.SOURCE_ORGANIC
+    return LeadDailyStat.SOURCE_OTHER
+
+
+def stat_key(lead_type: str, values: Dict[str, object]) -> StatKey:
+    """Ключ рядка LeadDailyStat для заявки (values - поля LEAD_FIELDS)."""
+    return (
+        timezone.localdate(values['created_at']),
+        lead_type,
+        classify_source(values['utm_source'], values['utm_medium'], values['gclid'], values['fbclid']),
+        values['utm_source'] or '',
+        values['utm_medium'] or '',
+        values['utm_campaign'] or '',
+    )
+
+
+def lead_type_of(model) -> Optional[str]:
+    return LEAD_TYPES.get(model._meta.model_name)
+
+
+def record(leads: Iterable[object]) -> None:
+    """Додає створені заявки до денних підсумків після commit поточної транзакції."""
+    counts: Counter = Counter()
+    for lead in leads:
+        lead_type = lead_type_of(type(lead))
+        if lead_type is None:
+            continue
+        counts[stat_key(lead_type, {name: getattr(lead, name) for name in LEAD_FIELDS})] += 1
+    if counts:
+        transaction.on_commit(lambda: _apply(counts))
+
+
+def _apply(counts: Counter) -> None:
+    with transaction.atomic():
+        for key, count in counts.items():
+            _increment(dict(zip(KEY_FIELDS, key)), count)
+    invalidate()
+
+
+def _increment(key: Dict[str, object], count: int) -> None:
+    if LeadDailyStat.objects.filter(**key).update(count=F('count') + count):
+        return
+    try:
+        with transaction.atomic():
+            LeadDailyStat.objects.create(count=count, **key)
+    except IntegrityError:
+        # Рядок щойно створила паралельна заявка
+        LeadDailyStat.objects.filter(**key).update(count=F('count') + count)
+
+
+def rebuild(start: Optional[date] = None, end: Optional[date] = None, batch_size: int = 1000) -> int:
+    """
+    Перераховує підсумки за період [start, end] (локальні дати; None - без
+    обмеження) з таблиць заявок. Повертає кількість врахованих заявок.
+    """
+    counts: Counter = Counter()
+    for model in (TrialLesson, ConsultationRequest):
+        leads = model.objects.all()
+        if start:
+            leads = leads.filter(created_at__date__gte=start)
+        if end:
+            leads = leads.filter(created_at__date__lte=end)
+        lead_type = lead_type_of(model)
+        for values in leads.values(*LEAD_FIELDS).iterator(chunk_size=batch_size):
+            counts[stat_key(lead_type, values)] += 1
+
+    stats = _in_range(LeadDailyStat.objects.all(), start, end)
+    with transaction.atomic():
+        stats.delete()
+        LeadDailyStat.objects.bulk_create(
+            [LeadDailyStat(count=count, **dict(zip(KEY_FIELDS, key))) for key, count in counts.items()],
+            batch_size=batch_size,
+        )
+    transaction.on_commit(invalidate)
+    return sum(counts.values())
+
+
+def _in_range(queryset, start: Optional[date], end: Optional[date]):
+    if start:
+        queryset = queryset.filter(date__gte=start)
+    if end:
+        queryset = queryset.filter(date__lte=end)
+    return queryset
+
+
+def default_period(days: Optional[int] = None) -> Tuple[date, date]:
+    """Останні days днів включно з сьогоднішнім (LEAD_ANALYTICS_DEFAULT_DAYS)."""
+    days = days or getattr(settings, 'LEAD_ANALYTICS_DEFAULT_DAYS', 30)
+    end = timezone.localdate()
+    return end - timedelta(days=days - 1), end
+
+
+def parse_period(params) -> Tuple[date, date]:
+    """
+    Період звіту з параметрів запиту: ?start=YYYY-MM-DD&end=YYYY-MM-DD або
+    ?days=N (за замовчуванням default_period). ValueError - некоректні дати.
+    """
+    if params.get('start') or params.get('end'):
+        default_start, default_end = default_period()
+        start = parse_date(params['start']) if params.get('start') else default_start
+        end = parse_date(params['end']) if params.get('end') else default_end
+        if start is None or end is None:
+            raise ValueError('Дата має бути у форматі YYYY-MM-DD')
+    else:
+        days = params.get('days')
+        if days is not None and not (days.isdigit() and int(days) > 0):
+            raise ValueError('days має бути додатним числом')
+        start, end = default_period(int(days) if days else None)
+    if start > end:
+        raise ValueError('start пізніше за end')
+    return start, end
+
+
+def get_version() -> int:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate() -> None:
+    """Нова версія: закешовані звіти більше не читаються."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def report(start: date, end: date) -> Dict[str, object]:
+    """Підсумки заявок за період [start, end] (з кешу, якщо дані не змінювались)."""
+    key = REPORT_KEY.format(version=get_version(), start=start.isoformat(), end=end.isoformat())
+    data = cache.get(key)
+    if data is None:
+        data = build_report(start, end)
+        cache.set(key, data, getattr(settings, 'LEAD_ANALYTICS_CACHE_TIMEOUT', 3600))
+    return data
+
+
+def build_report(start: date, end: date) -> Dict[str, object]:
+    stats = _in_range(LeadDailyStat.objects.all(), start, end)
+    source_labels = dict(LeadDailyStat.SOURCE_CHOICES)
+    type_labels = dict(LeadDailyStat.LEAD_TYPE_CHOICES)
+    campaigns_limit = getattr(settings, 'LEAD_ANALYTICS_TOP_CAMPAIGNS', 20)
+
+    days: Dict[date, Dict[str, int]] = {}
+    for row in stats.values('date', 'lead_type').annotate(total=Sum('count')).order_by('date'):
+        day = days.setdefault(row['date'], dict.fromkeys(type_labels, 0))
+        day[row['lead_type']] = row['total']
+
+    def grouped(field):
+        return stats.values(field).annotate(total=Sum('count')).order_by('-total', field)
+
+    return {
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'total': stats.aggregate(total=Sum('count'))['total'] or 0,
+        'by_day': [
+            {'date': day.isoformat(), **counts, 'total': sum(counts.values())}
+            for day, counts in days.items()
+        ],
+        'by_lead_type': [
+            {'lead_type': row['lead_type'], 'label': type_labels.get(row['lead_type'], row['lead_type']), 'count': row['total']}
+            for row in grouped('lead_type')
+        ],
+        'by_source': [
+            {
+                'source': row['source_group'],
+                'label': f"{SOURCE_ICONS.get(row['source_group'], '')} {source_labels.get(row['source_group'], row['source_group'])}",
+                'count': row['total'],
+            }
+            for row in grouped('source_group')
+        ],
+        'by_medium': [
+            {
+                'medium': row['utm_medium'],
+                'label': MEDIUM_LABELS.get(row['utm_medium'].lower(), row['utm_medium'] or 'Не вказано'),
+                'count': row['total'],
+            }
+            for row in grouped('utm_medium')
+        ],
+        'by_campaign': [
+            {'campaign': row['utm_campaign'], 'count': row['total']}
+            for row in grouped('utm_campaign').exclude(utm_campaign='')[:campaigns_limit]
+        ],
+    }
@@ -6,7 +6,6 @@ class LeadsConfig(AppConfig):
     name = 'apps.leads'
     verbose_name = 'Заявки на пробні уроки'
 
-
-
-
-
+    def ready(self):
+        # Денні підсумки заявок (LeadDailyStat)
+        from . import signals  # noqa: F401
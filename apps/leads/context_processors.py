@@ -1,11 +1,10 @@
-from apps.core.models import RunningLineText
+from apps.core.running_line import get_running_line_texts
 
 
 def running_line_context(request):
-    """Додає тексти бігучої стрічки у всі templates"""
+    """Додає тексти бігучої стрічки у всі templates (з версіонованого кешу)"""
     try:
-        running_lines = RunningLineText.objects.filter(is_active=True).order_by('order', 'id')
-        running_line_texts = [line.text for line in running_lines]
+        running_line_texts = get_running_line_texts()
         # Для сумісності зі старим кодом, якщо потрібен один текст
         running_line_text = running_line_texts[0] if running_line_texts else ''
         return {
@@ -17,8 +16,3 @@ def running_line_context(request):
             'running_line_texts': [],
             'running_line_text': ''
         }
-
-
-
-
-
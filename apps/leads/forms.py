@@ -41,7 +41,7 @@ class TrialLessonForm(forms.ModelForm):
 
     def clean_name(self):
         """Валідація імені: якщо введено, то мінімум 2 символи"""
-        name = self.cleaned_data.get('name', '').strip()
+        name = (self.cleaned_data.get('name') or '').strip()
         if name and len(name) < 2:
             raise forms.ValidationError("Ім'я має містити мінімум 2 символи")
         return name
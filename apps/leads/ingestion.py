@@ -0,0 +1,275 @@
+"""
+Єдиний шлях запису заявок (TrialLesson, ConsultationRequest).
+
+- extract_attribution: UTM / fbclid / gclid / referrer / IP одним проходом
+  (спочатку query string, потім POST), обрізані до max_length полів моделі
+- ingest: валідація форми -> атрибуція -> save + on_saved в одній
+  транзакції; ValidationError моделі повертається як помилки форми
+- повторна заявка з того ж номера протягом LEAD_DEDUP_WINDOW_MINUTES не
+  створює нову: у наявної збільшується submission_count (пошук за
+  індексом (phone_normalized, created_at))
+- bulk_ingest: пакетний запис (replay заявок з файлу) через bulk_create,
+  з оновленням денних підсумків (apps.leads.analytics)
+- час кожного етапу: LeadIngestResult.timings (Server-Timing заголовок)
+  та агреговані metrics.snapshot() по процесу
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from . import analytics
+from .utils import get_client_ip, normalize_many, phone_key
+
+logger = logging.getLogger(__name__)
+
+ATTRIBUTION_FIELDS = (
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_content', 'utm_term', 'fbclid', 'gclid',
+)
+
+
+class StageMetrics:
+    """Агрегований час етапів запису заявок у поточному процесі."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, List[float]] = {}
+
+    def record(self, timings: Dict[str, float]) -> None:
+        with self._lock:
+            for stage, seconds in timings.items():
+                # [кількість, сума, максимум]
+                entry = self._stages.setdefault(stage, [0, 0.0, 0.0])
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                stage: {
+                    'count': count,
+                    'avg_ms': round(total / count * 1000, 3),
+                    'max_ms': round(peak * 1000, 3),
+                }
+                for stage, (count, total, peak) in self._stages.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+
+
+metrics = StageMetrics()
+
+
+class StageTimer:
+    """Час етапів одного запису (сек)."""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = time.perf_counter() - start
+
+    def finish(self) -> Dict[str, float]:
+        self.timings['total'] = time.perf_counter() - self._started
+        metrics.record(self.timings)
+        return self.timings
+
+
+@dataclass
+class LeadIngestResult:
+    """
+    Результат ingest: збережена заявка (або None) та форма з помилками.
+    duplicate - заявку об'єднано з попередньою з того ж номера.
+    """
+    instance: Optional[object]
+    form: object
+    timings: Dict[str, float] = field(default_factory=dict)
+    duplicate: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.instance is not None
+
+    def server_timing(self) -> str:
+        """Значення заголовка Server-Timing (мс)."""
+        return ', '.join(f'lead-{stage};dur={seconds * 1000:.2f}' for stage, seconds in self.timings.items())
+
+
+def _max_lengths(model) -> Dict[str, Optional[int]]:
+    return {
+        name: model._meta.get_field(name).max_length
+        for name in ATTRIBUTION_FIELDS + ('referrer',)
+    }
+
+
+def extract_attribution(request, model) -> Dict[str, object]:
+    """
+    Рекламна атрибуція заявки: поля ATTRIBUTION_FIELDS (query string має
+    пріоритет над POST), referrer та IP адреса.
+    """
+    limits = _max_lengths(model)
+    query, post = request.GET, request.POST
+    data = {}
+    for name in ATTRIBUTION_FIELDS:
+        value = query.get(name, '') or post.get(name, '')
+        data[name] = value.strip()[:limits[name]]
+    data['referrer'] = request.META.get('HTTP_REFERER', '')[:limits['referrer']]
+    data['ip_address'] = get_client_ip(request)
+    return data
+
+
+def dedup_window() -> Optional[timedelta]:
+    minutes = getattr(settings, 'LEAD_DEDUP_WINDOW_MINUTES', 0)
+    return timedelta(minutes=minutes) if minutes > 0 else None
+
+
+def merge_duplicate(model, phone_normalized: str, window: timedelta):
+    """
+    Знаходить заявку з тим самим номером за останні window і рахує повторну
+    відправку (submission_count + 1). Повертає заявку або None.
+    """
+    if not phone_normalized:
+        return None
+    now = timezone.now()
+    existing = (
+        model.objects
+        .filter(phone_normalized=phone_normalized, created_at__gte=now - window)
+        .order_by('-created_at')
+        .first()
+    )
+    if existing is None:
+        return None
+    model.objects.filter(pk=existing.pk).update(submission_count=F('submission_count') + 1, last_submitted_at=now)
+    existing.submission_count += 1
+    existing.last_submitted_at = now
+    return existing
+
+
+def _add_model_errors(form, error: ValidationError) -> None:
+    """Помилки model validators -> помилки форми (поля поза формою - загальні)."""
+    if not hasattr(error, 'error_dict'):
+        form.add_error(None, error)
+        return
+    for name, errors in error.error_dict.items():
+        form.add_error(name if name in form.fields else None, errors)
+
+
+def ingest(
+    form,
+    request,
+    overrides: Optional[Dict[str, object]] = None,
+    on_saved: Optional[Callable[[object], None]] = None,
+) -> LeadIngestResult:
+    """
+    Валідує форму заявки, додає атрибуцію та зберігає.
+
+    on_saved виконується в тій самій транзакції (наприклад, outbox нотифікацій).
+    """
+    timer = StageTimer()
+    with timer.stage('validate'):
+        valid = form.is_valid()
+    if not valid:
+        return LeadIngestResult(None, form, timer.finish())
+
+    with timer.stage('attribution'):
+        instance = form.save(commit=False)
+        for name, value in extract_attribution(request, type(instance)).items():
+            setattr(instance, name, value)
+        for name, value in (overrides or {}).items():
+            setattr(instance, name, value)
+
+    window = dedup_window()
+    if window is not None:
+        with timer.stage('dedup'):
+            with transaction.atomic():
+                existing = merge_duplicate(type(instance), phone_key(instance.phone), window)
+        if existing is not None:
+            logger.info('[LeadIngest] Repeat submission merged into %s #%s', type(existing).__name__, existing.pk)
+            return LeadIngestResult(existing, form, timer.finish(), duplicate=True)
+
+    with timer.stage('save'):
+        try:
+            with transaction.atomic():
+                instance.save()
+                if on_saved is not None:
+                    on_saved(instance)
+        except ValidationError as e:
+            logger.warning('[LeadIngest] Validation error on save: %s', e)
+            _add_model_errors(form, e)
+            instance = None
+
+    return LeadIngestResult(instance, form, timer.finish())
+
+
+@dataclass
+class BulkIngestResult:
+    """Результат bulk_ingest: створені заявки, відхилені рядки [(номер, помилки)] та час етапів."""
+    created: List[object]
+    invalid: List[Tuple[int, Dict[str, List[str]]]]
+    timings: Dict[str, float]
+
+
+def bulk_ingest(
+    model,
+    rows: Iterable[Dict[str, object]],
+    batch_size: int = 500,
+    on_saved: Optional[Callable[[List[object]], None]] = None,
+) -> BulkIngestResult:
+    """
+    Пакетний запис заявок (replay): кожен рядок перевіряється model validators,
+    валідні записуються через bulk_create пачками по batch_size.
+    """
+    timer = StageTimer()
+    valid, invalid = [], []
+    with timer.stage('bulk_validate'):
+        for index, row in enumerate(rows):
+            instance = model(**row)
+            try:
+                instance.full_clean(validate_unique=False)
+            except ValidationError as e:
+                invalid.append((index, e.message_dict))
+                continue
+            valid.append(instance)
+        # bulk_create не викликає save()
+        for instance, phone_normalized in zip(valid, normalize_many(instance.phone for instance in valid)):
+            instance.phone_normalized = phone_normalized
+
+    created = []
+    with timer.stage('bulk_save'):
+        for start in range(0, len(valid), batch_size):
+            chunk = valid[start:start + batch_size]
+            # auto_now_add перезаписує created_at при INSERT - відновлюємо оригінальні дати
+            original_dates = [instance.created_at for instance in chunk]
+            with transaction.atomic():
+                batch = model.objects.bulk_create(chunk)
+                restored = []
+                for instance, created_at in zip(batch, original_dates):
+                    if created_at and instance.pk is not None:
+                        instance.created_at = created_at
+                        restored.append(instance)
+                if restored:
+                    model.objects.bulk_update(restored, ['created_at'])
+                # bulk_create не надсилає post_save - денні підсумки напряму
+                analytics.record(batch)
+                if on_saved is not None:
+                    on_saved(batch)
+            created.extend(batch)
+    return BulkIngestResult(created, invalid, timer.finish())
@@ -0,0 +1,42 @@
+"""
+Django management команда для перерахунку денних підсумків заявок (LeadDailyStat)
+з таблиць TrialLesson / ConsultationRequest.
+Потрібна один раз після розгортання (історичні заявки) та після ручних змін заявок.
+Використання:
+    python manage.py rebuild_lead_stats                          # усі заявки
+    python manage.py rebuild_lead_stats --start 2024-01-01
+    python manage.py rebuild_lead_stats --start 2024-05-01 --end 2024-05-31
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from apps.leads import analytics
+
+
+def date_argument(value):
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise CommandError(f'Некоректна дата {value!r} (очікується YYYY-MM-DD)')
+    return parsed
+
+
+class Command(BaseCommand):
+    help = 'Перераховує денні підсумки заявок (LeadDailyStat)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', help='Перша дата (YYYY-MM-DD), за замовчуванням - без обмеження')
+        parser.add_argument('--end', help='Остання дата (YYYY-MM-DD), за замовчуванням - без обмеження')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Заявок за один запит до БД')
+
+    def handle(self, *args, **options):
+        start = date_argument(options['start']) if options['start'] else None
+        end = date_argument(options['end']) if options['end'] else None
+        if start and end and start > end:
+            raise CommandError('--start пізніше за --end')
+
+        total = analytics.rebuild(start, end, batch_size=options['batch_size'])
+        period = f'{start or "..."} - {end or "..."}'
+        self.stdout.write(self.style.SUCCESS(f'Перераховано заявок: {total} ({period})'))
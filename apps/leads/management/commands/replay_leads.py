@@ -0,0 +1,80 @@
+"""
+Django management команда для пакетного запису заявок з JSONL файлу
+(відновлення з логів / перенесення зі старої бази).
+Кожен рядок - JSON об'єкт з полями моделі: {"name": "...", "phone": "+380...", "utm_source": "..."}
+Використання:
+    python manage.py replay_leads leads.jsonl
+    python manage.py replay_leads consultations.jsonl --model consultation --batch-size 1000
+    python manage.py replay_leads leads.jsonl --notify     # додати нотифікації в outbox
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from apps.leads.ingestion import bulk_ingest
+from apps.leads.models import ConsultationRequest, TrialLesson
+from apps.leads.notifications import enqueue_many
+
+MODELS = {
+    'trial': TrialLesson,
+    'consultation': ConsultationRequest,
+}
+
+
+def parse_row(line_number, line):
+    """JSON рядок -> dict полів моделі (created_at у форматі ISO 8601)."""
+    try:
+        row = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise CommandError(f'Рядок {line_number}: невалідний JSON ({e})')
+    if not isinstance(row, dict):
+        raise CommandError(f'Рядок {line_number}: очікується JSON об\'єкт, отримано {type(row).__name__}')
+    if isinstance(row.get('created_at'), str):
+        try:
+            created_at = parse_datetime(row['created_at'])
+        except ValueError as e:
+            # Формат правильний, але дата неіснуюча (2024-02-30)
+            raise CommandError(f'Рядок {line_number}: некоректна дата created_at ({e})')
+        if created_at is None:
+            raise CommandError(f'Рядок {line_number}: created_at має бути у форматі ISO 8601')
+        row['created_at'] = created_at
+    return row
+
+
+def read_rows(path):
+    """[(номер рядка, dict полів), ...] з JSONL файлу (порожні рядки пропускаються)."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return [(line_number, parse_row(line_number, line)) for line_number, line in enumerate(f, 1) if line.strip()]
+    except OSError as e:
+        raise CommandError(f'Не вдалося прочитати {path}: {e}')
+
+
+class Command(BaseCommand):
+    help = 'Пакетно записує заявки з JSONL файлу (bulk_create)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', help='JSONL файл із заявками')
+        parser.add_argument('--model', choices=sorted(MODELS), default='trial', help='Тип заявок')
+        parser.add_argument('--batch-size', type=int, default=500, help='Заявок в одному INSERT')
+        parser.add_argument('--notify', action='store_true', help='Нотифікації для пробних уроків (outbox)')
+
+    def handle(self, *args, **options):
+        model = MODELS[options['model']]
+        rows = read_rows(options['file'])
+
+        on_saved = enqueue_many if options['notify'] and model is TrialLesson else None
+        try:
+            result = bulk_ingest(model, [row for _, row in rows], batch_size=options['batch_size'], on_saved=on_saved)
+        except TypeError as e:
+            # Невідоме поле моделі в JSON
+            raise CommandError(str(e))
+
+        for index, errors in result.invalid:
+            self.stderr.write(f'Рядок {rows[index][0]}: {errors}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Записано: {len(result.created)}, відхилено: {len(result.invalid)}'
+        ))
+        for stage, seconds in result.timings.items():
+            self.stdout.write(f'  {stage}: {seconds * 1000:.1f} ms')
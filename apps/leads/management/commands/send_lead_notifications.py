@@ -0,0 +1,41 @@
+"""
+Django management команда для доставки нотифікацій про нові заявки (outbox).
+Використання:
+    python manage.py send_lead_notifications            # один прохід (cron)
+    python manage.py send_lead_notifications --loop     # воркер
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.leads.notifications import NotificationWorker
+
+
+class Command(BaseCommand):
+    help = 'Відправляє нотифікації про нові заявки (email, Telegram) з outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Працювати безперервно')
+        parser.add_argument('--interval', type=float, default=5.0, help='Пауза між проходами без роботи (сек)')
+        parser.add_argument('--batch-size', type=int, default=None, help='Нотифікацій за прохід')
+
+    def handle(self, *args, **options):
+        worker = NotificationWorker(batch_size=options['batch_size'])
+
+        while True:
+            stats = worker.run_once()
+            if stats.claimed:
+                self.stdout.write(
+                    f'Відправлено: {stats.sent}, повтор: {stats.retried}, помилок: {stats.failed}'
+                )
+
+            if not options['loop']:
+                # Повна пачка - можливо, є ще; cron запуск дочищає чергу
+                if stats.claimed < worker.batch_size:
+                    break
+                continue
+
+            if stats.claimed < worker.batch_size:
+                close_old_connections()
+                time.sleep(options['interval'])
@@ -0,0 +1,87 @@
+# Generated by Django 4.2.8 on 2026-10-18 19:52
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("leads", "0007_make_name_optional"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeadNotification",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "channel",
+                    models.CharField(
+                        choices=[("email", "Email"), ("telegram", "Telegram")],
+                        max_length=20,
+                        verbose_name="Канал",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Очікує"),
+                            ("sent", "Відправлено"),
+                            ("failed", "Помилка"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="Статус",
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0, verbose_name="Спроб")),
+                (
+                    "available_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="Наступна спроба"
+                    ),
+                ),
+                ("last_error", models.TextField(blank=True, verbose_name="Остання помилка")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Дата створення"),
+                ),
+                (
+                    "sent_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="Дата відправки"),
+                ),
+                (
+                    "lead",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="notifications",
+                        to="leads.triallesson",
+                        verbose_name="Заявка",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Нотифікація",
+                "verbose_name_plural": "Нотифікації",
+                "ordering": ["available_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "available_at"], name="leads_notif_status_avail_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="leadnotification",
+            constraint=models.UniqueConstraint(
+                fields=("lead", "channel"), name="leads_notification_lead_channel_uniq"
+            ),
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 4.2.8 on 2026-10-18 19:55
+
+from django.db import migrations, models
+
+
+def phone_key(phone):
+    """
+    Копія нормалізації телефону (apps.leads.utils.phone_key) на момент
+    міграції: +380XXXXXXXXX або '' для некоректного номера.
+    """
+    phone = (phone or "").strip()
+    clean = phone.replace(" ", "").replace("(", "").replace(")", "").replace("-", "")
+    digits = "".join(filter(str.isdigit, clean))
+    if not digits:
+        return ""
+    if clean.startswith("+380"):
+        return "+380" + digits[3:] if len(digits) == 12 else ""
+    if len(digits) == 12 and digits.startswith("380"):
+        return "+380" + digits[3:]
+    if len(digits) == 11 and digits.startswith("38"):
+        return "+380" + digits[2:]
+    if len(digits) == 10 and digits.startswith("0"):
+        return "+380" + digits[1:]
+    if len(digits) == 9:
+        return "+380" + digits
+    return ""
+
+
+def fill_phone_normalized(apps, schema_editor):
+    """Нормалізований телефон для вже збережених заявок"""
+    TrialLesson = apps.get_model("leads", "TrialLesson")
+    batch = []
+    for lead in TrialLesson.objects.only("id", "phone").iterator(chunk_size=500):
+        lead.phone_normalized = phone_key(lead.phone)
+        batch.append(lead)
+        if len(batch) == 500:
+            TrialLesson.objects.bulk_update(batch, ["phone_normalized"])
+            batch = []
+    if batch:
+        TrialLesson.objects.bulk_update(batch, ["phone_normalized"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("leads", "0008_lead_notification_outbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="triallesson",
+            name="last_submitted_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Остання повторна заявка"
+            ),
+        ),
+        migrations.AddField(
+            model_name="triallesson",
+            name="phone_normalized",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=13,
+                verbose_name="Телефон (нормалізований)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="triallesson",
+            name="submission_count",
+            field=models.PositiveIntegerField(
+                default=1,
+                help_text="Повторні відправки з того ж номера у вікні LEAD_DEDUP_WINDOW_MINUTES",
+                verbose_name="Кількість заявок",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="triallesson",
+            index=models.Index(
+                fields=["phone_normalized", "created_at"], name="leads_trial_phone_created_idx"
+            ),
+        ),
+        migrations.RunPython(fill_phone_normalized, migrations.RunPython.noop),
+    ]
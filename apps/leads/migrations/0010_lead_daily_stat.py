@@ -0,0 +1,78 @@
+# Generated by Django 4.2.8 on 2026-10-18 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("leads", "0009_lead_phone_dedup"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeadDailyStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="Дата")),
+                (
+                    "lead_type",
+                    models.CharField(
+                        choices=[("trial", "Пробний урок"), ("consultation", "Консультація")],
+                        max_length=20,
+                        verbose_name="Тип заявки",
+                    ),
+                ),
+                (
+                    "source_group",
+                    models.CharField(
+                        choices=[
+                            ("google", "Google"),
+                            ("facebook", "Facebook"),
+                            ("instagram", "Instagram"),
+                            ("organic", "Органічний трафік"),
+                            ("other", "Інше"),
+                        ],
+                        max_length=20,
+                        verbose_name="Джерело",
+                    ),
+                ),
+                (
+                    "utm_source",
+                    models.CharField(blank=True, max_length=100, verbose_name="UTM Source"),
+                ),
+                (
+                    "utm_medium",
+                    models.CharField(blank=True, max_length=100, verbose_name="UTM Medium"),
+                ),
+                (
+                    "utm_campaign",
+                    models.CharField(blank=True, max_length=100, verbose_name="UTM Campaign"),
+                ),
+                ("count", models.PositiveIntegerField(default=0, verbose_name="Заявок")),
+            ],
+            options={
+                "verbose_name": "Статистика заявок за день",
+                "verbose_name_plural": "Статистика заявок",
+                "ordering": ["-date", "lead_type", "source_group"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="leaddailystat",
+            constraint=models.UniqueConstraint(
+                fields=(
+                    "date",
+                    "lead_type",
+                    "source_group",
+                    "utm_source",
+                    "utm_medium",
+                    "utm_campaign",
+                ),
+                name="leads_daily_stat_key_uniq",
+            ),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
+from django.utils import timezone
 from django.core.validators import RegexValidator
 from apps.core.models import ConsultationRequest as CoreConsultationRequest
+from .utils import phone_key
 
 
 class TrialLesson(models.Model):
@@ -54,15 +56,27 @@ class TrialLesson(models.Model):
     telegram_sent = models.BooleanField(default=False, verbose_name="Telegram відправлено")
     notified_at = models.DateTimeField(null=True, blank=True, verbose_name="Дата нотифікації")
 
+    # Дедуплікація повторних заявок (apps.leads.ingestion):
+    phone_normalized = models.CharField(max_length=13, blank=True, default='', editable=False, verbose_name="Телефон (нормалізований)")
+    submission_count = models.PositiveIntegerField(default=1, verbose_name="Кількість заявок", help_text="Повторні відправки з того ж номера у вікні LEAD_DEDUP_WINDOW_MINUTES")
+    last_submitted_at = models.DateTimeField(null=True, blank=True, verbose_name="Остання повторна заявка")
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Заявка hero"
         verbose_name_plural = "Заявки hero"
         app_label = 'leads'
+        indexes = [
+            models.Index(fields=['phone_normalized', 'created_at'], name='leads_trial_phone_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.phone} ({self.created_at.strftime('%d.%m.%Y')})"
 
+    def save(self, *args, **kwargs):
+        self.phone_normalized = phone_key(self.phone)
+        super().save(*args, **kwargs)
+
 
 class ConsultationRequest(CoreConsultationRequest):
     """Proxy модель для відображення ConsultationRequest в розділі "Ліди" """
@@ -75,6 +89,99 @@ class ConsultationRequest(CoreConsultationRequest):
         default_permissions = ('add', 'change', 'delete', 'view')
 
 
+class LeadNotification(models.Model):
+    """
+    Outbox нотифікацій про нову заявку: запис створюється разом із заявкою,
+    доставку (email, Telegram) виконує send_lead_notifications поза запитом.
+    """
+
+    CHANNEL_EMAIL = 'email'
+    CHANNEL_TELEGRAM = 'telegram'
+    CHANNEL_CHOICES = [
+        (CHANNEL_EMAIL, 'Email'),
+        (CHANNEL_TELEGRAM, 'Telegram'),
+    ]
+
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Очікує'),
+        (STATUS_SENT, 'Відправлено'),
+        (STATUS_FAILED, 'Помилка'),
+    ]
+
+    lead = models.ForeignKey(TrialLesson, on_delete=models.CASCADE, related_name='notifications', verbose_name="Заявка")
+    channel = models.CharField(max_length=20, choices=CHANNEL_CHOICES, verbose_name="Канал")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name="Статус")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="Спроб")
+    available_at = models.DateTimeField(default=timezone.now, verbose_name="Наступна спроба")
+    last_error = models.TextField(blank=True, verbose_name="Остання помилка")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата створення")
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name="Дата відправки")
+
+    class Meta:
+        ordering = ['available_at']
+        verbose_name = "Нотифікація"
+        verbose_name_plural = "Нотифікації"
+        app_label = 'leads'
+        constraints = [
+            models.UniqueConstraint(fields=['lead', 'channel'], name='leads_notification_lead_channel_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'available_at'], name='leads_notif_status_avail_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_channel_display()} #{self.lead_id} ({self.get_status_display()})"
+
+
+class LeadDailyStat(models.Model):
+    """
+    Денний підсумок заявок за джерелом, каналом, кампанією та типом заявки.
+    Оновлюється при створенні заявки (apps.leads.analytics), повний
+    перерахунок - rebuild_lead_stats.
+    """
 
+    LEAD_TYPE_TRIAL = 'trial'
+    LEAD_TYPE_CONSULTATION = 'consultation'
+    LEAD_TYPE_CHOICES = [
+        (LEAD_TYPE_TRIAL, 'Пробний урок'),
+        (LEAD_TYPE_CONSULTATION, 'Консультація'),
+    ]
 
+    SOURCE_GOOGLE = 'google'
+    SOURCE_FACEBOOK = 'facebook'
+    SOURCE_INSTAGRAM = 'instagram'
+    SOURCE_ORGANIC = 'organic'
+    SOURCE_OTHER = 'other'
+    SOURCE_CHOICES = [
+        (SOURCE_GOOGLE, 'Google'),
+        (SOURCE_FACEBOOK, 'Facebook'),
+        (SOURCE_INSTAGRAM, 'Instagram'),
+        (SOURCE_ORGANIC, 'Органічний трафік'),
+        (SOURCE_OTHER, 'Інше'),
+    ]
 
+    date = models.DateField(verbose_name="Дата")
+    lead_type = models.CharField(max_length=20, choices=LEAD_TYPE_CHOICES, verbose_name="Тип заявки")
+    source_group = models.CharField(max_length=20, choices=SOURCE_CHOICES, verbose_name="Джерело")
+    utm_source = models.CharField(max_length=100, blank=True, verbose_name="UTM Source")
+    utm_medium = models.CharField(max_length=100, blank=True, verbose_name="UTM Medium")
+    utm_campaign = models.CharField(max_length=100, blank=True, verbose_name="UTM Campaign")
+    count = models.PositiveIntegerField(default=0, verbose_name="Заявок")
+
+    class Meta:
+        ordering = ['-date', 'lead_type', 'source_group']
+        verbose_name = "Статистика заявок за день"
+        verbose_name_plural = "Статистика заявок"
+        app_label = 'leads'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'lead_type', 'source_group', 'utm_source', 'utm_medium', 'utm_campaign'],
+                name='leads_daily_stat_key_uniq',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.date:%d.%m.%Y} {self.get_lead_type_display()} / {self.get_source_group_display()}: {self.count}"
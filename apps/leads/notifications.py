@@ -0,0 +1,224 @@
+"""
+Нотифікації про нові заявки через outbox (LeadNotification).
+
+Запит (submit_trial_form) лише додає рядки outbox у тій самій транзакції,
+що й заявку - без SMTP / Telegram та без повторного lead.save().
+Доставку виконує send_lead_notifications (cron або --loop):
+
+- пачка забирається з "орендою": available_at зсувається на
+  LEAD_NOTIFICATION_LEASE сек, тому паралельний воркер її не візьме, а після
+  падіння воркера рядки повернуться в роботу (at-least-once)
+- email - одне SMTP з'єднання на пачку; Telegram - один requests.Session
+- помилка -> повтор з експоненційною затримкою, після
+  LEAD_NOTIFICATION_MAX_ATTEMPTS - статус failed
+- ідемпотентність: UniqueConstraint (lead, channel) + відправлені рядки
+  більше не забираються
+"""
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+
+import requests
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import LeadNotification, TrialLesson
+
+logger = logging.getLogger(__name__)
+
+TELEGRAM_API_URL = 'https://api.telegram.org/bot{token}/sendMessage'
+
+# Поле TrialLesson, яке позначає доставку каналом
+LEAD_FLAGS = {
+    LeadNotification.CHANNEL_EMAIL: 'email_sent',
+    LeadNotification.CHANNEL_TELEGRAM: 'telegram_sent',
+}
+
+
+def enabled_channels() -> List[str]:
+    """Канали для нових заявок: email завжди, Telegram - якщо налаштований бот."""
+    channels = [LeadNotification.CHANNEL_EMAIL]
+    if getattr(settings, 'TELEGRAM_BOT_TOKEN', '') and getattr(settings, 'TELEGRAM_CHAT_ID', ''):
+        channels.append(LeadNotification.CHANNEL_TELEGRAM)
+    return channels
+
+
+def enqueue(lead: TrialLesson, channels: Optional[Iterable[str]] = None) -> None:
+    """Додає нотифікації для заявки в outbox одним INSERT (повторний виклик - no-op)."""
+    enqueue_many([lead], channels)
+
+
+def enqueue_many(leads: Iterable[TrialLesson], channels: Optional[Iterable[str]] = None) -> None:
+    """Нотифікації для кількох заявок одним INSERT."""
+    channels = list(channels or enabled_channels())
+    LeadNotification.objects.bulk_create(
+        [LeadNotification(lead=lead, channel=channel) for lead in leads for channel in channels],
+        ignore_conflicts=True,
+    )
+
+
+def lead_message(lead: TrialLesson) -> str:
+    lines = [
+        'Нова заявка на пробний урок',
+        f"Ім'я: {lead.name or '-'}",
+        f'Телефон: {lead.phone}',
+    ]
+    if lead.utm_source or lead.utm_campaign:
+        lines.append(f'Джерело: {lead.utm_source or "-"} / {lead.utm_campaign or "-"}')
+    lines.append(f'Дата: {timezone.localtime(lead.created_at):%d.%m.%Y %H:%M}')
+    return '\n'.join(lines)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Експоненційна затримка: 30с, 1хв, 2хв, ... але не більше години."""
+    return timedelta(seconds=min(30 * 2 ** max(attempts - 1, 0), 3600))
+
+
+@dataclass
+class DeliveryStats:
+    """Статистика одного проходу воркера."""
+    claimed: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+class EmailChannel:
+    """Email адміністраторам (LEAD_NOTIFICATION_EMAILS) через одне SMTP з'єднання на пачку."""
+
+    def deliver(self, notifications: List[LeadNotification]) -> Dict[int, str]:
+        """Повертає {id нотифікації: помилка} для невдалих."""
+        recipients = list(getattr(settings, 'LEAD_NOTIFICATION_EMAILS', []))
+        if not recipients:
+            # Як і раніше: без адресатів заявка лише логується
+            for notification in notifications:
+                logger.info('[LeadNotification] New lead: %s - %s. Email skipped (no recipients).',
+                            notification.lead.name, notification.lead.phone)
+            return {}
+
+        errors = {}
+        with get_connection() as connection:
+            for notification in notifications:
+                message = EmailMessage(
+                    subject=f'Нова заявка: {notification.lead.phone}',
+                    body=lead_message(notification.lead),
+                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    to=recipients,
+                    connection=connection,
+                )
+                try:
+                    message.send()
+                except Exception as e:
+                    errors[notification.pk] = str(e)
+        return errors
+
+
+class TelegramChannel:
+    """Повідомлення в TELEGRAM_CHAT_ID через Bot API (спільний Session на пачку)."""
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+
+    def deliver(self, notifications: List[LeadNotification]) -> Dict[int, str]:
+        url = TELEGRAM_API_URL.format(token=settings.TELEGRAM_BOT_TOKEN)
+        errors = {}
+        with requests.Session() as session:
+            for notification in notifications:
+                try:
+                    response = session.post(url, json={
+                        'chat_id': settings.TELEGRAM_CHAT_ID,
+                        'text': lead_message(notification.lead),
+                    }, timeout=self.timeout)
+                    response.raise_for_status()
+                except requests.RequestException as e:
+                    errors[notification.pk] = str(e)
+        return errors
+
+
+class NotificationWorker:
+    """
+    Доставка нотифікацій з outbox пачками.
+
+    Використання:
+        stats = NotificationWorker().run_once()
+    """
+
+    def __init__(self, batch_size: Optional[int] = None, channels: Optional[dict] = None):
+        self.batch_size = batch_size or getattr(settings, 'LEAD_NOTIFICATION_BATCH_SIZE', 50)
+        self.max_attempts = getattr(settings, 'LEAD_NOTIFICATION_MAX_ATTEMPTS', 5)
+        self.lease = timedelta(seconds=getattr(settings, 'LEAD_NOTIFICATION_LEASE', 120))
+        self.channels = channels or {
+            LeadNotification.CHANNEL_EMAIL: EmailChannel(),
+            LeadNotification.CHANNEL_TELEGRAM: TelegramChannel(),
+        }
+
+    def claim(self) -> List[LeadNotification]:
+        """Забирає пачку готових нотифікацій і продовжує їм available_at на час оренди."""
+        now = timezone.now()
+        with transaction.atomic():
+            notifications = list(
+                LeadNotification.objects
+                .select_for_update(skip_locked=True, of=('self',))
+                .select_related('lead')
+                .filter(status=LeadNotification.STATUS_PENDING, available_at__lte=now)
+                .order_by('available_at')[:self.batch_size]
+            )
+            if notifications:
+                LeadNotification.objects.filter(pk__in=[n.pk for n in notifications]).update(
+                    available_at=now + self.lease,
+                )
+        return notifications
+
+    def run_once(self) -> DeliveryStats:
+        notifications = self.claim()
+        stats = DeliveryStats(claimed=len(notifications))
+
+        by_channel: Dict[str, List[LeadNotification]] = {}
+        for notification in notifications:
+            by_channel.setdefault(notification.channel, []).append(notification)
+
+        for channel, batch in by_channel.items():
+            handler = self.channels.get(channel)
+            if handler is None:
+                errors = {n.pk: f'Unknown channel {channel!r}' for n in batch}
+            else:
+                try:
+                    errors = handler.deliver(batch)
+                except Exception as e:
+                    logger.error('[LeadNotification] %s delivery failed: %s', channel, e, exc_info=True)
+                    errors = {n.pk: str(e) for n in batch}
+            self._record(channel, batch, errors, stats)
+        return stats
+
+    def _record(self, channel: str, batch: List[LeadNotification], errors: Dict[int, str], stats: DeliveryStats):
+        now = timezone.now()
+        sent = [n for n in batch if n.pk not in errors]
+        if sent:
+            LeadNotification.objects.filter(pk__in=[n.pk for n in sent]).update(
+                status=LeadNotification.STATUS_SENT, sent_at=now, last_error='',
+            )
+            flag = LEAD_FLAGS.get(channel)
+            if flag:
+                TrialLesson.objects.filter(pk__in=[n.lead_id for n in sent]).update(**{flag: True, 'notified_at': now})
+            stats.sent += len(sent)
+
+        for notification in batch:
+            error = errors.get(notification.pk)
+            if error is None:
+                continue
+            attempts = notification.attempts + 1
+            update = {'attempts': attempts, 'last_error': error[:1000]}
+            if attempts >= self.max_attempts:
+                update['status'] = LeadNotification.STATUS_FAILED
+                stats.failed += 1
+                logger.error('[LeadNotification] %s for lead %s failed after %s attempts: %s',
+                             channel, notification.lead_id, attempts, error)
+            else:
+                update['available_at'] = now + retry_delay(attempts)
+                stats.retried += 1
+                logger.warning('[LeadNotification] %s for lead %s failed (attempt %s): %s',
+                               channel, notification.lead_id, attempts, error)
+            LeadNotification.objects.filter(pk=notification.pk).update(**update)
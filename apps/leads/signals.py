@@ -0,0 +1,19 @@
+"""
+Сигнали leads app: денні підсумки заявок (apps.leads.analytics).
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.core.models import ConsultationRequest as CoreConsultationRequest
+
+from . import analytics
+from .models import ConsultationRequest, TrialLesson
+
+
+@receiver(post_save, sender=TrialLesson)
+@receiver(post_save, sender=CoreConsultationRequest)
+@receiver(post_save, sender=ConsultationRequest)
+def record_lead_stats(sender, instance, created, raw=False, **kwargs):
+    """Нова заявка -> +1 у LeadDailyStat (bulk_ingest викликає analytics.record сам)."""
+    if created and not raw:
+        analytics.record([instance])
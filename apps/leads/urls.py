@@ -5,6 +5,7 @@ app_name = 'leads'
 
 urlpatterns = [
     path('api/trial-form/', views.submit_trial_form, name='submit_trial_form'),
+    path('api/analytics/', views.lead_analytics, name='lead_analytics'),
 ]
 
 
@@ -1,12 +1,49 @@
 
+import re
+
 from django import forms
 
+INVALID_PHONE_MESSAGE = "Введіть коректний український номер телефону"
+INVALID_PHONE_AFTER_CODE_MESSAGE = "Введіть коректний український номер телефону (9 цифр після +380)"
+
+# Роздільники, які ігноруються в номері: пробіл, дужки, дефіс
+PHONE_SEPARATORS = ' ()-'
+# Номер починається з +380 (роздільники між символами дозволені)
+_PLUS_380 = re.compile(r'[ ()\-]*\+[ ()\-]*3[ ()\-]*8[ ()\-]*0')
+# Кількість цифр -> префікс, який замінюється на +380
+# (380XXXXXXXXX, 38XXXXXXXXX, 0XXXXXXXXX, XXXXXXXXX)
+LOCAL_PREFIXES = {12: '380', 11: '38', 10: '0', 9: ''}
+# Видалення всіх не-цифр ASCII рядка одним str.translate
+_ASCII_NON_DIGITS = str.maketrans('', '', ''.join(chr(code) for code in range(128) if not chr(code).isdigit()))
+
+
+def _normalize(phone):
+    """
+    Один прохід нормалізації: (номер +380XXXXXXXXX, None) або (None, помилка).
+    phone - непорожній рядок без пробілів по краях.
+    """
+    if phone.isascii():
+        digits = phone.translate(_ASCII_NON_DIGITS)
+    else:
+        # str.isdigit також приймає не-ASCII цифри - як і раніше
+        digits = ''.join(filter(str.isdigit, phone))
+
+    if _PLUS_380.match(phone):
+        # +380XXXXXXXXX - після 380 мають бути рівно 9 цифр
+        if len(digits) == 12:
+            return '+380' + digits[3:], None
+        return None, INVALID_PHONE_AFTER_CODE_MESSAGE
+    prefix = LOCAL_PREFIXES.get(len(digits))
+    if prefix is not None and digits.startswith(prefix):
+        return '+380' + digits[len(prefix):], None
+    return None, INVALID_PHONE_MESSAGE
+
 
 def normalize_phone_number(phone):
     """
     Нормалізувати український номер телефону до формату +380XXXXXXXXX.
 
-    Підтримує формати:
+    Підтримує формати (пробіли, дужки та дефіси ігноруються):
     - +380XXXXXXXXX (13 символів: +380 + 9 цифр)
     - 380XXXXXXXXX (12 цифр)
     - 38XXXXXXXXX (11 цифр)
@@ -23,51 +60,41 @@ def normalize_phone_number(phone):
     if not phone:
         return phone
 
-    # Видалити всі пробіли, дужки, дефіси та інші символи (крім +)
-    phone_clean = phone.replace(' ', '').replace('(', '').replace(')', '').replace('-', '')
-
-    # Перевірити чи є + на початку
-    has_plus = phone_clean.startswith('+')
-
-    # Витягти тільки цифри
-    digits = ''.join(filter(str.isdigit, phone_clean))
-
-    # Якщо немає цифр - помилка
-    if not digits:
-        raise forms.ValidationError("Введіть коректний український номер телефону")
-
-    # Нормалізація до формату +380XXXXXXXXX (13 символів: +380 + 9 цифр)
-    if has_plus and phone_clean.startswith('+380'):
-        # +380XXXXXXXXX - вже має правильний префікс, потрібно витягти 9 цифр після 380
-        if len(digits) >= 3:
-            # Витягнути цифри після 380 (останні 9 цифр)
-            phone_digits = digits[3:] if len(digits) > 3 else digits
-            if len(phone_digits) == 9:
-                phone = '+380' + phone_digits
-            else:
-                raise forms.ValidationError("Введіть коректний український номер телефону (9 цифр після +380)")
-        else:
-            raise forms.ValidationError("Введіть коректний український номер телефону")
-    elif len(digits) == 12 and digits.startswith('380'):
-        # 380XXXXXXXXX -> +380XXXXXXXXX (видаляємо 380, додаємо +380)
-        phone = '+380' + digits[3:]
-    elif len(digits) == 11 and digits.startswith('38'):
-        # 38XXXXXXXXX -> +380XXXXXXXXX (видаляємо 38, додаємо +380)
-        phone = '+380' + digits[2:]
-    elif len(digits) == 10 and digits.startswith('0'):
-        # 0XXXXXXXXX -> +380XXXXXXXXX (видаляємо 0, додаємо +380)
-        phone = '+380' + digits[1:]
-    elif len(digits) == 9:
-        # XXXXXXXXX (9 цифр без префіксу) -> +380XXXXXXXXX
-        phone = '+380' + digits
-    else:
-        raise forms.ValidationError("Введіть коректний український номер телефону")
+    normalized, error = _normalize(phone)
+    if error:
+        raise forms.ValidationError(error)
+    return normalized
 
-    # Фінальна перевірка формату (модель очікує ^\+380\d{9}$)
-    if not phone.startswith('+380') or len(phone) != 13:
-        raise forms.ValidationError("Номер має містити 9 цифр після коду +380")
 
-    return phone
+def normalize_many(phones, invalid=''):
+    """
+    Пакетна нормалізація (бекфіл, імпорт заявок): список номерів у форматі
+    +380XXXXXXXXX, некоректні та порожні -> invalid. Без винятків на кожен
+    поганий номер; повтори одного значення нормалізуються один раз.
+    """
+    seen = {}
+    result = []
+    append = result.append
+    missing = object()
+    for phone in phones:
+        normalized = seen.get(phone, missing)
+        if normalized is missing:
+            value = phone.strip() if phone else ''
+            normalized = (_normalize(value)[0] if value else None) or invalid
+            seen[phone] = normalized
+        append(normalized)
+    return result
+
+
+def phone_key(phone):
+    """
+    Ключ для пошуку дублікатів заявок: номер у форматі +380XXXXXXXXX
+    або '' якщо номер не вдається нормалізувати.
+    """
+    phone = phone.strip() if phone else ''
+    if not phone:
+        return ''
+    return _normalize(phone)[0] or ''
 
 
 def get_client_ip(request):
@@ -78,28 +105,3 @@ def get_client_ip(request):
     else:
         ip = request.META.get('REMOTE_ADDR')
     return ip
-
-
-def send_trial_confirmation_email(lead, request):
-    """
-    Відправка підтвердження на email.
-
-    Примітка: Наразі не відправляємо email, оскільки в моделі немає поля email.
-    Функція залишена для майбутнього використання, коли додадуть email поле.
-    Можна також відправляти email адміністратору з інформацією про нову заявку.
-    """
-    # TODO: Додати поле email в модель TrialLesson або відправляти адміністратору
-    # Наразі просто логуємо, що заявка створена
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.info(f'[TrialForm] New lead created: {lead.name} - {lead.phone}. Email notification skipped (no email field).')
-
-    # Позначаємо, що "email відправлено" (насправді просто заявка оброблена)
-    lead.email_sent = True
-    lead.save(update_fields=['email_sent'])
-    return True
-
-
-
-
-
@@ -1,11 +1,14 @@
 import logging
+from django.contrib.admin.views.decorators import staff_member_required
 from django.http import JsonResponse
 from django.urls import reverse
-from django.core.exceptions import ValidationError
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_protect
+from . import analytics
 from .forms import TrialLessonForm
-from .utils import send_trial_confirmation_email, get_client_ip
+from .ingestion import ingest
+from .notifications import enqueue as enqueue_notifications
+from .utils import get_client_ip
 
 logger = logging.getLogger(__name__)
 
@@ -48,74 +51,42 @@ def submit_trial_form(request):
             'errors': {'__all__': ['Помилка обробки форми. Спробуйте ще раз.']}
         }, status=400)
 
-    if form.is_valid():
-        logger.info('[TrialForm] Form is valid, processing...')
-        try:
-            lead = form.save(commit=False)
-
-            # UTM та реклама:
-            lead.utm_source = request.POST.get('utm_source', '')
-            lead.utm_medium = request.POST.get('utm_medium', '')
-            lead.utm_campaign = request.POST.get('utm_campaign', '')
-            lead.utm_content = request.POST.get('utm_content', '')
-            lead.utm_term = request.POST.get('utm_term', '')
-            lead.fbclid = request.POST.get('fbclid', '')
-            lead.gclid = request.POST.get('gclid', '')
-            lead.referrer = request.META.get('HTTP_REFERER', '')
-            lead.ip_address = get_client_ip(request)
-
-            # КРИТИЧНО: Обробка ValidationError при збереженні
-            try:
-                lead.save()
-                logger.info('[TrialForm] Lead saved successfully: %s - %s', lead.name, lead.phone)
-            except ValidationError as e:
-                # ValidationError від model validators
-                logger.warning('[TrialForm] Validation error on save: %s', e)
-
-                # Конвертуємо ValidationError в form errors
-                errors = {}
-                if hasattr(e, 'error_dict'):
-                    for field, field_errors in e.error_dict.items():
-                        errors[field] = [str(err) for err in field_errors]
-                else:
-                    errors['__all__'] = [str(e)]
-
-                return JsonResponse({
-                    'success': False,
-                    'errors': errors
-                }, status=400)
-
-            # Відправити email (не критично, якщо не вдасться):
-            try:
-                send_trial_confirmation_email(lead, request)
-                logger.info('[TrialForm] Email sent successfully')
-            except Exception as email_error:
-                logger.error('[TrialForm] Email sending failed: %s', email_error, exc_info=True)
-                # Не блокуємо успішну відправку форми
+    try:
+        # Валідація, атрибуція та запис (разом з outbox нотифікацій) - apps.leads.ingestion
+        result = ingest(form, request, on_saved=enqueue_notifications)
+    except Exception as e:
+        # Несподівані помилки (не ValidationError)
+        logger.error('[TrialForm] Unexpected error during processing: %s', e, exc_info=True)
+        return JsonResponse({
+            'success': False,
+            'errors': {'__all__': ['Помилка сервера. Спробуйте ще раз.']}
+        }, status=500)
 
-            logger.info('[TrialForm] Request processed successfully')
-            redirect_url = reverse('core:thank_you')
-            return JsonResponse({
-                'success': True,
-                'redirect_url': redirect_url,
-                'lead_id': lead.id,
-                'message': 'Дякуємо! Перенаправляємо вас.'
-            })
-        except Exception as e:
-            # Інші несподівані помилки (не ValidationError)
-            logger.error('[TrialForm] Unexpected error during processing: %s', e, exc_info=True)
-            return JsonResponse({
-                'success': False,
-                'errors': {'__all__': ['Помилка сервера. Спробуйте ще раз.']}
-            }, status=500)
-    else:
+    if not result.ok:
         logger.warning('[TrialForm] Form validation failed: %s', form.errors)
-        return JsonResponse({
+        response = JsonResponse({
             'success': False,
             'errors': form.errors
         }, status=400)
+    else:
+        lead = result.instance
+        logger.info('[TrialForm] Lead saved successfully: %s - %s', lead.name, lead.phone)
+        response = JsonResponse({
+            'success': True,
+            'redirect_url': reverse('core:thank_you'),
+            'lead_id': lead.id,
+            'message': 'Дякуємо! Перенаправляємо вас.'
+        })
+    response['Server-Timing'] = result.server_timing()
+    return response
 
 
-
-
-
+@require_http_methods(["GET"])
+@staff_member_required
+def lead_analytics(request):
+    """JSON підсумки заявок за період (?start=&end= або ?days=) з LeadDailyStat"""
+    try:
+        start, end = analytics.parse_period(request.GET)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    return JsonResponse(analytics.report(start, end))
@@ -7,6 +7,9 @@ set -e  # Exit on error
 echo "Installing Python dependencies..."
 pip install -r requirements.txt
 
+echo "Building image derivatives..."
+python manage.py build_image_derivatives --static-only
+
 echo "Collecting static files..."
 python manage.py collectstatic --noinput
 
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""
+Мікро-бенчмарк перевірки шляхів у middleware (ціна на один запит).
+
+Порівнює попередню перевірку WordPressBlockMiddleware (any(path.startswith(p))
+по 17 префіксах + /wp-*.php) зі скомпільованими PathRules (один re.match)
+та lookup у redirect_index (NewsRedirectMiddleware) на типових шляхах:
+звичайні сторінки (промах - найчастіший випадок) та WordPress сканери.
+
+Використання:
+    python scripts/benchmark_path_rules.py
+    python scripts/benchmark_path_rules.py --number 200000
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import django
+
+# Налаштування Django
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'SpeakUp.settings.develop')
+django.setup()
+
+from apps.core.path_rules import WORDPRESS_PATHS, PathRules
+from apps.core.redirect_index import RedirectIndex
+
+PAGES = [
+    '/', '/about/', '/programs/', '/programs/ielts/', '/news/', '/news/some-article-slug/',
+    '/ru/programs/kids/', '/contacts/', '/static/css/styles.css', '/sitemap.xml',
+]
+SCANNERS = ['/wp-admin/', '/wp-login.php', '/xmlrpc.php', '/wp-content/plugins/x/y.php', '/wp-foo.php']
+
+
+class StaticRedirectIndex(RedirectIndex):
+    """Індекс лише зі статичних REDIRECTS (без БД)."""
+
+    def _add_news_redirects(self, table):
+        pass
+
+
+def legacy_blocked(path):
+    if any(path.startswith(wp_path) for wp_path in WORDPRESS_PATHS):
+        return True
+    return path.startswith('/wp-') and path.endswith('.php')
+
+
+def per_call_ns(func, paths, number):
+    def run():
+        for path in paths:
+            func(path)
+    # Найкращий з 5 повторів
+    best = min(timeit.repeat(run, number=number, repeat=5))
+    return best / (number * len(paths)) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=50000, help='Кількість проходів по набору шляхів')
+    args = parser.parse_args()
+
+    rules = PathRules.from_settings()
+    index = StaticRedirectIndex(ttl=3600)
+
+    for name, paths in (('сторінки (промах)', PAGES), ('WordPress сканери', SCANNERS)):
+        print(f'{name}: {len(paths)} шляхів')
+        legacy = per_call_ns(legacy_blocked, paths, args.number)
+        compiled = per_call_ns(rules.match, paths, args.number)
+        redirect = per_call_ns(index.lookup, paths, args.number)
+        print(f'  any(startswith) + /wp-*.php: {legacy:7.0f} ns')
+        print(f'  PathRules.match:             {compiled:7.0f} ns  (x{legacy / compiled:.1f})')
+        print(f'  redirect_index.lookup:       {redirect:7.0f} ns')
+
+
+if __name__ == '__main__':
+    main()
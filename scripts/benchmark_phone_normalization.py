@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""
+Мікро-бенчмарк нормалізації телефонів (apps.leads.utils).
+
+Порівнює попередню реалізацію normalize_phone_number (кілька str.replace,
+filter(str.isdigit), розгалуження) з поточною (str.translate + один
+скомпільований regex) та пакетну normalize_many. Перед вимірюванням
+перевіряє, що на згенерованому наборі обидві реалізації приймають і
+відхиляють ті самі номери з тими самими результатами та помилками.
+
+Використання:
+    python scripts/benchmark_phone_normalization.py
+    python scripts/benchmark_phone_normalization.py --size 1000000 --unique 0.3
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import django
+
+# Налаштування Django
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'SpeakUp.settings.develop')
+django.setup()
+
+from apps.core.tests.test_phone_normalization import legacy_normalize_phone_number, outcome, random_phone
+from apps.leads.utils import normalize_many, normalize_phone_number
+
+
+def per_call_ns(func, phones):
+    def run():
+        for phone in phones:
+            try:
+                func(phone)
+            except Exception:
+                pass
+    best = min(timed(run) for _ in range(3))
+    return best / len(phones) * 1e9
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=200000, help='Кількість номерів у наборі')
+    parser.add_argument('--unique', type=float, default=1.0, help='Частка унікальних номерів (повтори в імпорті)')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    unique = [random_phone(rng) for _ in range(max(1, int(args.size * args.unique)))]
+    phones = [rng.choice(unique) for _ in range(args.size)] if args.unique < 1 else unique
+
+    mismatches = [phone for phone in unique if outcome(normalize_phone_number, phone) != outcome(legacy_normalize_phone_number, phone)]
+    if mismatches:
+        print(f'Розбіжності з попередньою реалізацією: {len(mismatches)}, напр. {mismatches[:5]!r}')
+        sys.exit(1)
+    accepted = sum(outcome(normalize_phone_number, phone)[0] == 'ok' for phone in unique)
+    print(f'{len(phones)} номерів ({len(unique)} унікальних, прийнято {accepted}): поведінка збігається')
+
+    legacy = per_call_ns(legacy_normalize_phone_number, phones)
+    current = per_call_ns(normalize_phone_number, phones)
+    batch = min(timed(lambda: normalize_many(phones)) for _ in range(3)) / len(phones) * 1e9
+    print(f'  попередня normalize_phone_number: {legacy:7.0f} ns')
+    print(f'  normalize_phone_number:           {current:7.0f} ns  (x{legacy / current:.1f})')
+    print(f'  normalize_many:                   {batch:7.0f} ns  (x{legacy / batch:.1f})')
+
+
+if __name__ == '__main__':
+    main()
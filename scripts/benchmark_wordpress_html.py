@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+"""
+Бенчмарк очищення WordPress HTML та переписування URL зображень.
+
+Порівнює попередню реалізацію (clean_wordpress_html + update_html_image_urls:
+два окремі розбори HTML і перебір усього mapping для кожного <img>) з
+sanitize_wordpress_html (один розбір + ImageUrlIndex) на статтях з бази
+(content_uk + content_ru, як при імпорті).
+
+Використання:
+    python scripts/benchmark_wordpress_html.py
+    python scripts/benchmark_wordpress_html.py --repeat 5
+    python scripts/benchmark_wordpress_html.py --synthetic 200   # без статей у базі
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+import django
+
+# Налаштування Django
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'SpeakUp.settings.develop')
+django.setup()
+
+from bs4 import BeautifulSoup
+
+from apps.core.models import NewsArticle
+from apps.core.utils.wordpress import (
+    HTML_PARSER,
+    ImageUrlIndex,
+    extract_images_from_html,
+    sanitize_wordpress_html,
+)
+
+OLD_SITE = 'https://speak-up.com.ua'
+
+
+# ---- Попередня реалізація (для порівняння) ----
+
+def legacy_clean_wordpress_html(html_content):
+    soup = BeautifulSoup(html_content, 'html.parser')
+    wordpress_classes = [
+        'wp-image-', 'aligncenter', 'alignleft', 'alignright',
+        'size-full', 'size-medium', 'size-large', 'size-thumbnail',
+        'wp-block-', 'has-', 'is-'
+    ]
+    for element in soup.find_all(True):
+        if element.get('class'):
+            cleaned = [c for c in element.get('class', []) if not any(w in c for w in wordpress_classes)]
+            if cleaned:
+                element['class'] = cleaned
+            else:
+                del element['class']
+        if element.get('style'):
+            style = re.sub(r'font-weight:\s*400;?\s*', '', element.get('style', ''))
+            style = re.sub(r'font-weight:\s*normal;?\s*', '', style)
+            if style.strip():
+                element['style'] = style.strip()
+            else:
+                del element['style']
+    return str(soup)
+
+
+def legacy_update_html_image_urls(html_content, image_mapping):  # noqa: C901
+    if not html_content or not image_mapping:
+        return html_content
+    soup = BeautifulSoup(html_content, 'html.parser')
+    for img in soup.find_all('img'):
+        old_src = img.get('src', '')
+        new_src = None
+        for old_url, new_url in image_mapping.items():
+            if old_src == old_url:
+                new_src = new_url
+                break
+            if old_src.replace('.webp', '') == old_url.replace('.webp', ''):
+                new_src = new_url
+                break
+            if old_url in old_src or old_src.split('?')[0] == old_url.split('?')[0]:
+                new_src = new_url
+                break
+        if new_src:
+            img['src'] = new_src
+            if img.get('srcset'):
+                srcset = img.get('srcset', '')
+                for old_url, new_url in image_mapping.items():
+                    srcset = srcset.replace(old_url, new_url)
+                    srcset = srcset.replace(old_url.replace('.webp', ''), new_url)
+                    srcset = srcset.replace(old_url + '.webp', new_url)
+                img['srcset'] = srcset
+    html_str = str(soup)
+    for old_url, new_url in image_mapping.items():
+        html_str = html_str.replace(old_url, new_url)
+        html_str = html_str.replace(old_url.replace('.webp', ''), new_url)
+        html_str = html_str.replace(old_url + '.webp', new_url)
+    return html_str
+
+
+def legacy_mapping(images):
+    """Mapping як у старому scripts/import_news.py: оригінал, webp та варіант без розміру."""
+    mapping = {}
+    for image in images:
+        new_url = '/media/news/images/' + image['original_src'].rsplit('/', 1)[-1]
+        mapping[image['original_src']] = new_url
+        mapping[image['src']] = new_url
+        for variant in (image['original_src'], image['src']):
+            if re.search(r'(\d+)x(\d+)', variant):
+                mapping[re.sub(r'-\d+x\d+', '', variant)] = new_url
+    return mapping
+
+
+# ---- Корпус ----
+
+def synthetic_corpus(count):
+    """Статті у форматі WordPress: абзаци з inline style та 12 зображень з srcset."""
+    articles = []
+    for n in range(count):
+        parts = []
+        for i in range(12):
+            src = f'{OLD_SITE}/wp-content/uploads/2021/{n:03d}/image-{i}'
+            parts.append(
+                f'<p style="font-weight: 400;"><span class="has-inline-color">Абзац {i} статті {n}.</span> '
+                + 'Текст статті про вивчення англійської мови. ' * 8 + '</p>'
+                f'<figure class="wp-block-image size-large"><img class="wp-image-{i} aligncenter" '
+                f'src="{src}-1024x683.jpg.webp" srcset="{src}-300x200.jpg 300w, {src}-1024x683.jpg 1024w" '
+                f'sizes="(max-width: 1024px) 100vw, 1024px"></figure>'
+            )
+        html = '<div class="entry-content">' + ''.join(parts) + '</div>'
+        articles.append((html, html))
+    return articles
+
+
+def database_corpus():
+    return list(NewsArticle.objects.values_list('content_uk', 'content_ru'))
+
+
+def run_legacy(corpus):
+    for content_uk, content_ru in corpus:
+        mapping = legacy_mapping(extract_images_from_html(content_uk, OLD_SITE))
+        legacy_update_html_image_urls(legacy_clean_wordpress_html(content_uk), mapping)
+        if content_ru:
+            legacy_update_html_image_urls(legacy_clean_wordpress_html(content_ru), mapping)
+
+
+def run_single_pass(corpus):
+    for content_uk, content_ru in corpus:
+        index = ImageUrlIndex()
+        for image in extract_images_from_html(content_uk, OLD_SITE):
+            index.add(image['original_src'], '/media/news/images/' + image['original_src'].rsplit('/', 1)[-1])
+        sanitize_wordpress_html(content_uk, index)
+        if content_ru:
+            sanitize_wordpress_html(content_ru, index)
+
+
+def measure(func, corpus, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(corpus)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3, help='Кількість повторів (береться найкращий)')
+    parser.add_argument('--synthetic', type=int, default=0, help='Згенерувати N статей замість бази')
+    args = parser.parse_args()
+
+    corpus = synthetic_corpus(args.synthetic) if args.synthetic else database_corpus()
+    if not corpus:
+        print('У базі немає статей. Запустіть імпорт або використайте --synthetic 200')
+        return
+    size = sum(len(uk) + len(ru or '') for uk, ru in corpus)
+    images = sum(uk.count('<img') + (ru or '').count('<img') for uk, ru in corpus)
+    print(f'Корпус: {len(corpus)} статей, {size / 1024:.0f} KB HTML, {images} <img>; парсер: {HTML_PARSER}')
+
+    legacy = measure(run_legacy, corpus, args.repeat)
+    single = measure(run_single_pass, corpus, args.repeat)
+    print(f'clean + update (попередня):   {legacy * 1000:8.1f} ms')
+    print(f'sanitize_wordpress_html:      {single * 1000:8.1f} ms')
+    print(f'Прискорення: x{legacy / single:.2f}')
+
+
+if __name__ == '__main__':
+    main()